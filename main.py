@@ -7,88 +7,255 @@ video URL'lerini metne çevirir.
 """
 
 import argparse
+import atexit
+import bisect
+import difflib
+import glob
+import hashlib
+import importlib.util
+import io
+import json
+import math
 import os
+import queue
+import random
 import re
+import shutil
+import signal
+import socket
+import sqlite3
+import subprocess
 import sys
 import tempfile
+import threading
 import time
+import types
+import wave
+from abc import ABC, abstractmethod
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 
-# Python 3.13+ için audioop workaround
-try:
-    import audioop
-except ImportError:
-    # audioop modülü Python 3.13'te kaldırıldı
-    # pydub için mock modül oluştur
-    import types
-    
-    def _audioop_passthrough(fragment, width):
-        """Basit passthrough fonksiyonu - veriyi olduğu gibi döndürür"""
-        return fragment
-    
-    def _audioop_mul(fragment, width, factor):
-        """Ses seviyesini çarpar - basit implementasyon"""
-        return fragment
-    
-    def _audioop_add(fragment1, fragment2, width):
-        """İki ses parçasını toplar - basit implementasyon"""
-        return fragment1
-    
-    def _audioop_tomono(fragment, width, lfactor, rfactor):
-        """Stereo'dan mono'ya dönüştürür"""
-        return fragment
-    
-    def _audioop_tostereo(fragment, width, lfactor, rfactor):
-        """Mono'dan stereo'ya dönüştürür"""
-        return fragment + fragment
-    
-    def _audioop_bias(fragment, width, bias):
-        """Bias ekler"""
-        return fragment
-    
-    def _audioop_reverse(fragment, width):
-        """Ses parçasını ters çevirir"""
-        return fragment[::-1]
-    
-    def _audioop_byteswap(fragment, width):
-        """Byte sırasını değiştirir"""
-        return fragment
-    
-    def _audioop_lin2lin(fragment, width, newwidth):
-        """Farklı genişlikler arasında dönüştürür"""
-        return fragment
-    
-    def _audioop_ratecv(fragment, width, nchannels, inrate, outrate, state, weightA, weightB):
-        """Örnekleme hızını değiştirir"""
-        return fragment, state
-    
-    def _audioop_lin2ulaw(fragment, width):
-        """Linear'dan u-law'a dönüştürür"""
-        return fragment
-    
-    def _audioop_ulaw2lin(fragment, width):
-        """u-law'dan linear'a dönüştürür"""
-        return fragment
+# main.py'nin yüklenmeye başladığı an; komut satırında aşama zamanları (ve ilk
+# parçanın yüklemeye başladığı an) buna göre verilir, böylece başlangıç süresi de görünür
+STARTUP_TIME = time.perf_counter()
+
+# Python 3.13+ için audioop workaround: audioop modülü kaldırıldığından pydub'ın
+# kullandığı fonksiyonlar NumPy ile yeniden yazılır (install_audioop_shim).
+# Sonuçlar CPython'un audioop modülüyle bire bir aynıdır: 1 byte'lık örnekler
+# işaretlidir, taşmalar sınırda kesilir (bias hariç), 3 byte'lık örnekler little-endian'dır.
+_AUDIOOP_DTYPES = {1: 'i1', 2: 'i2', 4: 'i4'}
+
+
+class _AudioopError(Exception):
+    """audioop.error karşılığı."""
+
+
+def _audioop_samples(fragment, width: int) -> "np.ndarray":
+    """
+    Ham PCM verisini işaretli örnek dizisine çevirir. 1, 2 ve 4 byte'lık örnekler
+    kopyalanmadan okunur (int8/int16/int32); taşabilecek işlemler önce int64'e çevirir.
+    """
+    if width not in (1, 2, 3, 4):
+        raise _AudioopError("Size should be 1, 2, 3 or 4")
+    if len(fragment) % width:
+        raise _AudioopError("not a whole number of frames")
+    if width == 3:
+        raw = np.frombuffer(fragment, dtype=np.uint8).reshape(-1, 3).astype(np.int64)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        return np.where(values & 0x800000, values - 0x1000000, values)
+    return np.frombuffer(fragment, dtype=_AUDIOOP_DTYPES[width]).astype(np.int64)
+
+
+def _audioop_pack(values: "np.ndarray", width: int) -> bytes:
+    """Sınırları içindeki örnek dizisini ham PCM verisine çevirir."""
+    if width == 3:
+        return np.asarray(values, dtype='<i4').view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    return np.asarray(values).astype(_AUDIOOP_DTYPES[width]).tobytes()
+
+
+def _audioop_bound(values: "np.ndarray", width: int) -> "np.ndarray":
+    """Ondalıklı örnekleri yerinde aşağı yuvarlar ve örnek genişliğinin sınırlarına keser."""
+    limit = 1 << (8 * width - 1)
+    np.floor(values, out=values)
+    return np.clip(values, -limit, limit - 1, out=values)
+
+
+def _audioop_mul(fragment, width, factor):
+    """Örnekleri factor ile çarpar (ses seviyesi)."""
+    return _audioop_pack(_audioop_bound(_audioop_samples(fragment, width) * float(factor), width), width)
+
+
+def _audioop_add(fragment1, fragment2, width):
+    """İki ses parçasını örnek örnek toplar."""
+    if len(fragment1) != len(fragment2):
+        raise _AudioopError("Lengths should be the same")
+    total = _audioop_samples(fragment1, width).astype(np.int64) + _audioop_samples(fragment2, width)
+    limit = 1 << (8 * width - 1)
+    return _audioop_pack(np.clip(total, -limit, limit - 1), width)
+
+
+def _audioop_tomono(fragment, width, lfactor, rfactor):
+    """Stereo'dan mono'ya dönüştürür (sol * lfactor + sağ * rfactor)."""
+    samples = _audioop_samples(fragment, width)
+    if len(samples) % 2:
+        raise _AudioopError("not a whole number of frames")
+    mono = samples[0::2] * float(lfactor)
+    mono += samples[1::2] * float(rfactor)
+    return _audioop_pack(_audioop_bound(mono, width), width)
+
+
+def _audioop_tostereo(fragment, width, lfactor, rfactor):
+    """Mono'dan stereo'ya dönüştürür (sol = örnek * lfactor, sağ = örnek * rfactor)."""
+    samples = _audioop_samples(fragment, width)
+    stereo = np.empty(len(samples) * 2, dtype=np.float64)
+    stereo[0::2] = samples * float(lfactor)
+    stereo[1::2] = samples * float(rfactor)
+    return _audioop_pack(_audioop_bound(stereo, width), width)
+
+
+def _audioop_bias(fragment, width, bias):
+    """Her örneğe bias ekler; taşmalar sarmalanır (8-bit WAV işaretsiz/işaretli dönüşümü)."""
+    bits = 8 * width
+    values = np.mod(_audioop_samples(fragment, width).astype(np.int64) + int(bias), 1 << bits)
+    values = np.where(values >= 1 << (bits - 1), values - (1 << bits), values)
+    return _audioop_pack(values, width)
+
+
+def _audioop_reverse(fragment, width):
+    """Örneklerin sırasını ters çevirir."""
+    return _audioop_pack(_audioop_samples(fragment, width)[::-1], width)
+
+
+def _audioop_byteswap(fragment, width):
+    """Her örneğin byte sırasını ters çevirir."""
+    _audioop_samples(fragment, width)
+    return np.frombuffer(fragment, dtype=np.uint8).reshape(-1, width)[:, ::-1].tobytes()
+
+
+def _audioop_lin2lin(fragment, width, newwidth):
+    """Örnek genişliğini değiştirir (ör. 16-bit'ten 32-bit'e); değerler kaydırılarak ölçeklenir."""
+    if newwidth not in (1, 2, 3, 4):
+        raise _AudioopError("Size should be 1, 2, 3 or 4")
+    samples = _audioop_samples(fragment, width).astype(np.int64)
+    if width == newwidth:
+        return bytes(fragment)
+    return _audioop_pack((samples << (32 - 8 * width)) >> (32 - 8 * newwidth), newwidth)
+
+
+def _audioop_ratecv(fragment, width, nchannels, inrate, outrate, state, weightA=1, weightB=0):
+    """
+    Örnekleme hızını doğrusal aradeğerlemeyle değiştirir (CPython audioop.ratecv
+    ile aynı algoritma ve durum biçimi; parça parça çağrılabilir).
+    Her çıkış örneğinin hangi iki giriş örneği arasına düştüğü kapalı formülle
+    hesaplanır, böylece döngü yalnızca weightB > 0 (alçak geçiren süzgeç) ise gerekir.
+    """
+    if nchannels < 1:
+        raise _AudioopError("# of channels should be >= 1")
+    if weightA < 1 or weightB < 0:
+        raise _AudioopError("weightA should be >= 1, weightB should be >= 0")
+    if inrate <= 0 or outrate <= 0:
+        raise _AudioopError("sampling rate not > 0")
+    if len(fragment) % (width * nchannels):
+        raise _AudioopError("not a whole number of frames")
+    divisor = math.gcd(inrate, outrate)
+    inrate, outrate = inrate // divisor, outrate // divisor
+    divisor = math.gcd(weightA, weightB)
+    weightA, weightB = weightA // divisor, weightB // divisor
     
-    def _audioop_lin2alaw(fragment, width):
-        """Linear'dan A-law'a dönüştürür"""
-        return fragment
+    # Örnekler CPython'daki gibi 32-bit ölçeğinde işlenir
+    shift = 32 - 8 * width
+    frames = _audioop_samples(fragment, width).astype(np.int64).reshape(-1, nchannels) << shift
+    if state is None:
+        d = -outrate
+        prev = np.zeros(nchannels, dtype=np.int64)
+        cur = np.zeros(nchannels, dtype=np.int64)
+    else:
+        d, samples = state
+        if len(samples) != nchannels:
+            raise _AudioopError("illegal state argument")
+        prev = np.array([p for p, _ in samples], dtype=np.int64)
+        cur = np.array([c for _, c in samples], dtype=np.int64)
     
-    def _audioop_alaw2lin(fragment, width):
-        """A-law'dan linear'a dönüştürür"""
-        return fragment
+    if weightB:
+        filtered = np.empty_like(frames)
+        last = cur
+        for i, frame in enumerate(frames):
+            last = np.trunc((weightA * frame + weightB * last.astype(np.float64)) / (weightA + weightB)).astype(np.int64)
+            filtered[i] = last
+        frames = filtered
     
-    def _audioop_lin2adpcm(fragment, width, state):
-        """Linear'dan ADPCM'e dönüştürür"""
-        return fragment, state
+    # history[j] ve history[j + 1]: j giriş karesi okunduktan sonraki önceki/güncel kare.
+    # Çarpımlar 2^53'ün altında kaldığından float64 C'deki double hesabıyla aynı sonucu verir.
+    history = np.concatenate([prev[None], cur[None], frames])
+    last_prev, last_cur = history[len(frames)], history[len(frames) + 1]
+    total = d + len(frames) * outrate
+    count = total // inrate + 1 if total >= 0 else 0
+    offsets = d - np.arange(count, dtype=np.int64) * inrate
+    consumed = np.maximum(0, -(offsets // outrate))
+    weight = (offsets + consumed * outrate).astype(np.float64)
+    out = np.empty((count, nchannels), dtype=np.int64)
+    for channel in range(nchannels):
+        samples = history[:, channel].astype(np.float64)
+        mixed = samples[consumed] * weight
+        mixed += samples[consumed + 1] * (outrate - weight)
+        mixed /= outrate
+        out[:, channel] = np.trunc(mixed, out=mixed)
+    out >>= shift
     
-    def _audioop_adpcm2lin(fragment, width, state):
-        """ADPCM'den linear'a dönüştürür"""
-        return fragment, state
+    new_state = (int(total - count * inrate), tuple((int(p), int(c)) for p, c in zip(last_prev, last_cur)))
+    return _audioop_pack(out.reshape(-1), width), new_state
+
+
+def _audioop_rms(fragment, width):
+    """Örneklerin karesel ortalamasının kökü (RMS)."""
+    samples = _audioop_samples(fragment, width)
+    if len(samples) == 0:
+        return 0
+    samples = samples.astype(np.float64)
+    return int(math.sqrt(float(np.dot(samples, samples)) / len(samples)))
+
+
+def _audioop_max(fragment, width):
+    """En büyük mutlak örnek değeri."""
+    samples = _audioop_samples(fragment, width)
+    if len(samples) == 0:
+        return 0
+    # En küçük değerin mutlak değeri örnek türünde taşar (ör. -32768)
+    return max(-int(samples.min()), int(samples.max()))
+
+
+def _audioop_minmax(fragment, width):
+    """En küçük ve en büyük örnek değeri."""
+    samples = _audioop_samples(fragment, width)
+    if len(samples) == 0:
+        # CPython boş parçada genişlikten bağımsız olarak 32-bit sınırlarını döndürür
+        return (0x7FFFFFFF, -0x80000000)
+    return (int(samples.min()), int(samples.max()))
+
+
+def _audioop_avg(fragment, width):
+    """Örneklerin ortalaması (aşağı yuvarlanmış)."""
+    samples = _audioop_samples(fragment, width)
+    if len(samples) == 0:
+        return 0
+    return int(math.floor(int(samples.sum(dtype=np.int64)) / len(samples)))
+
+
+def install_audioop_shim():
+    """
+    audioop modülü yoksa (Python 3.13+) pydub içe aktarılmadan önce yerine NumPy
+    tabanlı modülü koyar. audioop (veya audioop-lts paketi) varsa o kullanılır.
+    NumPy yüklü değilse fonksiyonlar sessizce yanlış ses üretmek yerine
+    ConfigurationError fırlatır.
+    """
+    if importlib.util.find_spec('audioop') is not None:
+        return
     
-    # Mock modülü oluştur
     audioop = types.ModuleType('audioop')
+    audioop.error = _AudioopError
     audioop.mul = _audioop_mul
     audioop.add = _audioop_add
     audioop.tomono = _audioop_tomono
@@ -98,24 +265,89 @@ except ImportError:
     audioop.byteswap = _audioop_byteswap
     audioop.lin2lin = _audioop_lin2lin
     audioop.ratecv = _audioop_ratecv
-    audioop.lin2ulaw = _audioop_lin2ulaw
-    audioop.ulaw2lin = _audioop_ulaw2lin
-    audioop.lin2alaw = _audioop_lin2alaw
-    audioop.alaw2lin = _audioop_alaw2lin
-    audioop.lin2adpcm = _audioop_lin2adpcm
-    audioop.adpcm2lin = _audioop_adpcm2lin
+    audioop.rms = _audioop_rms
+    audioop.max = _audioop_max
+    audioop.minmax = _audioop_minmax
+    audioop.avg = _audioop_avg
     sys.modules['audioop'] = audioop
 
-try:
-    from openai import OpenAI
-    import pydub
-    from dotenv import load_dotenv
-except ImportError as e:
-    print(f"HATA: Gerekli kütüphane eksik: {e}")
-    print("Lütfen 'pip install -r requirements.txt' komutunu çalıştırın.")
-    sys.exit(1)
 
-# .env dosyasından ortam değişkenlerini yükle
+class LazyModule:
+    """
+    Modülü ilk öznitelik erişiminde içe aktaran vekil.
+    
+    Ağır bağımlılıklar (openai, pydub, yt-dlp, NumPy) main.py yüklenirken değil,
+    onları kullanan kod yoluna ilk girildiğinde yüklenir: --help hiçbirini,
+    yerel dosya işleri yt-dlp'yi yüklemez. İçe aktarma süreleri IMPORT_SECONDS
+    sözlüğüne yazılır. Modül yüklü değilse ConfigurationError fırlatılır.
+    """
+    
+    def __init__(self, name: str, install_hint: str, before_import=None):
+        """
+        Args:
+            name: İçe aktarılacak modül adı
+            install_hint: Modül yüklü değilse hata mesajına eklenecek kurulum ipucu
+            before_import: İçe aktarmadan hemen önce bir kez çağrılacak fonksiyon (opsiyonel)
+        """
+        self._name = name
+        self._install_hint = install_hint
+        self._before_import = before_import
+        self._module = None
+        self._error = None
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """
+        Modülü (henüz yüklenmediyse) içe aktarır ve döndürür.
+        
+        Returns:
+            İçe aktarılan modül
+        """
+        if self._module is None:
+            with self._lock:
+                if self._module is None and self._error is None:
+                    if self._before_import is not None:
+                        self._before_import()
+                    start_time = time.perf_counter()
+                    try:
+                        self._module = importlib.import_module(self._name)
+                    except ImportError as e:
+                        self._error = e
+                    IMPORT_SECONDS[self._name] = time.perf_counter() - start_time
+        if self._module is None:
+            raise ConfigurationError(f"Gerekli kütüphane eksik: {self._error}. {self._install_hint}") from self._error
+        return self._module
+    
+    def is_available(self) -> bool:
+        """Modül içe aktarılabiliyorsa True (gerekirse içe aktarır)."""
+        try:
+            self.load()
+        except ConfigurationError:
+            return False
+        return True
+    
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+# Tembel yüklenen modüllerin içe aktarma süreleri (saniye, --benchmark-startup)
+IMPORT_SECONDS = {}
+
+openai = LazyModule('openai', "Lütfen 'pip install -r requirements.txt' komutunu çalıştırın.")
+pydub = LazyModule('pydub', "Lütfen 'pip install -r requirements.txt' komutunu çalıştırın.",
+                   before_import=install_audioop_shim)
+# asyncio yalnızca --engine async ile kullanılır (içe aktarılması ~50 ms)
+asyncio = LazyModule('asyncio', "")
+# yt-dlp opsiyonel: yalnızca URL girişlerinde yüklenir
+yt_dlp = LazyModule('yt_dlp', "Yüklemek için: pip install yt-dlp")
+# NumPy opsiyonel: sessizlik analizi için gerekli
+np = LazyModule('numpy', "Yüklemek için: pip install numpy")
+# faster-whisper opsiyonel: yalnızca yerel motorda (--backend local) yüklenir
+faster_whisper = LazyModule('faster_whisper', "Yerel motor için: pip install faster-whisper")
+# İşlem havuzu yalnızca yerel motorda kullanılır (multiprocessing içe aktarması)
+futures_process = LazyModule('concurrent.futures.process', "")
+
+
 def load_env_safe():
     """Güvenli bir şekilde .env dosyasını yükler, farklı encoding'leri dener."""
     if not os.path.exists('.env'):
@@ -153,21 +385,202 @@ def load_env_safe():
     # Hiçbir encoding çalışmadıysa
     return False
 
-# Önce standart load_dotenv'i dene
-try:
-    load_dotenv()
-except (UnicodeDecodeError, FileNotFoundError):
-    # Hata durumunda güvenli yükleme fonksiyonunu kullan
-    load_env_safe()
 
-# yt-dlp kütüphanesini opsiyonel olarak yükle
-try:
-    import yt_dlp
-    YT_DLP_AVAILABLE = True
-except ImportError:
-    YT_DLP_AVAILABLE = False
-    print("UYARI: yt-dlp kütüphanesi yüklü değil. URL desteği devre dışı.")
-    print("Yüklemek için: pip install yt-dlp")
+_env_loaded = False
+
+
+def load_environment():
+    """
+    .env dosyasındaki ortam değişkenlerini bir kez yükler (komut satırı ve
+    resolve_api_key çağırır; main.py içe aktarılırken dosya okunmaz).
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    # Önce standart load_dotenv'i dene
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except (ImportError, UnicodeDecodeError, FileNotFoundError):
+        # Hata durumunda (veya python-dotenv yoksa) güvenli yükleme fonksiyonunu kullan
+        load_env_safe()
+
+
+# OpenAI API'nin doğrudan kabul ettiği dosya uzantıları
+WHISPER_UPLOAD_EXTENSIONS = ['.flac', '.m4a', '.mp3', '.mp4', '.mpeg', '.mpga', '.oga', '.ogg', '.wav', '.webm']
+
+# URL'lerden indirilecek ses biçimi (yt-dlp format seçicisi).
+# native: platformun ses akışı olduğu gibi kaydedilir (m4a tercih edilir, yoksa webm/opus);
+# mp3: aynı akış indirildikten sonra 192 kbps MP3'e dönüştürülür (eski davranış).
+DOWNLOAD_FORMATS = {
+    'native': 'bestaudio[ext=m4a]/bestaudio/best',
+    'mp3': 'bestaudio/best',
+}
+
+# URL indirmeleri ve iş çalışma alanları için oluşturulan özel geçici dizinlerin ön ekleri
+DOWNLOAD_DIR_PREFIX = "botyum_download_"
+WORKSPACE_DIR_PREFIX = "botyum_job_"
+
+# Komut satırından kabul edilen giriş dosyası uzantıları
+SUPPORTED_INPUT_EXTENSIONS = ('.opus', '.mp3', '.wav', '.m4a', '.flac', '.ogg', '.mp4')
+
+# Toplu modda tüm dosyaların parçalarının paylaştığı varsayılan eşzamanlı istek sayısı
+DEFAULT_BATCH_MAX_WORKERS = 8
+
+# Daemon modu: kuyruk dizininin taranma aralığı ve sayaçların konsola yazdırılma aralığı (saniye)
+DAEMON_POLL_INTERVAL_SEC = 1.0
+DAEMON_REPORT_INTERVAL_SEC = 60.0
+
+# --benchmark-startup ölçümlerinin tekrar sayısı
+STARTUP_BENCHMARK_REPEATS = 5
+
+# Eşzamanlı istek sayısı: hız sınırlayıcı bu değerden başlar ve API yanıtlarına
+# göre en fazla --max-workers (varsayılan DEFAULT_MAX_CONCURRENCY) değerine çıkar
+ADAPTIVE_INITIAL_CONCURRENCY = 3
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Tekrar deneme: deneme sayısı ve jitter'lı üstel bekleme sınırları (saniye)
+RETRY_MAX_ATTEMPTS = 6
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+# Yedek istekler (--hedge): tamamlanan isteklerin (tahmine oranlanmış) süre dağılımının
+# bu yüzdeliği aşılınca aynı parça için ikinci istek gönderilir. En az HEDGE_MIN_SAMPLES
+# ölçüm gerekir; yedek istek en erken HEDGE_MIN_DELAY_SEC sonra gönderilir ve varsayılan
+# olarak bekleyen sesin en fazla HEDGE_DEFAULT_BUDGET oranı kadar ek yükleme yapılır
+HEDGE_PERCENTILE = 0.9
+HEDGE_MIN_SAMPLES = 3
+HEDGE_MIN_DELAY_SEC = 2.0
+HEDGE_POLL_INTERVAL_SEC = 0.5
+HEDGE_DEFAULT_BUDGET = 0.1
+
+# Yerel motor (--backend local): işlem başına CTranslate2 iş parçacığı sayısı
+# (işlem sayısı varsayılan olarak çekirdek sayısı / bu değer) ve hesaplama türü
+LOCAL_THREADS_PER_WORKER = 2
+LOCAL_DEFAULT_COMPUTE_TYPE = "int8"
+
+# Parçalama aşamasının yükleme aşamasından en fazla kaç parça önde gidebileceği
+# (eşzamanlı istek üst sınırına ek olarak; diskte bekleyen parça sayısını sınırlar)
+PIPELINE_PREFETCH_CHUNKS = 2
+
+# Bellek içi modda (--in-memory) ayrı bir bütçe verilmezse bellekte bekleyen
+# kodlanmış parçaların toplam boyut sınırı (MB)
+IN_MEMORY_DEFAULT_MAX_MB = 256
+
+# Transkript için kullanılan Whisper modeli
+WHISPER_MODEL = "whisper-1"
+
+# Transkript önbelleğinin varsayılan en büyük boyutu (MB)
+DEFAULT_CACHE_MAX_MB = 100
+
+# Örtüşmeli parçalar: birleştirirken önceki parçanın sonu ile sonraki parçanın
+# başında karşılaştırılacak en fazla kelime ve eşleşmenin dışında kalabilecek
+# (iki parçada farklı tanınmış) en fazla kelime sayısı
+OVERLAP_STITCH_MAX_WORDS = 24
+OVERLAP_STITCH_MAX_GAP_WORDS = 3
+
+# Gecikme modeli (LatencyModel): bir isteğin süresi ≈ taban + saniye başına süre × parça süresi.
+# Profil için en az LATENCY_MODEL_MIN_SAMPLES ölçüm yoksa varsayılan katsayılar kullanılır.
+LATENCY_MODEL_DEFAULT_BASE_SEC = 2.0
+LATENCY_MODEL_DEFAULT_PER_AUDIO_SEC = 0.05
+LATENCY_MODEL_MIN_SAMPLES = 5
+LATENCY_MODEL_MAX_SAMPLES = 200
+
+# Gecikme planlayıcısının (--chunk-plan latency) kullanacağı en kısa parça süresi (ms)
+LATENCY_PLAN_MIN_CHUNK_MS = 30 * 1000
+
+# Tahmini parça boyutunun max_size_mb sınırına göre bırakacağı pay
+CHUNK_SIZE_SAFETY_MARGIN = 0.95
+# Planlanabilecek en kısa parça (ms); boyut sınırı kaydırma/örtüşme payından sonra buna yetmezse hata verilir
+MIN_CHUNK_LENGTH_MS = 1000
+
+# Sessizlik analizi: enerji çerçevesi uzunluğu (ms) ve duraklama sayılacak
+# çerçevelerin pencere minimumuna göre en fazla kaç dB yüksek olabileceği
+SILENCE_FRAME_MS = 20
+SILENCE_PAUSE_MARGIN_DB = 3.0
+
+# Ses etkinliği tespiti (VAD): dosyanın ortalama seviyesinin bu kadar dB altı
+# konuşma dışı sayılır; kısaltılan her boşlukta bu kadar sessizlik bırakılır
+VAD_THRESHOLD_BELOW_AVERAGE_DB = 16.0
+VAD_KEEP_SILENCE_MS = 400
+
+# Parçaların API'ye yüklenirken kodlanacağı profiller.
+# channels/sample_rate None ise kaynağın değerleri korunur.
+# bitrate verilmeyen kayıpsız formatlarda boyut, PCM boyutunun pcm_ratio katı olarak tahmin edilir.
+UPLOAD_PROFILES = {
+    'wav': {
+        'format': 'wav', 'extension': '.wav', 'codec': None, 'bitrate': None,
+        'channels': None, 'sample_rate': None, 'pcm_ratio': 1.0,
+        'description': 'Sıkıştırılmamış WAV, kaynak kanal/örnekleme hızı (eski davranış)',
+    },
+    'wav16k': {
+        'format': 'wav', 'extension': '.wav', 'codec': None, 'bitrate': None,
+        'channels': 1, 'sample_rate': 16000, 'pcm_ratio': 1.0,
+        'description': 'Mono 16 kHz WAV (~1.9 MB/dakika)',
+    },
+    'flac': {
+        # FLAC boyutu içeriğe bağlıdır; planlama en kötü durum (PCM boyutu) üzerinden yapılır
+        'format': 'flac', 'extension': '.flac', 'codec': 'flac', 'bitrate': None,
+        'channels': 1, 'sample_rate': 16000, 'pcm_ratio': 1.0,
+        'description': 'Mono 16 kHz FLAC, kayıpsız (~1.3 MB/dakika)',
+    },
+    'mp3': {
+        'format': 'mp3', 'extension': '.mp3', 'codec': 'libmp3lame', 'bitrate': '48k',
+        'channels': 1, 'sample_rate': 16000, 'pcm_ratio': None,
+        'description': 'Mono 16 kHz MP3, 48 kbps (~0.35 MB/dakika)',
+    },
+    'opus': {
+        'format': 'ogg', 'extension': '.ogg', 'codec': 'libopus', 'bitrate': '24k',
+        'channels': 1, 'sample_rate': 16000, 'pcm_ratio': None,
+        'description': 'Mono 16 kHz Opus (Ogg), 24 kbps (~0.18 MB/dakika)',
+    },
+}
+
+
+class TranscriptionError(Exception):
+    """Transkript işlemlerinin fırlattığı hataların temel sınıfı. Komut satırı bunları yakalayıp çıkış koduna çevirir."""
+
+
+class ConfigurationError(TranscriptionError):
+    """Eksik API anahtarı veya yüklü olmayan bir kütüphane gibi ayar hataları."""
+
+
+class InputError(TranscriptionError):
+    """Giriş dosyası veya toplu giriş kaynağı bulunamadığında fırlatılır."""
+
+
+class DownloadError(TranscriptionError):
+    """URL'den ses indirilemediğinde fırlatılır."""
+
+
+class AudioProcessingError(TranscriptionError):
+    """Ses dosyası dönüştürülemediğinde veya parçalara bölünemediğinde fırlatılır."""
+
+
+class OutputError(TranscriptionError):
+    """Transkript dosyaya kaydedilemediğinde fırlatılır."""
+
+
+@dataclass
+class TranscriptResult:
+    """Bir transkript işinin sonucu. Başarısız parçalar metinde yer tutucuyla gösterilir."""
+    text: str
+    total_chunks: int
+    duration_ms: int
+    # İşlenemeyen parçaların indeksleri (0-based); --resume ile yalnızca bunlar yeniden denenir
+    failed_chunks: list
+    source: str = None
+    title: str = None
+    timings: "PipelineTimings" = None
+    
+    @property
+    def complete(self) -> bool:
+        """Tüm parçalar transkript edildiyse True."""
+        return not self.failed_chunks
+    
+    def __str__(self) -> str:
+        return self.text
 
 
 def is_url(input_string: str) -> bool:
@@ -237,43 +650,50 @@ def get_platform_name(url: str) -> str:
         return 'Video'
 
 
-def download_audio_from_url(url: str, output_dir: str = None) -> tuple:
+def download_audio_from_url(url: str, output_dir: str = None, download_format: str = 'native') -> tuple:
     """
     Verilen URL'den sesi indirir.
     
+    'native' biçiminde platformun ses akışı (m4a/webm/opus) yeniden kodlanmadan
+    olduğu gibi kaydedilir; ses yalnızca parçalama sırasında bir kez çözülür.
+    'mp3' biçimi eski davranıştır: akış 192 kbps MP3'e dönüştürülür (fazladan bir
+    kayıplı kodlama ve tam geçiş).
+    
+    İndirilen dosyanın yolu dizin taranarak tahmin edilmez; yt-dlp'nin tüm
+    son işlemlerden sonra bildirdiği dosya yolu kullanılır. Her indirme kendi
+    dizinine yazıldığından aynı anda çalışan işler birbirinin dosyasını alamaz.
+    
     Args:
         url: Video URL'si
-        output_dir: İndirme dizini (opsiyonel, varsayılan: temp dizin)
+        output_dir: İndirme dizini (opsiyonel). Verilmezse bu indirme için özel
+            bir geçici dizin oluşturulur; dizini silmek çağıranın sorumluluğundadır.
+        download_format: 'native' (varsayılan) veya 'mp3' (DOWNLOAD_FORMATS)
     
     Returns:
         (audio_path, video_title) tuple
+    
+    Raises:
+        ConfigurationError: yt-dlp yüklü değilse
+        DownloadError: İndirme başarısız olursa veya indirilen dosya bulunamazsa
     """
-    if not YT_DLP_AVAILABLE:
-        print("HATA: yt-dlp kütüphanesi yüklü değil.")
-        print("Yüklemek için: pip install yt-dlp")
-        sys.exit(1)
+    if not yt_dlp.is_available():
+        raise ConfigurationError("yt-dlp kütüphanesi yüklü değil. URL desteği için: pip install yt-dlp")
     
-    if output_dir is None:
-        output_dir = tempfile.gettempdir()
+    owns_dir = output_dir is None
+    if owns_dir:
+        output_dir = tempfile.mkdtemp(prefix=DOWNLOAD_DIR_PREFIX)
     
     platform = get_platform_name(url)
     print(f"{platform} videosundan ses indiriliyor...")
     
-    # İndirmeden önce temp dizinindeki mevcut dosyaları listele
-    existing_files = set(os.listdir(output_dir)) if os.path.exists(output_dir) else set()
-    
-    # Benzersiz bir ID oluştur (dosya adı çakışmalarını önlemek için)
-    unique_id = str(int(time.time() * 1000))
+    # yt-dlp son işlemler (ör. MP3 dönüşümü) bittikten sonra nihai dosya yolunu bildirir
+    final_paths = []
     
     # yt-dlp ayarları
     ydl_opts = {
-        'format': 'bestaudio/best',
-        'outtmpl': os.path.join(output_dir, f'audio_{unique_id}_%(id)s.%(ext)s'),
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': '192',
-        }],
+        'format': DOWNLOAD_FORMATS[download_format],
+        'outtmpl': os.path.join(output_dir, 'audio_%(id)s.%(ext)s'),
+        'post_hooks': [final_paths.append],
         'quiet': True,
         'no_warnings': True,
         'extract_flat': False,
@@ -282,78 +702,41 @@ def download_audio_from_url(url: str, output_dir: str = None) -> tuple:
         'noprogress': True,
         'logger': None,  # Tüm log mesajlarını devre dışı bırak
     }
+    if download_format == 'mp3':
+        ydl_opts['postprocessors'] = [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'mp3',
+            'preferredquality': '192',
+        }]
     
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             # Video bilgilerini al ve indir
             info = ydl.extract_info(url, download=True)
-            
-            video_title = info.get('title', 'video')
-            video_id = info.get('id', 'unknown')
-            
-            # İndirilen dosyayı bul - yt-dlp'den dönen bilgiyi kullan
-            expected_filename = f"audio_{unique_id}_{video_id}.mp3"
-            audio_path = os.path.join(output_dir, expected_filename)
-            
-            # Dosya var mı kontrol et
-            if os.path.exists(audio_path):
-                print(f"Ses dosyası indirildi: {video_title}")
-                return audio_path, video_title
-            
-            # Yoksa temp dizininde yeni eklenen dosyaları bul
-            current_files = set(os.listdir(output_dir))
-            new_files = current_files - existing_files
-            
-            # Yeni dosyalar arasından ses dosyasını bul
-            audio_extensions = ['.mp3', '.m4a', '.webm', '.opus', '.wav', '.ogg']
-            for new_file in new_files:
-                file_lower = new_file.lower()
-                if any(file_lower.endswith(ext) for ext in audio_extensions):
-                    if unique_id in new_file or video_id in new_file:
-                        audio_path = os.path.join(output_dir, new_file)
-                        if os.path.exists(audio_path):
-                            print(f"Ses dosyası indirildi: {video_title}")
-                            return audio_path, video_title
-            
-            # Hala bulunamadıysa, glob ile ara
-            import glob
-            patterns = [
-                os.path.join(output_dir, f"audio_{unique_id}_*.*"),
-                os.path.join(output_dir, f"*{video_id}*.mp3"),
-                os.path.join(output_dir, f"*{video_id}*.m4a"),
-            ]
-            
-            for pattern in patterns:
-                matches = glob.glob(pattern)
-                if matches:
-                    audio_path = matches[0]
-                    if os.path.exists(audio_path):
-                        print(f"Ses dosyası indirildi: {video_title}")
-                        return audio_path, video_title
-            
-            # Son çare: dizindeki en son oluşturulan ses dosyasını bul
-            all_audio_files = []
-            for ext in audio_extensions:
-                all_audio_files.extend(glob.glob(os.path.join(output_dir, f"*{ext}")))
-            
-            if all_audio_files:
-                # En son değiştirilen dosyayı bul
-                latest_file = max(all_audio_files, key=os.path.getmtime)
-                # Son 10 saniye içinde oluşturulmuş mu kontrol et
-                if time.time() - os.path.getmtime(latest_file) < 10:
-                    print(f"Ses dosyası indirildi: {video_title}")
-                    return latest_file, video_title
-            
-            print(f"HATA: İndirilen dosya bulunamadı.")
-            print(f"Beklenen yol: {audio_path}")
-            print(f"Yeni dosyalar: {new_files}")
-            sys.exit(1)
-                
     except Exception as e:
-        print(f"HATA: Video indirilirken hata oluştu: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+        if owns_dir:
+            shutil.rmtree(output_dir, ignore_errors=True)
+        raise DownloadError(f"Video indirilirken hata oluştu: {e}") from e
+    
+    video_title = info.get('title', 'video')
+    
+    # Hook çağrılmadıysa (eski yt-dlp sürümleri) indirme kaydındaki yolu kullan
+    if final_paths:
+        audio_path = final_paths[-1]
+    else:
+        downloads = info.get('requested_downloads') or [{}]
+        audio_path = downloads[-1].get('filepath') or info.get('filepath')
+    
+    if not audio_path or not os.path.exists(audio_path):
+        if owns_dir:
+            shutil.rmtree(output_dir, ignore_errors=True)
+        raise DownloadError(f"İndirilen dosya bulunamadı (yt-dlp'nin bildirdiği yol: {audio_path})")
+    
+    if download_format == 'native':
+        print(f"Ses dosyası indirildi: {video_title} ({Path(audio_path).suffix.lstrip('.')}, yeniden kodlanmadan)")
+    else:
+        print(f"Ses dosyası indirildi: {video_title}")
+    return audio_path, video_title
 
 
 def convert_audio_to_wav(input_path: str, output_path: str = None) -> str:
@@ -366,6 +749,9 @@ def convert_audio_to_wav(input_path: str, output_path: str = None) -> str:
     
     Returns:
         WAV dosyasının yolu
+    
+    Raises:
+        AudioProcessingError: Dosya çözülemez veya yazılamazsa
     """
     if output_path is None:
         output_path = str(Path(input_path).with_suffix('.wav'))
@@ -375,262 +761,4327 @@ def convert_audio_to_wav(input_path: str, output_path: str = None) -> str:
         audio.export(output_path, format="wav")
         return output_path
     except Exception as e:
-        print(f"HATA: Ses dosyası dönüştürülürken hata oluştu: {e}")
-        sys.exit(1)
+        raise AudioProcessingError(f"Ses dosyası dönüştürülürken hata oluştu: {e}") from e
 
 
-def get_chunk_size_mb(chunk_path: str) -> float:
+def get_peak_memory_mb() -> float:
     """
-    Parça dosyasının boyutunu MB cinsinden döndürür.
+    İşlemin şimdiye kadarki en yüksek bellek kullanımını (peak RSS) MB cinsinden döndürür.
+    
+    Returns:
+        Peak bellek kullanımı (MB), platform desteklemiyorsa None
+    """
+    try:
+        import resource
+    except ImportError:
+        # Windows'ta resource modülü yok
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS byte, Linux kilobyte cinsinden raporlar
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def probe_audio_info(audio_path: str) -> dict:
+    """
+    Ses dosyasının süresini, kanal sayısını ve örnekleme hızını dosyayı
+    çözmeden ffprobe ile okur. ffprobe bulunamazsa ffmpeg çıktısı kullanılır.
     
     Args:
-        chunk_path: Parça dosyası yolu
+        audio_path: Ses dosyası yolu
     
     Returns:
-        Dosya boyutu (MB)
+        {'duration_ms', 'channels', 'sample_rate'} sözlüğü
     """
     try:
-        size_bytes = os.path.getsize(chunk_path)
-        return size_bytes / (1024 * 1024)
-    except:
-        return 0
+        result = subprocess.run(
+            [pydub.utils.get_prober_name(), '-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'stream=channels,sample_rate:format=duration', '-of', 'json', audio_path],
+            capture_output=True, text=True, check=True
+        )
+        data = json.loads(result.stdout)
+        stream = data['streams'][0]
+        return {
+            'duration_ms': int(float(data['format']['duration']) * 1000),
+            'channels': int(stream['channels']),
+            'sample_rate': int(stream['sample_rate']),
+        }
+    except (OSError, ValueError, KeyError, IndexError, TypeError, subprocess.CalledProcessError):
+        pass
+    
+    # Yedek yöntem: ffmpeg -i çıktısından bilgileri oku
+    result = subprocess.run(
+        [pydub.AudioSegment.converter, '-hide_banner', '-i', audio_path],
+        capture_output=True, text=True
+    )
+    match = re.search(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)', result.stderr)
+    if not match:
+        raise RuntimeError(f"Ses dosyasının süresi okunamadı: {audio_path}")
+    hours, minutes, seconds = match.groups()
+    info = {
+        'duration_ms': int((int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1000),
+        'channels': 2,
+        'sample_rate': 44100,
+    }
+    
+    stream_match = re.search(r'Audio: .*?(\d+) Hz, (mono|stereo|\d+ channels|[\d.]+)', result.stderr)
+    if stream_match:
+        info['sample_rate'] = int(stream_match.group(1))
+        layout = stream_match.group(2)
+        if layout == 'mono':
+            info['channels'] = 1
+        elif layout == 'stereo':
+            info['channels'] = 2
+        elif layout.endswith('channels'):
+            info['channels'] = int(layout.split()[0])
+        else:
+            # 5.1, 7.1 gibi düzenler
+            info['channels'] = sum(int(part) for part in layout.split('.') if part)
+    return info
 
 
-def split_audio_file(audio_path: str, chunk_length_minutes: int = 5, max_size_mb: float = 20.0) -> list:
+def probe_duration_ms(audio_path: str) -> int:
     """
-    Büyük ses dosyasını parçalara böler.
-    Parça boyutu 25MB limitini aşmaması için dinamik olarak ayarlanır.
+    Ses dosyasının süresini dosyayı çözmeden okur.
     
     Args:
         audio_path: Ses dosyası yolu
-        chunk_length_minutes: Her parçanın uzunluğu (dakika cinsinden)
-        max_size_mb: Maksimum parça boyutu (MB, varsayılan: 20MB, limit: 25MB)
     
     Returns:
-        Parça dosya yollarının listesi
+        Süre (milisaniye)
     """
-    try:
-        audio = pydub.AudioSegment.from_file(audio_path)
-        chunk_length_ms = chunk_length_minutes * 60 * 1000  # Dakikayı milisaniyeye çevir
-        total_length_ms = len(audio)
-        
-        # Eğer dosya parçalara bölünmeyecek kadar kısaysa, direkt döndür
-        if total_length_ms <= chunk_length_ms:
-            # Tek dosya için boyut kontrolü yap
-            file_size_mb = get_chunk_size_mb(audio_path)
-            if file_size_mb > max_size_mb:
-                print(f"UYARI: Dosya boyutu ({file_size_mb:.2f}MB) limiti aşıyor. Parçalara bölünüyor...")
-            else:
-                return [audio_path]
-        
-        chunks = []
-        temp_dir = tempfile.gettempdir()
-        base_name = Path(audio_path).stem
-        
-        # Dosyayı parçalara böl
-        start = 0
-        chunk_index = 0
-        current_chunk_length_ms = chunk_length_ms
-        
-        while start < total_length_ms:
-            end = min(start + current_chunk_length_ms, total_length_ms)
-            chunk = audio[start:end]
-            
-            # Geçici dosya oluştur
-            chunk_path = os.path.join(temp_dir, f"{base_name}_chunk_{chunk_index:03d}.wav")
-            chunk.export(chunk_path, format="wav")
-            
-            # Parça boyutunu kontrol et
-            chunk_size_mb = get_chunk_size_mb(chunk_path)
-            
-            # Eğer parça çok büyükse, boyutu küçült ve tekrar dene
-            if chunk_size_mb > max_size_mb:
-                os.remove(chunk_path)  # Büyük parçayı sil
-                
-                # Parça uzunluğunu yarıya indir
-                current_chunk_length_ms = int(current_chunk_length_ms * 0.5)
-                if current_chunk_length_ms < 30000:  # 30 saniyeden az olmasın
-                    current_chunk_length_ms = 30000
-                
-                print(f"UYARI: Parça {chunk_index+1} çok büyük ({chunk_size_mb:.2f}MB). Parça uzunluğu {current_chunk_length_ms/60000:.1f} dakikaya düşürülüyor...")
-                continue  # Aynı başlangıç noktasından tekrar dene
-            
-            chunks.append(chunk_path)
-            start = end
-            chunk_index += 1
-            
-            # Başarılı parça oluşturulduktan sonra varsayılan uzunluğa geri dön
-            if current_chunk_length_ms < chunk_length_ms:
-                current_chunk_length_ms = chunk_length_ms
-        
-        return chunks
-    except Exception as e:
-        print(f"HATA: Ses dosyası parçalara bölünürken hata oluştu: {e}")
-        sys.exit(1)
+    return probe_audio_info(audio_path)['duration_ms']
 
 
-def transcribe_chunk(chunk_path: str, chunk_index: int, total_chunks: int, api_key: str, max_retries: int = 3) -> tuple:
+def get_profile_bytes_per_second(profile: str, channels: int, sample_rate: int, sample_width: int = 2) -> float:
     """
-    Tek bir parçayı transkript eder (paralel işleme için).
-    Retry mekanizması ile bağlantı hatalarını yönetir.
+    Yükleme profiline göre kodlanmış sesin saniye başına yaklaşık byte sayısını hesaplar.
     
     Args:
-        chunk_path: Parça dosyası yolu
-        chunk_index: Parça indeksi (0-based)
-        total_chunks: Toplam parça sayısı
-        api_key: OpenAI API anahtarı
-        max_retries: Maksimum deneme sayısı (varsayılan: 3)
+        profile: UPLOAD_PROFILES içindeki profil adı
+        channels: Kaynak kanal sayısı (profil kendi değerini belirtmiyorsa kullanılır)
+        sample_rate: Kaynak örnekleme hızı (profil kendi değerini belirtmiyorsa kullanılır)
+        sample_width: Örnek genişliği (byte, PCM formatları için)
     
     Returns:
-        (chunk_index, transcript_text) tuple
+        Saniye başına byte
     """
-    client = OpenAI(api_key=api_key)
+    settings = UPLOAD_PROFILES[profile]
     
-    for attempt in range(max_retries):
-        try:
-            if attempt > 0:
-                wait_time = min(2 ** attempt, 10)  # Exponential backoff, max 10 saniye
-                print(f"Parça {chunk_index+1}/{total_chunks} tekrar deneniyor (deneme {attempt+1}/{max_retries})...")
-                time.sleep(wait_time)
-            else:
-                print(f"Parça {chunk_index+1}/{total_chunks} işleniyor...")
-            
-            with open(chunk_path, "rb") as audio_file:
-                transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file
-                )
-            print(f"Parça {chunk_index+1}/{total_chunks} tamamlandı.")
-            return (chunk_index, transcript.text)
-        except Exception as e:
-            error_str = str(e)
-            # 413 hatası (dosya çok büyük) için retry yapma
-            if "413" in error_str or "Maximum content size" in error_str:
-                print(f"HATA: Parça {chunk_index+1} çok büyük (25MB limiti aşıldı). Bu parça atlanıyor.")
-                return (chunk_index, f"[Parça {chunk_index+1} çok büyük, işlenemedi]")
-            
-            # Son denemede hata döndür
-            if attempt == max_retries - 1:
-                print(f"HATA: Parça {chunk_index+1} {max_retries} denemeden sonra işlenemedi: {e}")
-                return (chunk_index, f"[Parça {chunk_index+1} işlenemedi: {str(e)}]")
-            
-            # Connection error için retry yap
-            if "Connection" in error_str or "timeout" in error_str.lower():
-                continue  # Retry yap
+    if settings['bitrate']:
+        # "48k" -> 48000 bit/s; konteyner ek yükü için %5 pay bırak
+        bits_per_second = int(settings['bitrate'].rstrip('k')) * 1000
+        return bits_per_second / 8 * 1.05
     
-    # Buraya gelmemeli ama yine de güvenlik için
-    return (chunk_index, f"[Parça {chunk_index+1} işlenemedi]")
+    channels = settings['channels'] or channels
+    sample_rate = settings['sample_rate'] or sample_rate
+    if settings['channels'] or settings['sample_rate']:
+        # Profil normalize ediyorsa 16-bit PCM üzerinden hesapla
+        sample_width = 2
+    return sample_rate * channels * sample_width * settings['pcm_ratio']
 
 
-def transcribe_audio(audio_path: str, api_key: str = None, chunk_length_minutes: int = 5, max_workers: int = None, max_chunk_size_mb: float = 20.0) -> str:
+def get_max_chunk_length_ms(profile: str, max_size_mb: float, channels: int, sample_rate: int, sample_width: int = 2) -> int:
     """
-    Ses dosyasını OpenAI Whisper API kullanarak metne çevirir.
-    Büyük dosyalar otomatik olarak parçalara bölünür ve birleştirilir.
-    Dil otomatik olarak algılanır ve ses dosyasındaki dilde transkript edilir.
-    Parçalar paralel olarak işlenir, bu da işlem süresini önemli ölçüde kısaltır.
+    Seçilen profilde max_size_mb sınırına sığan en uzun parça süresini hesaplar.
+    Tahmin hatalarına karşı CHUNK_SIZE_SAFETY_MARGIN kadar pay bırakılır.
     
     Args:
-        audio_path: Ses dosyası yolu
-        api_key: OpenAI API anahtarı (opsiyonel, ortam değişkeninden alınabilir)
-        chunk_length_minutes: Parça uzunluğu (dakika cinsinden, varsayılan: 5)
-        max_workers: Paralel işlem sayısı (varsayılan: 3, connection error'ları önlemek için)
-        max_chunk_size_mb: Maksimum parça boyutu (MB, varsayılan: 20MB)
+        profile: UPLOAD_PROFILES içindeki profil adı
+        max_size_mb: Maksimum parça boyutu (MB)
+        channels: Kaynak kanal sayısı
+        sample_rate: Kaynak örnekleme hızı
+        sample_width: Örnek genişliği (byte)
     
     Returns:
-        Transkript edilmiş metin (ses dosyasındaki dilde)
+        Maksimum parça süresi (milisaniye)
     """
-    # API anahtarını kontrol et
-    if api_key is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-    
-    if not api_key:
-        print("HATA: OpenAI API anahtarı bulunamadı.")
-        print("Lütfen OPENAI_API_KEY ortam değişkenini ayarlayın veya --api-key parametresini kullanın.")
-        sys.exit(1)
-    
-    try:
-        # Ses dosyasının süresini kontrol et
-        audio = pydub.AudioSegment.from_file(audio_path)
-        duration_minutes = len(audio) / (60 * 1000)
-        
-        print(f"Ses dosyası süresi: {duration_minutes:.2f} dakika")
-        
-        # Dosyayı parçalara böl (gerekirse)
-        chunks = split_audio_file(audio_path, chunk_length_minutes, max_chunk_size_mb)
-        
-        if len(chunks) > 1:
-            print(f"Dosya {len(chunks)} parçaya bölündü (her parça ~{chunk_length_minutes} dakika, max {max_chunk_size_mb}MB)")
-            # Paralel işlem sayısını sınırla (connection error'ları önlemek için)
-            if max_workers is None:
-                max_workers = min(3, len(chunks))  # Varsayılan olarak max 3 paralel işlem
-            print(f"Parçalar paralel olarak işlenecek (max {max_workers} eşzamanlı işlem)...")
-        else:
-            max_workers = 1
-        
-        # Geçici dosyaları takip et
-        temp_chunk_files = [chunk for chunk in chunks if chunk != audio_path]
-        
-        # Paralel işleme için ThreadPoolExecutor kullan
-        all_transcripts = [None] * len(chunks)  # Sonuçları doğru sırada saklamak için
-        
-        if len(chunks) == 1:
-            # Tek parça varsa normal işle
-            result = transcribe_chunk(chunks[0], 0, 1, api_key)
-            all_transcripts[0] = result[1]
-        else:
-            # Birden fazla parça varsa paralel işle
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Tüm parçaları işleme gönder
-                future_to_chunk = {
-                    executor.submit(transcribe_chunk, chunk_path, i, len(chunks), api_key): (i, chunk_path)
-                    for i, chunk_path in enumerate(chunks)
-                }
-                
-                # Tamamlanan işlemleri topla
-                for future in as_completed(future_to_chunk):
-                    chunk_index, transcript_text = future.result()
-                    all_transcripts[chunk_index] = transcript_text
-        
-        # Parçaları birleştir
-        final_transcript = " ".join(all_transcripts)
-        
-        # Geçici parça dosyalarını temizle
-        for chunk_file in temp_chunk_files:
-            try:
-                if os.path.exists(chunk_file):
-                    os.remove(chunk_file)
-            except:
-                pass
-        
-        return final_transcript
-        
-    except Exception as e:
-        print(f"HATA: Transkript işlemi sırasında hata oluştu: {e}")
-        sys.exit(1)
+    bytes_per_second = get_profile_bytes_per_second(profile, channels, sample_rate, sample_width)
+    return int(max_size_mb * 1024 * 1024 * CHUNK_SIZE_SAFETY_MARGIN / bytes_per_second * 1000)
 
 
-def save_transcript(text: str, output_path: str):
+def normalize_for_profile(audio: "pydub.AudioSegment", profile: str) -> "pydub.AudioSegment":
     """
-    Transkripti dosyaya kaydeder.
+    Çözülmüş sesi yükleme profilinin kanal sayısı ve örnekleme hızına dönüştürür.
     
     Args:
-        text: Kaydedilecek metin
-        output_path: Çıkış dosyası yolu
+        audio: Çözülmüş ses
+        profile: UPLOAD_PROFILES içindeki profil adı
+    
+    Returns:
+        Dönüştürülmüş ses (profil normalize etmiyorsa aynı nesne)
     """
-    try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(text)
-        print(f"Transkript kaydedildi: {output_path}")
-    except Exception as e:
-        print(f"HATA: Dosya kaydedilirken hata oluştu: {e}")
-        sys.exit(1)
+    settings = UPLOAD_PROFILES[profile]
+    if settings['channels'] and audio.channels != settings['channels']:
+        audio = audio.set_channels(settings['channels'])
+    if settings['sample_rate'] and audio.frame_rate != settings['sample_rate']:
+        audio = audio.set_frame_rate(settings['sample_rate'])
+    if (settings['channels'] or settings['sample_rate']) and audio.sample_width != 2:
+        audio = audio.set_sample_width(2)
+    return audio
 
 
-# ============================================
-# DOSYA YOLU AYARLARI
-# ============================================
-# Dosya yolu artık konsoldan kullanıcıdan alınacaktır.
-# ============================================
+def export_chunk(chunk: "pydub.AudioSegment", chunk_path: str, profile: str = 'wav'):
+    """
+    Ses parçasını yükleme profilinin formatında dosyaya yazar.
+    
+    Args:
+        chunk: Ses parçası
+        chunk_path: Çıkış dosyası yolu
+        profile: UPLOAD_PROFILES içindeki profil adı
+    """
+    settings = UPLOAD_PROFILES[profile]
+    export_args = {'format': settings['format']}
+    if settings['codec']:
+        export_args['codec'] = settings['codec']
+    if settings['bitrate']:
+        export_args['bitrate'] = settings['bitrate']
+    chunk.export(chunk_path, **export_args)
+
+
+def export_chunk_bytes(chunk: "pydub.AudioSegment", profile: str = 'wav') -> bytes:
+    """
+    Ses parçasını yükleme profilinin formatında diske yazmadan bellekte kodlar.
+    WAV başlığı Python'da yazılır; diğer formatlarda PCM verisi ffmpeg'e
+    stdin'den verilir ve kodlanmış çıktı stdout'tan okunur.
+    
+    Args:
+        chunk: Ses parçası
+        profile: UPLOAD_PROFILES içindeki profil adı
+    
+    Returns:
+        Kodlanmış parça verisi
+    """
+    if UPLOAD_PROFILES[profile]['format'] == 'wav':
+        return pcm_to_wav_bytes(chunk.raw_data, chunk.channels, chunk.frame_rate, chunk.sample_width)
+    
+    # Sıkıştırılmış profiller normalize_for_profile ile 16-bit PCM'e çevrilmiştir
+    command = [
+        pydub.AudioSegment.converter, '-nostdin', '-v', 'error',
+        '-f', 's16le', '-ar', str(chunk.frame_rate), '-ac', str(chunk.channels), '-i', 'pipe:0',
+        *get_ffmpeg_profile_args(profile), 'pipe:1',
+    ]
+    result = subprocess.run(command, input=chunk.raw_data, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg parçayı kodlayamadı: {result.stderr.decode('utf-8', 'replace').strip()}")
+    return result.stdout
+
+
+def pcm_to_wav_bytes(raw_data: bytes, channels: int, sample_rate: int, sample_width: int = 2) -> bytes:
+    """
+    Ham PCM verisini bellekte WAV dosyasına sarar.
+    
+    Args:
+        raw_data: Ham PCM verisi
+        channels: Kanal sayısı
+        sample_rate: Örnekleme hızı
+        sample_width: Örnek genişliği (byte)
+    
+    Returns:
+        WAV dosyası verisi
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(raw_data)
+    return buffer.getvalue()
+
+
+def get_ffmpeg_profile_args(profile: str) -> list:
+    """
+    Akış modunda ffmpeg'e verilecek çıkış kodlama parametrelerini döndürür.
+    
+    Args:
+        profile: UPLOAD_PROFILES içindeki profil adı
+    
+    Returns:
+        ffmpeg parametre listesi
+    """
+    settings = UPLOAD_PROFILES[profile]
+    args = []
+    if settings['channels']:
+        args += ['-ac', str(settings['channels'])]
+    if settings['sample_rate']:
+        args += ['-ar', str(settings['sample_rate'])]
+    if settings['codec']:
+        args += ['-c:a', settings['codec']]
+    elif settings['channels'] or settings['sample_rate']:
+        args += ['-c:a', 'pcm_s16le']
+    if settings['bitrate']:
+        args += ['-b:a', settings['bitrate']]
+    args += ['-f', settings['format']]
+    return args
+
+
+class AudioPipeline:
+    """
+    Kaynak ses dosyasını yalnızca bir kez çözen (decode) ve aynı ses verisini
+    süre raporu, parçalama ve yükleme adımları arasında paylaştıran sınıf.
+    
+    Eskiden aynı dosya dönüştürme, süre kontrolü ve parçalama için üç kez
+    ayrı ayrı çözülüyordu; bu sınıf tek bir AudioSegment tamponu tutar.
+    """
+    
+    def __init__(self, source_path: str, profile: str = 'wav'):
+        """
+        Args:
+            source_path: Kaynak ses dosyası yolu
+            profile: Yükleme profili (UPLOAD_PROFILES), çözme sırasında bir kez uygulanır
+        """
+        self.source_path = source_path
+        self.profile = profile
+        self.audio = None
+        self.decode_count = 0
+        self.decode_seconds = 0.0
+        self.probed_info = None
+        self.offset_map = None
+    
+    def load(self) -> "pydub.AudioSegment":
+        """
+        Ses dosyasını (henüz çözülmediyse) çözer ve AudioSegment olarak döndürür.
+        Yükleme profilinin kanal/örnekleme hızı dönüşümü burada bir kez yapılır;
+        sonraki çağrılar aynı tamponu döndürür.
+        
+        Returns:
+            Çözülmüş ses verisi
+        """
+        if self.audio is None:
+            start_time = time.perf_counter()
+            self.audio = normalize_for_profile(pydub.AudioSegment.from_file(self.source_path), self.profile)
+            self.decode_seconds += time.perf_counter() - start_time
+            self.decode_count += 1
+        return self.audio
+    
+    @property
+    def duration_ms(self) -> int:
+        """Ses süresi (milisaniye)."""
+        return len(self.load())
+    
+    def probe(self) -> dict:
+        """
+        Ses bilgilerini (süre, kanal, örnekleme hızı) dosyayı çözmeden döndürür.
+        Ses zaten çözülmüşse bilgiler tampondan alınır.
+        
+        Returns:
+            {'duration_ms', 'channels', 'sample_rate'} sözlüğü
+        """
+        if self.audio is not None:
+            return {
+                'duration_ms': len(self.audio),
+                'channels': self.audio.channels,
+                'sample_rate': self.audio.frame_rate,
+            }
+        if self.probed_info is None:
+            self.probed_info = probe_audio_info(self.source_path)
+        return self.probed_info
+    
+    def probe_duration_ms(self) -> int:
+        """
+        Ses süresini dosyayı çözmeden döndürür (akış modu için).
+        
+        Returns:
+            Süre (milisaniye)
+        """
+        return self.probe()['duration_ms']
+    
+    def apply_vad(self, min_silence_ms: int, keep_silence_ms: int = VAD_KEEP_SILENCE_MS) -> "OffsetMap":
+        """
+        Çözülmüş tampondaki uzun konuşma dışı bölümleri kısaltır.
+        Tampon kırpılmış sesle değiştirilir; orijinal zamanlar offset_map ile bulunur.
+        
+        Args:
+            min_silence_ms: Kısaltılacak en kısa konuşma dışı bölüm (ms)
+            keep_silence_ms: Kısaltılan her bölümde bırakılacak sessizlik (ms)
+        
+        Returns:
+            Kırpılmış zamanı orijinal zamana eşleyen OffsetMap
+        """
+        original_ms = len(self.load())
+        start_time = time.perf_counter()
+        self.audio, self.offset_map = trim_non_speech(self.audio, min_silence_ms, keep_silence_ms)
+        removed_ms = original_ms - len(self.audio)
+        print(f"VAD: {original_ms/60000:.2f} dakikanın {removed_ms/60000:.2f} dakikası "
+              f"(%{100 * removed_ms / max(original_ms, 1):.0f}) konuşma dışı olarak atlandı "
+              f"({time.perf_counter() - start_time:.2f} saniye)")
+        return self.offset_map
+    
+    def release(self):
+        """Çözülmüş ses tamponunu serbest bırakır."""
+        self.audio = None
+    
+    def report(self):
+        """Çözme süresi ve peak bellek kullanımını yazdırır."""
+        print(f"Çözme raporu: {self.decode_count} kez çözüldü, {self.decode_seconds:.2f} saniye")
+        peak_mb = get_peak_memory_mb()
+        if peak_mb is not None:
+            print(f"Peak bellek kullanımı: {peak_mb:.1f} MB")
+
+
+def get_chunk_size_mb(chunk_path: str) -> float:
+    """
+    Parça dosyasının boyutunu MB cinsinden döndürür.
+    
+    Args:
+        chunk_path: Parça dosyası yolu
+    
+    Returns:
+        Dosya boyutu (MB)
+    """
+    try:
+        size_bytes = os.path.getsize(chunk_path)
+        return size_bytes / (1024 * 1024)
+    except:
+        return 0
+
+
+@dataclass
+class ChunkSpec:
+    """Planlanan bir ses parçasının kaynaktaki konumu ve (üretildiyse) dosya yolu veya bellekteki verisi."""
+    index: int
+    start_ms: int
+    end_ms: int
+    path: str = None
+    content_key: str = None
+    reserved_bytes: int = 0
+    # Bellek içi modda kodlanmış parça verisi; path bu durumda yalnızca yükleme için dosya adıdır
+    data: bytes = None
+    # Örtüşme modunda parçanın önceki/sonraki parçayla paylaştığı ek ses (ms);
+    # start_ms-end_ms aralığı parçanın transkriptte "sahip olduğu" bölümdür
+    lead_ms: int = 0
+    tail_ms: int = 0
+    
+    @property
+    def size_bytes(self) -> int:
+        """Kodlanmış parçanın boyutu (byte)."""
+        if self.data is not None:
+            return len(self.data)
+        return int(get_chunk_size_mb(self.path) * 1024 * 1024)
+    
+    @property
+    def duration_ms(self) -> int:
+        """Parça süresi (milisaniye)."""
+        return self.end_ms - self.start_ms
+    
+    @property
+    def audio_start_ms(self) -> int:
+        """Kodlanan sesin kaynaktaki başlangıcı (örtüşme dahil, milisaniye)."""
+        return self.start_ms - self.lead_ms
+    
+    @property
+    def audio_end_ms(self) -> int:
+        """Kodlanan sesin kaynaktaki bitişi (örtüşme dahil, milisaniye)."""
+        return self.end_ms + self.tail_ms
+    
+    @property
+    def audio_duration_ms(self) -> int:
+        """Kodlanan sesin süresi (örtüşme dahil, milisaniye)."""
+        return self.audio_end_ms - self.audio_start_ms
+    
+    @property
+    def keep_range(self) -> tuple:
+        """
+        Örtüşmeli parçada transkriptte tutulacak kelimelerin parça içindeki zaman
+        aralığı (ms). Aralık, örtüşen bölümlerin yarısına kadar uzanır; böylece
+        kesim noktasındaki kelime iki parçadan en az birinde kalır, iki kez
+        yazılan kelimeler birleştirirken ayıklanır (strip_overlap_prefix).
+        
+        Returns:
+            (başlangıç_ms, bitiş_ms) tuple (açık uç için None) veya örtüşme yoksa None
+        """
+        if not self.lead_ms and not self.tail_ms:
+            return None
+        keep_start = self.lead_ms - self.lead_ms // 2 if self.lead_ms else None
+        keep_end = self.lead_ms + self.duration_ms + self.tail_ms // 2 if self.tail_ms else None
+        return (keep_start, keep_end)
+
+
+def plan_audio_chunks(total_length_ms: int, chunk_length_minutes: float, max_size_mb: float, profile: str,
+                      channels: int, sample_rate: int, sample_width: int = 2, source_path: str = None,
+                      boundary_tolerance_ms: int = 0, overlap_ms: int = 0, concurrency: int = 0,
+                      latency_model: "LatencyModel" = None) -> list:
+    """
+    Parça düzenini kodlamadan önce hesaplar. Parça süresi; örnekleme hızı,
+    kanal sayısı, örnek genişliği ve profilin bit hızından tahmin edilen boyutun
+    max_size_mb sınırına sığacağı şekilde seçilir, böylece her parça tam olarak
+    bir kez kodlanır.
+    
+    Args:
+        total_length_ms: Toplam ses süresi (milisaniye)
+        chunk_length_minutes: İstenen parça uzunluğu (dakika cinsinden)
+        max_size_mb: Maksimum parça boyutu (MB)
+        profile: Yükleme profili (UPLOAD_PROFILES)
+        channels: Kaynak kanal sayısı
+        sample_rate: Kaynak örnekleme hızı
+        sample_width: Örnek genişliği (byte)
+        source_path: Kaynak dosya yolu (opsiyonel). Ses tek parçaya sığıyorsa ve
+            API'nin kabul ettiği formattaysa kaynak dosya doğrudan yüklenir.
+        boundary_tolerance_ms: Kesim noktalarının sonradan kaydırılabileceği pay
+            (snap_chunk_boundaries). Parçalar bu kadar kısa planlanır ki kaydırma
+            sonrası da boyut sınırı aşılmasın.
+        overlap_ms: Komşu parçaların paylaşacağı ses süresi (ms, 0 ise kesim noktaları
+            keskin). Her kesim noktasının iki yanına yarısı kadar ek ses eklenir;
+            parçalar ek sesle birlikte boyut sınırına sığacak kadar kısa planlanır.
+        concurrency: Eşzamanlı istek sayısı (gecikme planı için)
+        latency_model: Verilirse chunk_length_minutes yok sayılır; parça sayısı beklenen
+            toplam süreyi en aza indirecek şekilde seçilir (choose_latency_chunk_count)
+            ve ses eşit uzunlukta parçalara bölünür.
+    
+    Returns:
+        ChunkSpec listesi
+    
+    Raises:
+        ConfigurationError: Parça uzunluğu sıfır veya negatifse ya da boyut sınırı,
+            kaydırma payı ve örtüşme düşüldükten sonra MIN_CHUNK_LENGTH_MS
+            uzunluğunda bir parçaya bile yetmiyorsa
+    """
+    if latency_model is None and chunk_length_minutes <= 0:
+        raise ConfigurationError(f"Parça uzunluğu sıfırdan büyük olmalı (verilen: {chunk_length_minutes} dakika).")
+    # Profilin saniye başına byte değerine göre parça uzunluğunu sınırla
+    max_length_ms = get_max_chunk_length_ms(profile, max_size_mb, channels, sample_rate, sample_width)
+    # Kaydırma ve örtüşme payından sonra kalan süre; sıfır veya negatif adım döngüyü bitirmez
+    usable_length_ms = max_length_ms - boundary_tolerance_ms - overlap_ms
+    if usable_length_ms < MIN_CHUNK_LENGTH_MS:
+        raise ConfigurationError(f"'{profile}' profilinde {max_size_mb}MB parça boyutu sınırı çok küçük: "
+                                 f"{max_length_ms} ms sığıyor, kaydırma payı ({boundary_tolerance_ms} ms) ve örtüşme "
+                                 f"({overlap_ms} ms) sonrası en az {MIN_CHUNK_LENGTH_MS} ms kalmalı.")
+    
+    if latency_model is not None and total_length_ms > 0:
+        # Eşit parçalar: parça sayısı eşzamanlılığın katıysa her dalga aynı sürede biter
+        max_length_ms = usable_length_ms
+        count = choose_latency_chunk_count(total_length_ms, max_length_ms, max(1, concurrency), latency_model, overlap_ms)
+        bounds = [round(i * total_length_ms / count) for i in range(count + 1)]
+        plan = [ChunkSpec(index=i, start_ms=bounds[i], end_ms=bounds[i + 1]) for i in range(count)]
+        base, per_second = latency_model.coefficients
+        print(f"Gecikme planı: {count} parça × ~{total_length_ms / count / 60000:.1f} dakika, {max(1, concurrency)} eşzamanlı istek "
+              f"(model: {base:.2f} sn + {per_second:.3f} × parça süresi)")
+    else:
+        chunk_length_ms = int(chunk_length_minutes * 60 * 1000)  # Dakikayı milisaniyeye çevir
+        if chunk_length_ms > max_length_ms:
+            print(f"Bilgi: '{profile}' profilinde {max_size_mb}MB sınırı için parça uzunluğu {max_length_ms/60000:.1f} dakikaya ayarlandı.")
+            chunk_length_ms = max_length_ms
+        chunk_length_ms = max(MIN_CHUNK_LENGTH_MS, min(chunk_length_ms, usable_length_ms))
+        
+        plan = []
+        start = 0
+        while start < total_length_ms:
+            end = min(start + chunk_length_ms, total_length_ms)
+            plan.append(ChunkSpec(index=len(plan), start_ms=start, end_ms=end))
+            start = end
+    
+    # İlk parçanın başı ve son parçanın sonu dışında her kesim noktası örtüşür
+    if overlap_ms > 0 and len(plan) > 1:
+        for spec in plan[1:]:
+            spec.lead_ms = min(overlap_ms // 2, spec.start_ms)
+        for spec in plan[:-1]:
+            spec.tail_ms = min(overlap_ms - overlap_ms // 2, total_length_ms - spec.end_ms)
+    
+    # Kısa ve API'nin kabul ettiği formattaki dosyayı yeniden kodlamadan kullan
+    if source_path and len(plan) == 1 and Path(source_path).suffix.lower() in WHISPER_UPLOAD_EXTENSIONS:
+        file_size_mb = get_chunk_size_mb(source_path)
+        if file_size_mb <= max_size_mb:
+            plan[0].path = source_path
+        else:
+            print(f"UYARI: Dosya boyutu ({file_size_mb:.2f}MB) limiti aşıyor. Yeniden kodlanıyor...")
+    
+    return plan
+
+
+def predict_makespan(durations_ms: list, concurrency: int, latency_model: "LatencyModel") -> float:
+    """
+    Parçalar en uzundan başlayarak concurrency kadar eşzamanlı istekle
+    gönderildiğinde tüm isteklerin bitmesi için geçecek süreyi tahmin eder
+    (her parça ilk boşalan slota verilir).
+    
+    Args:
+        durations_ms: Yüklenecek parçaların süreleri (ms)
+        concurrency: Eşzamanlı istek sayısı
+        latency_model: İstek süresi modeli
+    
+    Returns:
+        Tahmini süre (saniye)
+    """
+    slots = [0.0] * max(1, min(concurrency, len(durations_ms)))
+    for duration_ms in sorted(durations_ms, reverse=True):
+        slot = slots.index(min(slots))
+        slots[slot] += latency_model.predict(duration_ms / 1000)
+    return max(slots)
+
+
+def choose_latency_chunk_count(total_length_ms: int, max_length_ms: int, concurrency: int,
+                               latency_model: "LatencyModel", overlap_ms: int = 0) -> int:
+    """
+    Toplam süreyi eşit parçalara bölerken beklenen toplam süreyi en aza indiren
+    parça sayısını seçer. Parça sayısı eşzamanlılığın katı olduğunda her "dalga"
+    eşit sürer; daha fazla parça her isteğin sabit maliyetini (taban) tekrarlar,
+    daha az parça eşzamanlı slotları boş bırakır.
+    
+    Args:
+        total_length_ms: Toplam ses süresi (ms)
+        max_length_ms: Boyut sınırına sığan en uzun parça süresi (ms, örtüşme hariç)
+        concurrency: Eşzamanlı istek sayısı
+        latency_model: İstek süresi modeli
+        overlap_ms: Komşu parçaların paylaşacağı ses süresi (ms)
+    
+    Returns:
+        Parça sayısı
+    """
+    min_count = max(1, math.ceil(total_length_ms / max_length_ms))
+    max_count = max(min_count, total_length_ms // LATENCY_PLAN_MIN_CHUNK_MS)
+    best_count, best_seconds = min_count, math.inf
+    for count in range(min_count, max_count + 1):
+        # İlk ve son parça dışındakiler örtüşmenin tamamını taşır
+        chunk_ms = total_length_ms / count + (overlap_ms if count > 1 else 0)
+        seconds = math.ceil(count / concurrency) * latency_model.predict(chunk_ms / 1000)
+        # Eşit tahminlerde daha az parça (daha az istek) tercih edilir
+        if seconds < best_seconds - 1e-9:
+            best_count, best_seconds = count, seconds
+    return best_count
+
+
+def frame_rms_db(samples: "np.ndarray", sample_rate: int, frame_ms: int = SILENCE_FRAME_MS) -> "np.ndarray":
+    """
+    Mono ses örneklerinin çerçeve başına RMS enerjisini dBFS cinsinden hesaplar.
+    Tüm hesap NumPy ile vektörel yapılır (örnek başına Python döngüsü yoktur).
+    
+    Args:
+        samples: [-1, 1] aralığında float mono örnekler
+        sample_rate: Örnekleme hızı
+        frame_ms: Çerçeve uzunluğu (ms)
+    
+    Returns:
+        Çerçeve başına dBFS değerleri
+    """
+    frame_length = max(1, int(sample_rate * frame_ms / 1000))
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return np.empty(0, dtype=np.float32)
+    frames = samples[:frame_count * frame_length].reshape(frame_count, frame_length)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-10))
+
+
+def pcm_to_mono_float(raw_data: bytes, sample_width: int, channels: int) -> "np.ndarray":
+    """
+    Ham PCM verisini [-1, 1] aralığında float32 mono örneklere dönüştürür.
+    
+    Args:
+        raw_data: Ham PCM verisi
+        sample_width: Örnek genişliği (1, 2 veya 4 byte)
+        channels: Kanal sayısı
+    
+    Returns:
+        Mono örnekler
+    """
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}[sample_width]
+    samples = np.frombuffer(raw_data, dtype=dtype)
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    else:
+        samples = samples.astype(np.float32)
+    return samples / float(2 ** (8 * sample_width - 1))
+
+
+def make_segment_window_reader(audio: "pydub.AudioSegment"):
+    """
+    Çözülmüş sesten zaman aralığı okuyan bir fonksiyon döndürür (snap_chunk_boundaries için).
+    
+    Args:
+        audio: Çözülmüş ses
+    
+    Returns:
+        read_window(start_ms, end_ms) -> (mono örnekler, örnekleme hızı)
+    """
+    def read_window(start_ms: int, end_ms: int) -> tuple:
+        segment = audio[start_ms:end_ms]
+        if segment.sample_width not in (1, 2, 4):
+            segment = segment.set_sample_width(2)
+        return pcm_to_mono_float(segment.raw_data, segment.sample_width, segment.channels), segment.frame_rate
+    return read_window
+
+
+def make_ffmpeg_window_reader(audio_path: str, sample_rate: int = 16000):
+    """
+    Dosyayı bütünüyle çözmeden, ffmpeg ile yalnızca istenen zaman aralığını
+    okuyan bir fonksiyon döndürür (akış modu için).
+    
+    Args:
+        audio_path: Ses dosyası yolu
+        sample_rate: Analiz için kullanılacak örnekleme hızı
+    
+    Returns:
+        read_window(start_ms, end_ms) -> (mono örnekler, örnekleme hızı)
+    """
+    def read_window(start_ms: int, end_ms: int) -> tuple:
+        command = [
+            pydub.AudioSegment.converter, '-nostdin', '-v', 'error',
+            '-ss', f"{start_ms / 1000:.3f}", '-t', f"{(end_ms - start_ms) / 1000:.3f}",
+            '-i', audio_path, '-vn', '-ac', '1', '-ar', str(sample_rate), '-f', 's16le', '-',
+        ]
+        result = subprocess.run(command, capture_output=True, check=True)
+        return pcm_to_mono_float(result.stdout, 2, 1), sample_rate
+    return read_window
+
+
+def snap_chunk_boundaries(plan: list, read_window, tolerance_ms: int, frame_ms: int = SILENCE_FRAME_MS) -> int:
+    """
+    Her kesim noktasını, tolerans penceresi içindeki en yakın duraklamaya kaydırır.
+    Yalnızca kesim noktalarının çevresindeki pencereler okunur ve çerçeve enerjisi
+    NumPy ile hesaplanır. Kısa enerji dalgalanmalarını yok saymak için enerji
+    100 ms'lik hareketli ortalama ile yumuşatılır; pencere minimumuna
+    SILENCE_PAUSE_MARGIN_DB kadar yakın çerçeveler duraklama kabul edilir.
+    
+    Plan, plan_audio_chunks(boundary_tolerance_ms=tolerance_ms) ile üretilmiş
+    olmalıdır: hiçbir parça planlanan uzunluktan tolerans kadar fazlasını aşmaz.
+    
+    Args:
+        plan: ChunkSpec listesi (yerinde güncellenir)
+        read_window: (start_ms, end_ms) -> (mono örnekler, örnekleme hızı)
+        tolerance_ms: Kesim noktasının her iki yöne en fazla kaydırılabileceği süre
+        frame_ms: Enerji çerçevesi uzunluğu (ms)
+    
+    Returns:
+        Kaydırılan kesim noktası sayısı
+    """
+    if len(plan) < 2 or tolerance_ms <= 0:
+        return 0
+    
+    max_length_ms = plan[0].duration_ms + tolerance_ms
+    total_length_ms = plan[-1].end_ms
+    smoothing = np.ones(5, dtype=np.float32) / 5
+    previous_cut = 0
+    moved = 0
+    
+    for i in range(len(plan) - 1):
+        nominal = plan[i].end_ms
+        low = max(previous_cut + frame_ms, nominal - tolerance_ms)
+        high = min(nominal + tolerance_ms, previous_cut + max_length_ms, total_length_ms - frame_ms)
+        cut = min(nominal, high)
+        
+        if high - low >= frame_ms:
+            samples, sample_rate = read_window(low, high)
+            energy_db = frame_rms_db(samples, sample_rate, frame_ms)
+            if len(energy_db):
+                if len(energy_db) >= len(smoothing):
+                    energy_db = np.convolve(energy_db, smoothing, mode='same')
+                quiet_frames = np.flatnonzero(energy_db <= energy_db.min() + SILENCE_PAUSE_MARGIN_DB)
+                candidates_ms = low + (quiet_frames + 0.5) * frame_ms
+                cut = int(candidates_ms[np.argmin(np.abs(candidates_ms - nominal))])
+        
+        if cut != nominal:
+            moved += 1
+        plan[i].end_ms = cut
+        plan[i + 1].start_ms = cut
+        previous_cut = cut
+    
+    return moved
+
+
+def compute_frame_rms_db(audio: "pydub.AudioSegment", frame_ms: int = SILENCE_FRAME_MS, block_frames: int = 30000) -> "np.ndarray":
+    """
+    Çözülmüş sesin tamamı için çerçeve başına RMS enerjisini (dBFS) hesaplar.
+    Bellek kullanımını sınırlamak için ham veri, çerçeve sınırlarına hizalı
+    bloklar halinde (kopyalamadan, memoryview ile) işlenir.
+    
+    Args:
+        audio: Çözülmüş ses
+        frame_ms: Çerçeve uzunluğu (ms)
+        block_frames: Tek seferde işlenecek çerçeve sayısı
+    
+    Returns:
+        Çerçeve başına dBFS değerleri
+    """
+    if audio.sample_width not in (1, 2, 4):
+        audio = audio.set_sample_width(2)
+    frame_bytes = max(1, int(audio.frame_rate * frame_ms / 1000)) * audio.frame_width
+    block_bytes = frame_bytes * block_frames
+    raw_view = memoryview(audio.raw_data)
+    
+    blocks = []
+    for offset in range(0, len(raw_view), block_bytes):
+        samples = pcm_to_mono_float(raw_view[offset:offset + block_bytes], audio.sample_width, audio.channels)
+        blocks.append(frame_rms_db(samples, audio.frame_rate, frame_ms))
+    if not blocks:
+        return np.empty(0, dtype=np.float32)
+    return np.concatenate(blocks)
+
+
+class OffsetMap:
+    """
+    VAD ile kırpılmış sesin zaman çizelgesini orijinal dosyanın zamanına eşler.
+    Kırpılmış seste art arda duran her tutulan bölüm, orijinaldeki
+    (başlangıç, bitiş) aralığıyla saklanır.
+    """
+    
+    def __init__(self, segments: list):
+        """
+        Args:
+            segments: Orijinal dosyada tutulan (start_ms, end_ms) aralıkları (sıralı)
+        """
+        self.segments = segments
+        self.trimmed_starts = []
+        position = 0
+        for start_ms, end_ms in segments:
+            self.trimmed_starts.append(position)
+            position += end_ms - start_ms
+        self.kept_ms = position
+    
+    def to_original(self, trimmed_ms: float) -> float:
+        """
+        Kırpılmış sesteki bir zamanı orijinal dosyadaki zamana çevirir.
+        
+        Args:
+            trimmed_ms: Kırpılmış sesteki zaman (ms)
+        
+        Returns:
+            Orijinal dosyadaki zaman (ms)
+        """
+        if not self.segments:
+            return trimmed_ms
+        index = max(0, bisect.bisect_right(self.trimmed_starts, trimmed_ms) - 1)
+        start_ms, end_ms = self.segments[index]
+        return min(start_ms + (trimmed_ms - self.trimmed_starts[index]), end_ms)
+
+
+def trim_non_speech(audio: "pydub.AudioSegment", min_silence_ms: int, keep_silence_ms: int = VAD_KEEP_SILENCE_MS) -> tuple:
+    """
+    Enerji tabanlı ses etkinliği tespiti (VAD) ile min_silence_ms'den uzun
+    konuşma dışı bölümleri keep_silence_ms uzunluğa indirir. Eşik, dosyanın
+    ortalama seviyesinin VAD_THRESHOLD_BELOW_AVERAGE_DB altıdır.
+    
+    Args:
+        audio: Çözülmüş ses
+        min_silence_ms: Kısaltılacak en kısa konuşma dışı bölüm (ms)
+        keep_silence_ms: Kısaltılan her bölümde bırakılacak sessizlik (ms)
+    
+    Returns:
+        (kırpılmış ses, OffsetMap) tuple
+    """
+    frame_ms = SILENCE_FRAME_MS
+    total_ms = len(audio)
+    energy_db = compute_frame_rms_db(audio, frame_ms)
+    if len(energy_db) == 0:
+        return audio, OffsetMap([(0, total_ms)])
+    
+    # Ortalama seviye: çerçeve güçlerinin ortalaması (dBFS)
+    average_db = 10 * np.log10(max(float(np.mean(np.power(10.0, energy_db / 10))), 1e-20))
+    threshold_db = average_db - VAD_THRESHOLD_BELOW_AVERAGE_DB
+    speech = energy_db > threshold_db
+    
+    # Konuşma dışı çerçeve dizilerinin başlangıç/bitiş indeksleri
+    edges = np.diff(np.concatenate(([1], speech.astype(np.int8), [1])))
+    run_starts = np.flatnonzero(edges == -1)
+    run_ends = np.flatnonzero(edges == 1)
+    min_frames = max(1, min_silence_ms // frame_ms)
+    long_runs = (run_ends - run_starts) >= min_frames
+    
+    # Uzun boşlukların ortasını çıkar, kenarlarda keep_silence_ms/2 bırak
+    half_keep_ms = keep_silence_ms // 2
+    segments = []
+    position = 0
+    for run_start, run_end in zip(run_starts[long_runs], run_ends[long_runs]):
+        cut_start = min(int(run_start) * frame_ms + half_keep_ms, total_ms)
+        cut_end = min(int(run_end) * frame_ms - half_keep_ms, total_ms)
+        if cut_end <= cut_start:
+            continue
+        if cut_start > position:
+            segments.append((position, cut_start))
+        position = cut_end
+    if position < total_ms:
+        segments.append((position, total_ms))
+    if not segments:
+        segments = [(0, min(keep_silence_ms, total_ms))]
+    
+    # Tutulan bölümlerin ham verisini tek seferde birleştir
+    frame_width = audio.frame_width
+    raw_view = memoryview(audio.raw_data)
+    
+    def byte_offset(ms):
+        return int(ms * audio.frame_rate / 1000) * frame_width
+    
+    trimmed_data = b''.join(raw_view[byte_offset(start):byte_offset(end)] for start, end in segments)
+    return audio._spawn(trimmed_data), OffsetMap(segments)
+
+
+def split_audio_file(audio_path: str, chunk_length_minutes: int = 5, max_size_mb: float = 20.0, audio=None, profile: str = 'wav', plan: list = None, output_dir: str = None) -> list:
+    """
+    Büyük ses dosyasını parçalara böler.
+    Parça süreleri plan_audio_chunks() ile önceden hesaplanır; her parça
+    25MB limitini aşmayacak uzunlukta bir kez kodlanır.
+    
+    Args:
+        audio_path: Ses dosyası yolu
+        chunk_length_minutes: Her parçanın uzunluğu (dakika cinsinden)
+        max_size_mb: Maksimum parça boyutu (MB, varsayılan: 20MB, limit: 25MB)
+        audio: Önceden çözülmüş AudioSegment (opsiyonel, verilmezse dosya çözülür)
+        profile: Parçaların kodlanacağı yükleme profili (UPLOAD_PROFILES)
+        plan: plan_audio_chunks() sonucu (opsiyonel). Verilirse parça yolları
+            bu listedeki ChunkSpec nesnelerine de yazılır.
+        output_dir: Parçaların yazılacağı dizin (varsayılan: sistem geçici dizini)
+    
+    Returns:
+        Parça dosya yollarının listesi
+    
+    Raises:
+        AudioProcessingError: Dosya çözülemez veya parçalar kodlanamazsa
+    """
+    try:
+        if audio is None:
+            audio = normalize_for_profile(pydub.AudioSegment.from_file(audio_path), profile)
+        if plan is None:
+            plan = plan_audio_chunks(len(audio), chunk_length_minutes, max_size_mb, profile,
+                                     audio.channels, audio.frame_rate, audio.sample_width, source_path=audio_path)
+        
+        for _ in iter_split_chunks(audio_path, audio, profile, plan, max_size_mb, output_dir):
+            pass
+        
+        return [spec.path for spec in plan]
+    except Exception as e:
+        raise AudioProcessingError(f"Ses dosyası parçalara bölünürken hata oluştu: {e}") from e
+
+
+def iter_split_chunks(audio_path: str, audio: "pydub.AudioSegment", profile: str, plan: list, max_size_mb: float = 20.0,
+                      output_dir: str = None, workspace: "Workspace" = None, in_memory: bool = False):
+    """
+    Çözülmüş sesi plana göre parça parça kodlar ve her parçayı hazır olur olmaz
+    yield eder; böylece ilk parçanın yüklemesi, sonraki parçalar kodlanırken başlar.
+    
+    Args:
+        audio_path: Kaynak ses dosyası yolu (parça adları için)
+        audio: Çözülmüş (profile göre normalize edilmiş) ses
+        profile: Parçaların kodlanacağı yükleme profili (UPLOAD_PROFILES)
+        plan: plan_audio_chunks() sonucu
+        max_size_mb: Maksimum parça boyutu (MB, yalnızca uyarı için)
+        output_dir: Parçaların yazılacağı dizin (varsayılan: çalışma alanı, yoksa sistem geçici dizini)
+        workspace: Disk bütçesi uygulanacak çalışma alanı (opsiyonel). Bütçe doluysa
+            bir sonraki parça, yüklenen parçalar silinene kadar kodlanmaz.
+        in_memory: True ise parçalar diske yazılmaz, spec.data içinde tutulur
+    
+    Yields:
+        Dosya yolu (veya bellek içi verisi) doldurulmuş ChunkSpec nesneleri (sırayla)
+    """
+    temp_dir = output_dir or (workspace.path if workspace is not None else tempfile.gettempdir())
+    base_name = Path(audio_path).stem
+    extension = UPLOAD_PROFILES[profile]['extension']
+    bytes_per_second = get_profile_bytes_per_second(profile, audio.channels, audio.frame_rate, audio.sample_width)
+    
+    for spec in plan:
+        # Kaynak dosya doğrudan yüklenecekse kodlama yapma
+        if spec.path is not None:
+            yield spec
+            continue
+        
+        if workspace is not None:
+            workspace.reserve_chunk(spec, int(bytes_per_second * spec.audio_duration_ms / 1000))
+        chunk = audio[spec.audio_start_ms:spec.audio_end_ms]
+        chunk_path = os.path.join(temp_dir, f"{base_name}_chunk_{spec.index:03d}{extension}")
+        if in_memory:
+            spec.data = export_chunk_bytes(chunk, profile)
+        else:
+            export_chunk(chunk, chunk_path, profile)
+        if spec.content_key is None:
+            spec.content_key = hash_audio_segment(chunk, profile)
+        spec.path = chunk_path
+        if workspace is not None:
+            workspace.settle_chunk(spec)
+        
+        chunk_size_mb = spec.size_bytes / (1024 * 1024)
+        if chunk_size_mb > max_size_mb:
+            print(f"UYARI: Parça {spec.index+1} tahmin edilenden büyük ({chunk_size_mb:.2f}MB).")
+        
+        yield spec
+
+
+def iter_audio_chunks(audio_path: str, chunk_length_minutes: int = 5, max_size_mb: float = 20.0, audio_info: dict = None, profile: str = 'wav', plan: list = None,
+                      output_dir: str = None, source_digest: str = None, workspace: "Workspace" = None, in_memory: bool = False):
+    """
+    Ses dosyasını belleğe yüklemeden ffmpeg ile parça parça keser (akış modu).
+    Her parça, kaynağın yalnızca ilgili zaman aralığı okunarak ayrı bir ffmpeg
+    çağrısıyla üretilir ve hazır olur olmaz yield edilir. Böylece bellek kullanımı
+    ses süresinden bağımsız olarak sabit kalır ve ilk parçanın transkripti,
+    sonraki parçalar kesilirken başlayabilir.
+    
+    Args:
+        audio_path: Ses dosyası yolu
+        chunk_length_minutes: Her parçanın uzunluğu (dakika cinsinden)
+        max_size_mb: Maksimum parça boyutu (MB, varsayılan: 20MB, limit: 25MB)
+        audio_info: probe_audio_info() sonucu (opsiyonel, verilmezse ffprobe ile okunur)
+        profile: Parçaların kodlanacağı yükleme profili (UPLOAD_PROFILES)
+        plan: plan_audio_chunks() sonucu (opsiyonel, verilmezse hesaplanır)
+        output_dir: Parçaların yazılacağı dizin (varsayılan: çalışma alanı, yoksa sistem geçici dizini)
+        source_digest: Kaynak dosyanın hash_file() özeti (opsiyonel, gerekirse hesaplanır)
+        workspace: Disk bütçesi uygulanacak çalışma alanı (opsiyonel)
+        in_memory: True ise ffmpeg çıktısı diske yazılmaz, stdout'tan spec.data içine okunur
+    
+    Yields:
+        Dosya yolu (veya bellek içi verisi) doldurulmuş ChunkSpec nesneleri (sırayla)
+    """
+    if audio_info is None:
+        audio_info = probe_audio_info(audio_path)
+    if plan is None:
+        # ffmpeg WAV çıkışı 16-bit PCM'dir
+        plan = plan_audio_chunks(audio_info['duration_ms'], chunk_length_minutes, max_size_mb, profile,
+                                 audio_info['channels'], audio_info['sample_rate'], source_path=audio_path)
+    
+    temp_dir = output_dir or (workspace.path if workspace is not None else tempfile.gettempdir())
+    bytes_per_second = get_profile_bytes_per_second(profile, audio_info['channels'], audio_info['sample_rate'])
+    base_name = Path(audio_path).stem
+    extension = UPLOAD_PROFILES[profile]['extension']
+    profile_args = get_ffmpeg_profile_args(profile)
+    
+    settings = UPLOAD_PROFILES[profile]
+    pipe_is_wav = in_memory and settings['format'] == 'wav'
+    if pipe_is_wav:
+        # WAV başlığındaki boyutlar boruya doğru yazılamaz; ham PCM alınıp Python'da sarılır
+        wav_channels = settings['channels'] or audio_info['channels']
+        wav_rate = settings['sample_rate'] or audio_info['sample_rate']
+        profile_args = ['-ac', str(wav_channels), '-ar', str(wav_rate), '-c:a', 'pcm_s16le', '-f', 's16le']
+    
+    for spec in plan:
+        # Kaynak dosya doğrudan yüklenecekse kesme yapma
+        if spec.path is not None:
+            yield spec
+            continue
+        
+        # Parça kimliği: kaynak dosyanın özeti + zaman aralığı + profil
+        if source_digest is None:
+            source_digest = hash_source_file(audio_path)
+        spec.content_key = get_chunk_content_key(spec, profile, source_digest=source_digest)
+        
+        chunk_path = os.path.join(temp_dir, f"{base_name}_chunk_{spec.index:03d}{extension}")
+        if workspace is not None:
+            workspace.reserve_chunk(spec, int(bytes_per_second * spec.audio_duration_ms / 1000))
+        
+        # -ss/-t giriş tarafında verilir: ffmpeg yalnızca bu aralığı çözer
+        command = [
+            pydub.AudioSegment.converter, '-nostdin', '-v', 'error', '-y',
+            '-ss', f"{spec.audio_start_ms / 1000:.3f}", '-t', f"{spec.audio_duration_ms / 1000:.3f}",
+            '-i', audio_path, '-vn', *profile_args, 'pipe:1' if in_memory else chunk_path,
+        ]
+        result = subprocess.run(command, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg parça {spec.index+1} kesilemedi: {result.stderr.decode('utf-8', 'replace').strip()}")
+        if pipe_is_wav:
+            spec.data = pcm_to_wav_bytes(result.stdout, wav_channels, wav_rate)
+        elif in_memory:
+            spec.data = result.stdout
+        
+        spec.path = chunk_path
+        if workspace is not None:
+            workspace.settle_chunk(spec)
+        
+        chunk_size_mb = spec.size_bytes / (1024 * 1024)
+        if chunk_size_mb > max_size_mb:
+            print(f"UYARI: Parça {spec.index+1} tahmin edilenden büyük ({chunk_size_mb:.2f}MB).")
+        
+        yield spec
+
+
+class StageStats:
+    """
+    Boru hattının bir aşamasının (indirme, çözme, parçalama, yükleme) işlediği
+    öğe sayısını, çalışma süresini ve bekleme süresini toplar. Aşamanın ilk
+    başladığı ve son bittiği anlar da tutulur; aşamaların zaman aralıkları
+    karşılaştırılarak ne kadar örtüştükleri görülebilir. Birden fazla iş
+    parçacığından güvenle kullanılabilir.
+    """
+    
+    def __init__(self, name: str, wait_label: str = "bekleme"):
+        """
+        Args:
+            name: Aşama adı
+            wait_label: Bekleme süresinin raporda nasıl adlandırılacağı
+        """
+        self.name = name
+        self.wait_label = wait_label
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.first_start = None
+        self.last_end = None
+        self.lock = threading.Lock()
+    
+    def record(self, started: float, finished: float, items: int = 1):
+        """
+        Tamamlanan bir çalışma aralığını kaydeder.
+        
+        Args:
+            started: Başlangıç zamanı (time.perf_counter)
+            finished: Bitiş zamanı (time.perf_counter)
+            items: İşlenen öğe sayısı
+        """
+        with self.lock:
+            self.items += items
+            self.busy_seconds += finished - started
+            self.first_start = started if self.first_start is None else min(self.first_start, started)
+            self.last_end = finished if self.last_end is None else max(self.last_end, finished)
+    
+    def record_wait(self, seconds: float):
+        """Aşamanın girdi beklediği veya çıktısını bırakamadığı süreyi ekler."""
+        with self.lock:
+            self.wait_seconds += seconds
+    
+    @contextmanager
+    def measure(self, items: int = 1):
+        """with bloğunun süresini bu aşamanın çalışma süresi olarak kaydeder."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(started, time.perf_counter(), items)
+
+
+class PipelineTimings:
+    """
+    Bir transkript işinin aşama sürelerini toplayan ve raporlayan sınıf.
+    Zamanlar işin başlangıcına (veya verilen başlangıç anına) göre verilir.
+    """
+    
+    def __init__(self, origin: float = None):
+        """
+        Args:
+            origin: Zamanların ölçüleceği time.perf_counter() anı (varsayılan: şimdi).
+                Komut satırı STARTUP_TIME verir; ilk yükleme süresi süreç başlangıcını da içerir.
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self.stages = {}
+        self.lock = threading.Lock()
+    
+    def stage(self, name: str, wait_label: str = "bekleme") -> StageStats:
+        """
+        Aşamanın istatistik nesnesini döndürür (yoksa oluşturur).
+        
+        Args:
+            name: Aşama adı
+            wait_label: Bekleme süresinin raporda nasıl adlandırılacağı
+        
+        Returns:
+            StageStats
+        """
+        with self.lock:
+            if name not in self.stages:
+                self.stages[name] = StageStats(name, wait_label)
+            return self.stages[name]
+    
+    def report(self, title: str = None):
+        """
+        Aşama sürelerini tek seferde yazdırır (toplu modda satırlar karışmasın diye).
+        
+        Args:
+            title: Rapor başlığına eklenecek metin (ör. dosya adı, opsiyonel)
+        """
+        lines = [f"Aşama zamanlaması{f' ({title})' if title else ''}, başlangıçtan itibaren saniye:"]
+        for stage in self.stages.values():
+            if stage.items == 0:
+                continue
+            line = (f"  {stage.name:<10} {stage.items:>3} öğe, {stage.busy_seconds:7.2f} sn çalışma, "
+                    f"{stage.first_start - self.origin:7.2f} → {stage.last_end - self.origin:7.2f}")
+            if stage.wait_seconds >= 0.01:
+                line += f", {stage.wait_seconds:.2f} sn {stage.wait_label}"
+            lines.append(line)
+        upload_stage = self.stages.get("yükleme")
+        if upload_stage is not None and upload_stage.first_start is not None:
+            lines.append(f"  İlk parçanın yüklemesi {upload_stage.first_start - self.origin:.2f}. saniyede başladı")
+        text_stage = self.stages.get("metin")
+        if text_stage is not None and text_stage.first_start is not None:
+            lines.append(f"  İlk metin {text_stage.first_start - self.origin:.2f}. saniyede hazırdı")
+        if len(lines) > 1:
+            print("\n".join(lines))
+
+
+class ChunkQueue:
+    """
+    Parça üretimini (kesme/kodlama) yüklemeden ayıran sınırlı kuyruk.
+    
+    Üretici ayrı bir iş parçacığında çalışır ve her parçayı hazır olur olmaz
+    tüketiciye verir; ilk parçanın yüklemesi, kalan parçalar kodlanırken başlar.
+    Kodlanmış ama yüklemesi bitmemiş parça sayısı max_pending ile sınırlanır:
+    yükleme geride kalırsa üretici bekler (geri basınç), böylece diskte biriken
+    parça dosyaları sınırlı kalır. Tüketici her parçanın yüklemesi bitince done()
+    çağırır; çalışma alanı verildiyse parça dosyası o anda silinir. Tüketiciye
+    verilen ve done() çağrılmamış parçalar çalışma alanında pin'li kalır.
+    """
+    
+    _END = object()
+    
+    def __init__(self, chunks, max_pending: int, produce_stage: StageStats, workspace: "Workspace" = None):
+        """
+        Args:
+            chunks: ChunkSpec üreteci (iter_split_chunks veya iter_audio_chunks)
+            max_pending: Aynı anda üretilmiş ama yüklemesi bitmemiş en fazla parça sayısı
+            produce_stage: Üretim süreleri ve geri basınç beklemesinin kaydedileceği aşama
+            workspace: Yüklenen parça dosyalarının silineceği çalışma alanı (opsiyonel)
+        """
+        self.slots = threading.Semaphore(max(1, max_pending))
+        self.queue = queue.Queue()
+        self.stopped = threading.Event()
+        self.error = None
+        self.produce_stage = produce_stage
+        self.workspace = workspace
+        self.thread = threading.Thread(target=self._produce, args=(iter(chunks),), daemon=True)
+        self.thread.start()
+    
+    def _produce(self, iterator):
+        """Üretici iş parçacığı: yer açıldıkça bir sonraki parçayı üretir."""
+        try:
+            while True:
+                wait_start = time.perf_counter()
+                while not self.slots.acquire(timeout=0.1):
+                    if self.stopped.is_set():
+                        return
+                started = time.perf_counter()
+                self.produce_stage.record_wait(started - wait_start)
+                if self.stopped.is_set():
+                    return
+                spec = next(iterator, None)
+                if spec is None:
+                    break
+                self.produce_stage.record(started, time.perf_counter())
+                self.queue.put(spec)
+        except BaseException as e:
+            self.error = e
+        self.queue.put(self._END)
+    
+    def __iter__(self):
+        """Parçaları üretim sırasıyla döndürür; üreticide hata olduysa burada yükseltir."""
+        while True:
+            item = self.queue.get()
+            if item is self._END:
+                if self.error is not None:
+                    raise self.error
+                return
+            if self.workspace is not None:
+                self.workspace.pin()
+            yield item
+    
+    def done(self, spec: ChunkSpec):
+        """
+        Bir parçanın yüklemesi bittiğinde (başarılı, başarısız veya iptal) çağrılır;
+        yanıt döndükten sonra da süren bir istek varsa o bittiğinde.
+        Parça dosyası silinir ve üreticiye yeni parça için yer açılır.
+        
+        Args:
+            spec: Yüklemesi biten parça
+        """
+        if self.workspace is not None:
+            self.workspace.discard_chunk(spec)
+            self.workspace.unpin()
+        self.slots.release()
+    
+    def close(self):
+        """
+        Üreticiyi durdurur ve bitmesini bekler (tüketici bitirdiğinde veya yarıda
+        bıraktığında). Çalışma alanı bütçesini bekleyen üretici de uyandırılır.
+        """
+        self.stopped.set()
+        if self.workspace is not None:
+            self.workspace.close()
+        self.thread.join()
+
+
+class ChunkLease:
+    """
+    Bir parçanın kullanım sayacı. Parçayı yükleyen iş bir kullanımla başlar;
+    yanıt döndükten sonra da süren istekler (ör. geç kalan yedek istek) hold()
+    ile ek kullanım alır. Son kullanım bırakılınca on_release bir kez çağrılır
+    (ChunkQueue.done: parça dosyası silinir, üreticiye yer açılır).
+    """
+    
+    def __init__(self, on_release):
+        """
+        Args:
+            on_release: Son kullanım bırakılınca çağrılacak fonksiyon
+        """
+        self.on_release = on_release
+        self.count = 1
+        self.lock = threading.Lock()
+    
+    def hold(self):
+        """
+        Ek bir kullanım alır.
+        
+        Returns:
+            Kullanım bitince çağrılacak fonksiyon (release)
+        """
+        with self.lock:
+            self.count += 1
+        return self.release
+    
+    def release(self):
+        """Bir kullanımı bırakır; son kullanımsa on_release çağrılır."""
+        with self.lock:
+            self.count -= 1
+            last = self.count == 0
+        if last:
+            self.on_release()
+
+
+class ChunkReorderBuffer:
+    """
+    Sırasız tamamlanan parça transkriptlerini sıraya koyan tampon.
+    
+    Bir parçanın metni, kendisinden önceki tüm parçalar tamamlandığı anda
+    callback'e iletilir; böylece uzun bir dosyada ilk metin tüm dosyanın değil
+    ilk parçanın süresi kadar sonra görünür. Callback lock altında çağrıldığından
+    birden fazla iş parçacığından gelen metinler her zaman sırayla iletilir.
+    """
+    
+    def __init__(self, callback):
+        """
+        Args:
+            callback: (chunk_index, text) ile sırayla çağrılacak fonksiyon
+        """
+        self.callback = callback
+        self.next_index = 0
+        self.pending = {}
+        self.lock = threading.Lock()
+    
+    def put(self, chunk_index: int, text: str):
+        """
+        Tamamlanan parçanın metnini ekler ve sırası gelen metinleri iletir.
+        
+        Args:
+            chunk_index: Parça indeksi (0-based)
+            text: Transkript metni
+        """
+        with self.lock:
+            self.pending[chunk_index] = text
+            while self.next_index in self.pending:
+                self.callback(self.next_index, self.pending.pop(self.next_index))
+                self.next_index += 1
+
+
+def hash_file(path: str) -> str:
+    """
+    Dosya içeriğinin SHA-256 özetini döndürür (dosya bloklar halinde okunur).
+    
+    Args:
+        path: Dosya yolu
+    
+    Returns:
+        Hex SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Kaynak dosya özetleri için süreç içi önbellek: (gerçek yol, boyut, mtime_ns) -> özet
+_SOURCE_DIGESTS = {}
+_SOURCE_DIGESTS_LOCK = threading.Lock()
+
+
+def hash_source_file(path: str) -> str:
+    """
+    Kaynak dosyanın hash_file() özetini, dosya değişmediyse yeniden okumadan döndürür.
+    Özetler (gerçek yol, boyut, değiştirilme zamanı) ile süreç içinde ve önbellek
+    dizinindeki digests/ altında saklanır; boyut veya zaman değişince dosya yeniden okunur.
+    
+    Args:
+        path: Dosya yolu
+    
+    Returns:
+        Hex SHA-256 özeti
+    """
+    real_path = os.path.realpath(path)
+    stat = os.stat(real_path)
+    identity = (real_path, stat.st_size, stat.st_mtime_ns)
+    with _SOURCE_DIGESTS_LOCK:
+        digest = _SOURCE_DIGESTS.get(identity)
+    if digest is not None:
+        return digest
+    
+    record_path = os.path.join(get_cache_dir(), "digests",
+                               hashlib.sha256(real_path.encode('utf-8')).hexdigest()[:32] + ".json")
+    try:
+        with open(record_path, "r", encoding="utf-8") as f:
+            record = json.load(f)
+        if (record.get('path'), record.get('size'), record.get('mtime_ns')) == identity:
+            digest = record.get('digest')
+    except (OSError, ValueError):
+        pass
+    
+    if digest is None:
+        digest = hash_file(real_path)
+        try:
+            os.makedirs(os.path.dirname(record_path), exist_ok=True)
+            temp_path = f"{record_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({'path': real_path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                           'digest': digest}, f)
+            os.replace(temp_path, record_path)
+        except OSError:
+            pass  # Özet kaydı yalnızca hızlandırma içindir
+    
+    with _SOURCE_DIGESTS_LOCK:
+        _SOURCE_DIGESTS[identity] = digest
+    return digest
+
+
+def hash_audio_segment(segment: "pydub.AudioSegment", profile: str) -> str:
+    """
+    Çözülmüş ses parçasının PCM verisi ve yükleme profilinden içerik özeti üretir.
+    Kodlanmış dosya yerine PCM özetlenir; böylece kodlayıcının her seferinde
+    farklı ürettiği konteyner alanları (ör. Ogg seri numarası) anahtarı değiştirmez.
+    
+    Args:
+        segment: Ses parçası
+        profile: Yükleme profili
+    
+    Returns:
+        Hex SHA-256 özeti
+    """
+    digest = hashlib.sha256(f"{profile}:{segment.frame_rate}:{segment.channels}:{segment.sample_width}:".encode('utf-8'))
+    digest.update(segment.raw_data)
+    return digest.hexdigest()
+
+
+def get_chunk_content_key(spec: ChunkSpec, profile: str, audio: "pydub.AudioSegment" = None, source_digest: str = None) -> str:
+    """
+    Parçanın içerik kimliğini kodlamadan önce hesaplar (önbellek anahtarı için).
+    Çözülmüş ses verilirse parçanın PCM özeti (hash_audio_segment), verilmezse
+    (akış modu) kaynak dosyanın özeti ile parçanın zaman aralığı kullanılır.
+    
+    Args:
+        spec: Parça
+        profile: Yükleme profili
+        audio: Çözülmüş (profile göre normalize edilmiş) ses (opsiyonel)
+        source_digest: Kaynak dosyanın hash_source_file() özeti (audio verilmezse gerekli)
+    
+    Returns:
+        İçerik kimliği
+    """
+    if audio is not None:
+        return hash_audio_segment(audio[spec.audio_start_ms:spec.audio_end_ms], profile)
+    return f"{source_digest}:{spec.audio_start_ms}-{spec.audio_end_ms}:{profile}"
+
+
+def get_cache_dir() -> str:
+    """
+    Uygulamanın kalıcı önbellek dizinini döndürür (yoksa oluşturur).
+    BOTYUM_CACHE_DIR ortam değişkeni ile değiştirilebilir.
+    
+    Returns:
+        Önbellek dizini yolu
+    """
+    cache_dir = os.getenv("BOTYUM_CACHE_DIR")
+    if not cache_dir:
+        if sys.platform == 'win32' and os.getenv("LOCALAPPDATA"):
+            cache_dir = os.path.join(os.getenv("LOCALAPPDATA"), "botyum-transcript")
+        else:
+            base_dir = os.getenv("XDG_CACHE_HOME") or os.path.join(str(Path.home()), ".cache")
+            cache_dir = os.path.join(base_dir, "botyum-transcript")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+class Workspace:
+    """
+    Tek bir işin geçici dosyaları (indirilen ses, kodlanan parçalar) için
+    özel bir dizin. Aynı anda çalışan işler (aynı dosya adıyla bile) birbirinin
+    dosyalarının üzerine yazamaz.
+    
+    Dizin base_dir altında oluşturulur; tmpfs/RAM diski (ör. /dev/shm) verilerek
+    parçaların diske hiç yazılmaması sağlanabilir. max_bytes verilirse kodlanmış
+    ama yüklemesi bitmemiş parçaların (bellek içi modda bellekteki parça
+    verilerinin) toplam boyutu bu bütçeyle sınırlanır:
+    parçalayıcı, yüklenen parçalar silinip yer açılana kadar bekler.
+    
+    cleanup() her çıkış yolunda (normal bitiş, hata, sys.exit, Ctrl-C) dizini
+    siler; çağrılmadan kalan çalışma alanları işlem sonunda atexit ile silinir.
+    Yüklemesi süren parçalar (ör. geç kalan yedek istek) pin() ile işaretlenir;
+    bu sırada çağrılan cleanup() dizini son parça unpin() edilince siler.
+    Tüketici hata verince veya iş iptal edilince close() çağrılır: bütçe
+    beklemesindeki parçalayıcı uyanır ve hata fırlatarak durur.
+    """
+    
+    _active = set()
+    _active_lock = threading.Lock()
+    
+    def __init__(self, base_dir: str = None, max_bytes: int = 0):
+        """
+        Args:
+            base_dir: Çalışma alanının oluşturulacağı dizin (varsayılan:
+                BOTYUM_WORKSPACE_DIR ortam değişkeni, yoksa sistem geçici dizini)
+            max_bytes: Diskte bekleyen parçaların toplam boyut sınırı (0 ise sınırsız)
+        """
+        base_dir = base_dir or os.getenv("BOTYUM_WORKSPACE_DIR") or None
+        if base_dir:
+            os.makedirs(base_dir, exist_ok=True)
+        self.path = tempfile.mkdtemp(prefix=WORKSPACE_DIR_PREFIX, dir=base_dir)
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.peak_bytes = 0
+        self.wait_seconds = 0.0
+        self.pinned = 0
+        self.cleanup_pending = False
+        self.closed = False
+        self.condition = threading.Condition()
+        with Workspace._active_lock:
+            Workspace._active.add(self)
+    
+    def subdir(self, name: str) -> str:
+        """
+        Çalışma alanı içinde bir alt dizin oluşturur.
+        
+        Args:
+            name: Alt dizin adı
+        
+        Returns:
+            Alt dizinin yolu
+        """
+        path = os.path.join(self.path, name)
+        os.makedirs(path, exist_ok=True)
+        return path
+    
+    def contains(self, path: str) -> bool:
+        """Dosya bu çalışma alanının içindeyse True döndürür."""
+        return path is not None and os.path.abspath(path).startswith(os.path.abspath(self.path) + os.sep)
+    
+    def reserve_chunk(self, spec: ChunkSpec, estimated_bytes: int):
+        """
+        Kodlanacak parça için bütçeden yer ayırır; bütçe doluysa yer açılana kadar bekler.
+        Bütçeden büyük tek bir parça, çalışma alanı boşken yine de kabul edilir.
+        
+        Args:
+            spec: Kodlanacak parça
+            estimated_bytes: Parçanın tahmini boyutu
+        
+        Raises:
+            TranscriptionError: Çalışma alanı close() ile kapatıldıysa (tüketici durdu)
+        """
+        with self.condition:
+            wait_start = time.perf_counter()
+            while not self.closed and self.max_bytes and self.used_bytes > 0 and self.used_bytes + estimated_bytes > self.max_bytes:
+                self.condition.wait(0.1)
+            self.wait_seconds += time.perf_counter() - wait_start
+            if self.closed:
+                raise TranscriptionError("Çalışma alanı kapatıldı, parça üretimi durduruldu.")
+            self._set_reservation(spec, estimated_bytes)
+    
+    def settle_chunk(self, spec: ChunkSpec):
+        """Parça yazıldıktan sonra ayrılan yeri dosyanın gerçek boyutuyla günceller."""
+        with self.condition:
+            self._set_reservation(spec, spec.size_bytes)
+    
+    def discard_chunk(self, spec: ChunkSpec):
+        """
+        Yüklemesi biten parçanın dosyasını (bellek içi modda verisini) siler ve
+        bütçedeki yerini bırakır. Kaynak dosya gibi çalışma alanı dışındaki
+        dosyalara dokunulmaz.
+        
+        Args:
+            spec: Parça
+        """
+        if spec.data is not None:
+            spec.data = None
+            spec.path = None
+        elif self.contains(spec.path):
+            try:
+                os.remove(spec.path)
+            except OSError:
+                pass
+            spec.path = None
+        with self.condition:
+            self._set_reservation(spec, 0)
+            self.condition.notify_all()
+    
+    def _set_reservation(self, spec: ChunkSpec, nbytes: int):
+        """Parçanın bütçedeki payını günceller (lock altında çağrılır)."""
+        self.used_bytes += nbytes - spec.reserved_bytes
+        spec.reserved_bytes = nbytes
+        self.peak_bytes = max(self.peak_bytes, self.used_bytes)
+    
+    def report(self):
+        """En yüksek disk kullanımını ve bütçe beklemesini yazdırır."""
+        if not self.peak_bytes:
+            return
+        line = f"Çalışma alanı: en yüksek {self.peak_bytes / (1024 * 1024):.1f} MB parça"
+        if self.max_bytes:
+            line += f" (bütçe {self.max_bytes / (1024 * 1024):.0f} MB, {self.wait_seconds:.2f} saniye bütçe beklemesi)"
+        print(line)
+    
+    def close(self):
+        """Yeni parça kabul etmeyi bırakır; bütçe bekleyen parçalayıcıyı uyandırır (birden fazla çağrılabilir)."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+    
+    def pin(self):
+        """Bir parçanın hâlâ kullanımda olduğunu işaretler (ChunkQueue)."""
+        with self.condition:
+            self.pinned += 1
+    
+    def unpin(self):
+        """pin() ile işaretlenen parçanın kullanımı bittiğinde çağrılır; bekleyen silme yapılır."""
+        with self.condition:
+            self.pinned -= 1
+            run_cleanup = self.pinned == 0 and self.cleanup_pending
+        if run_cleanup:
+            self.cleanup()
+    
+    def cleanup(self, force: bool = False):
+        """
+        Çalışma alanı dizinini tüm içeriğiyle siler (birden fazla çağrılabilir).
+        Kullanımda parça varsa silme son parça bırakılana kadar ertelenir.
+        
+        Args:
+            force: True ise kullanımdaki parçalar beklenmez (işlem sonu)
+        """
+        self.close()
+        with self.condition:
+            if self.pinned and not force:
+                self.cleanup_pending = True
+                return
+            self.cleanup_pending = False
+        shutil.rmtree(self.path, ignore_errors=True)
+        with Workspace._active_lock:
+            Workspace._active.discard(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.cleanup()
+    
+    @classmethod
+    def cleanup_all(cls):
+        """Silinmemiş tüm çalışma alanlarını siler (atexit)."""
+        with cls._active_lock:
+            workspaces = list(cls._active)
+        for workspace in workspaces:
+            workspace.cleanup(force=True)
+
+
+atexit.register(Workspace.cleanup_all)
+
+
+class TranscriptCache:
+    """
+    Parça transkriptlerini kalıcı olarak saklayan, içerik adresli SQLite önbelleği.
+    
+    Anahtar; parçanın içerik özeti (content_key) ile model ve istek
+    parametrelerinden oluşur. İçerik özeti kodlanmış dosyanın değil, çözülmüş
+    PCM verisinin ve yükleme profilinin özetidir (hash_audio_segment; akış
+    modunda kaynak dosya özeti ve parça aralığı). Bu yüzden aynı parçanın
+    yeniden kodlanması önbelleği geçersiz kılmaz; profil veya ses içeriği
+    değişirse anahtar değişir. Aynı ses tekrar işlendiğinde API çağrısı
+    yapılmadan önbellekteki metin kullanılır. Toplam
+    boyut max_size_mb'yi aşarsa en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+    Birden fazla iş parçacığından güvenle kullanılabilir.
+    """
+    
+    def __init__(self, path: str = None, max_size_mb: float = DEFAULT_CACHE_MAX_MB):
+        """
+        Args:
+            path: SQLite dosya yolu (varsayılan: önbellek dizininde transcripts.sqlite3)
+            max_size_mb: Önbelleğin en büyük boyutu (MB)
+        """
+        if path is None:
+            path = os.path.join(get_cache_dir(), "transcripts.sqlite3")
+        self.path = path
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            " key TEXT PRIMARY KEY,"
+            " text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON transcripts(last_access)")
+        self.connection.commit()
+    
+    @staticmethod
+    def make_key(content_key: str, params: dict) -> str:
+        """
+        Parçanın ses içeriği özeti ve istek parametrelerinden önbellek anahtarı üretir.
+        
+        Args:
+            content_key: Parçanın normalize edilmiş ses içeriğini tanımlayan özet
+            params: Model ve istek parametreleri
+        
+        Returns:
+            Hex SHA-256 anahtarı
+        """
+        digest = hashlib.sha256(content_key.encode('utf-8'))
+        digest.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> str:
+        """
+        Anahtara ait transkripti döndürür ve son erişim zamanını günceller.
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            Transkript metni, yoksa None
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT text FROM transcripts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.connection.execute("UPDATE transcripts SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+            return row[0]
+    
+    def put(self, key: str, text: str):
+        """
+        Transkripti önbelleğe yazar ve gerekirse eski kayıtları siler.
+        
+        Args:
+            key: Önbellek anahtarı
+            text: Transkript metni
+        """
+        now = time.time()
+        size = len(text.encode('utf-8')) + len(key)
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO transcripts (key, text, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, text, size, now, now)
+            )
+            self._evict()
+            self.connection.commit()
+    
+    def _evict(self):
+        """Toplam boyut sınırı aşıldıysa en eski erişilen kayıtları siler (lock altında çağrılır)."""
+        total_size = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+        rows = self.connection.execute("SELECT key, size FROM transcripts ORDER BY last_access ASC").fetchall()
+        stale_keys = []
+        for key, size in rows:
+            if total_size <= self.max_size_bytes:
+                break
+            stale_keys.append((key,))
+            total_size -= size
+        self.connection.executemany("DELETE FROM transcripts WHERE key = ?", stale_keys)
+        self.evictions += len(stale_keys)
+    
+    def report(self):
+        """İsabet/ıskalama istatistiklerini yazdırır."""
+        total = self.hits + self.misses
+        if total == 0:
+            return
+        print(f"Önbellek: {self.hits} isabet, {self.misses} ıskalama "
+              f"(%{100 * self.hits / total:.0f} isabet oranı, {self.evictions} kayıt silindi)")
+    
+    def close(self):
+        """Veritabanı bağlantısını kapatır."""
+        with self.lock:
+            self.connection.close()
+
+
+class JobManifest:
+    """
+    Bir transkript işinin parça parça ilerlemesini diske yazan kontrol noktası.
+    
+    İş dizini (önbellek dizini altında jobs/<anahtar>) kaynak dosyanın özeti,
+    kaynağın kimliği (gerçek dosya yolu veya URL) ve parça düzenini etkileyen
+    ayarlardan türetilir; aynı içerikli iki dosya (ör. aynı toplu işte) birbirinin
+    iş dizinini silmez. Kodlanan parça dosyaları
+    burada değil, işin geçici çalışma alanında (Workspace) tutulur ve yüklendikten
+    sonra silinir. Her parça tamamlandığında manifest.json atomik olarak
+    yeniden yazılır, böylece işlem yarıda kesilirse (ağ hatası, Ctrl-C, sys.exit)
+    --resume ile yalnızca eksik parçalar işlenir. İş başarıyla bittiğinde dizin silinir.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, source_digest: str, settings: dict, source_key: str = ""):
+        """
+        Args:
+            source_digest: Kaynak dosyanın hash_file() özeti
+            settings: Parça düzenini ve transkripti etkileyen ayarlar
+            source_key: Kaynağın kimliği (gerçek dosya yolu veya URL)
+        """
+        job_key = hashlib.sha256(
+            (source_digest + "\0" + source_key + "\0" + json.dumps(settings, sort_keys=True)).encode('utf-8')
+        ).hexdigest()[:16]
+        self.job_dir = os.path.join(get_cache_dir(), "jobs", job_key)
+        self.path = os.path.join(self.job_dir, "manifest.json")
+        self.source_digest = source_digest
+        self.settings = settings
+        self.source_path = None
+        self.plan = []
+        self.transcripts = {}
+        self.lock = threading.Lock()
+    
+    def load(self) -> bool:
+        """
+        Önceki çalıştırmadan kalan manifest'i okur.
+        
+        Returns:
+            Kullanılabilir bir manifest bulunduysa True
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != self.VERSION or data.get('source_digest') != self.source_digest:
+            return False
+        self.plan = [ChunkSpec(index=c['index'], start_ms=c['start_ms'], end_ms=c['end_ms'],
+                               path=c.get('file'), content_key=c.get('content_key'),
+                               lead_ms=c.get('lead_ms', 0), tail_ms=c.get('tail_ms', 0))
+                     for c in data.get('chunks', [])]
+        self.transcripts = {int(index): text for index, text in data.get('transcripts', {}).items()}
+        return bool(self.plan)
+    
+    def restore_plan(self, source_path: str) -> list:
+        """
+        Manifest'teki parça düzenini döndürür. Parça dosyaları önceki çalıştırmanın
+        çalışma alanıyla birlikte silindiğinden eksik parçalar yeniden kodlanır;
+        yalnızca doğrudan yüklenen kaynak dosyanın yolu güncellenir.
+        
+        Args:
+            source_path: Doğrudan yüklenecek parçalar için güncel kaynak dosya yolu
+        
+        Returns:
+            ChunkSpec listesi
+        """
+        self.source_path = source_path
+        for spec in self.plan:
+            spec.path = source_path if spec.path == "" else None
+        return self.plan
+    
+    def start(self, plan: list, source_path: str):
+        """
+        Yeni bir iş başlatır: eski iş dizinini siler ve parça düzenini kaydeder.
+        
+        Args:
+            plan: ChunkSpec listesi (parça yolları doldukça manifest'e yansır)
+            source_path: Kaynak dosya yolu (doğrudan yüklenen parçayı ayırt etmek için)
+        """
+        self.discard()
+        os.makedirs(self.job_dir, exist_ok=True)
+        self.plan = plan
+        self.source_path = source_path
+        self.transcripts = {}
+        with self.lock:
+            self._save()
+    
+    def mark_done(self, chunk_index: int, text: str):
+        """
+        Parça transkriptini kaydeder ve manifest'i diske yazar.
+        
+        Args:
+            chunk_index: Parça indeksi
+            text: Transkript metni
+        """
+        with self.lock:
+            self.transcripts[chunk_index] = text
+            self._save()
+    
+    def mark_all_done(self, transcripts: dict):
+        """
+        Birden fazla parçanın transkriptini kaydeder; manifest diske bir kez yazılır.
+        
+        Args:
+            transcripts: Parça indeksi -> transkript metni sözlüğü
+        """
+        with self.lock:
+            self.transcripts.update(transcripts)
+            self._save()
+    
+    def _save(self):
+        """Manifest'i geçici dosyaya yazıp yerine taşır (lock altında çağrılır)."""
+        chunks = []
+        for spec in self.plan:
+            if spec.path is None:
+                file_name = None
+            elif spec.path == self.source_path:
+                file_name = ""  # Kaynak dosya doğrudan yükleniyor
+            else:
+                file_name = os.path.basename(spec.path)
+            chunks.append({'index': spec.index, 'start_ms': spec.start_ms, 'end_ms': spec.end_ms,
+                           'lead_ms': spec.lead_ms, 'tail_ms': spec.tail_ms,
+                           'file': file_name, 'content_key': spec.content_key})
+        data = {
+            'version': self.VERSION,
+            'source_digest': self.source_digest,
+            'settings': self.settings,
+            'chunks': chunks,
+            'transcripts': {str(index): text for index, text in self.transcripts.items()},
+        }
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+    
+    @property
+    def is_complete(self) -> bool:
+        """Tüm parçaların transkripti kaydedildiyse True."""
+        return bool(self.plan) and len(self.transcripts) == len(self.plan)
+    
+    def discard(self):
+        """İş dizinini (manifest) siler."""
+        shutil.rmtree(self.job_dir, ignore_errors=True)
+
+
+# Aynı süreçteki işlerin latency_model.json dosyasını sırayla güncellemesi için
+_LATENCY_MODEL_SAVE_LOCK = threading.Lock()
+
+
+class LatencyModel:
+    """
+    Bir yükleme profili için API isteği süresinin parça süresine göre ölçülmüş
+    doğrusal modeli: istek süresi ≈ taban + saniye başına süre × parça süresi.
+    
+    Yalnızca gecikme planı (--chunk-plan latency) veya yedek istekler (--hedge)
+    açıkken kullanılır. Her başarılı isteğin süresi kaydedilir; son
+    LATENCY_MODEL_MAX_SAMPLES ölçüm önbellek dizinindeki latency_model.json
+    dosyasında saklanır ve katsayılar en küçük kareler yöntemiyle bulunur.
+    Yeterli ölçüm yoksa varsayılan katsayılar kullanılır. Birden fazla iş parçacığından güvenle kullanılabilir.
+    """
+    
+    def __init__(self, profile: str, path: str = None):
+        """
+        Args:
+            profile: Yükleme profili (UPLOAD_PROFILES); her profilin ölçümleri ayrı tutulur
+            path: Ölçüm dosyası (varsayılan: önbellek dizininde latency_model.json)
+        """
+        self.profile = profile
+        self.path = path or os.path.join(get_cache_dir(), "latency_model.json")
+        self.samples = self._read().get(profile, [])
+        self.new_samples = []
+        self.lock = threading.Lock()
+    
+    def _read(self) -> dict:
+        """Ölçüm dosyasını okur (yoksa veya bozuksa boş sözlük)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+    
+    def observe(self, audio_seconds: float, request_seconds: float):
+        """
+        Başarılı bir isteğin süresini kaydeder.
+        
+        Args:
+            audio_seconds: Yüklenen parçanın süresi (saniye)
+            request_seconds: İsteğin sürdüğü süre (saniye)
+        """
+        with self.lock:
+            self.new_samples.append([round(audio_seconds, 3), round(request_seconds, 3)])
+    
+    @property
+    def coefficients(self) -> tuple:
+        """
+        Modelin katsayıları.
+        
+        Returns:
+            (taban_sn, saniye_başına_sn) tuple
+        """
+        with self.lock:
+            samples = (self.samples + self.new_samples)[-LATENCY_MODEL_MAX_SAMPLES:]
+        if len(samples) < LATENCY_MODEL_MIN_SAMPLES:
+            return (LATENCY_MODEL_DEFAULT_BASE_SEC, LATENCY_MODEL_DEFAULT_PER_AUDIO_SEC)
+        
+        mean_x = sum(x for x, _ in samples) / len(samples)
+        mean_y = sum(y for _, y in samples) / len(samples)
+        variance = sum((x - mean_x) ** 2 for x, _ in samples)
+        if variance > 0:
+            slope = sum((x - mean_x) * (y - mean_y) for x, y in samples) / variance
+            intercept = mean_y - slope * mean_x
+            if slope >= 0 and intercept >= 0:
+                return (intercept, slope)
+        # Parça süreleri hep aynıysa taban ayrıştırılamaz; varsayılan taban korunur
+        base = min(LATENCY_MODEL_DEFAULT_BASE_SEC, mean_y)
+        return (base, (mean_y - base) / mean_x if mean_x > 0 else LATENCY_MODEL_DEFAULT_PER_AUDIO_SEC)
+    
+    def predict(self, audio_seconds: float) -> float:
+        """
+        Verilen süredeki bir parçanın istek süresini tahmin eder.
+        
+        Args:
+            audio_seconds: Parça süresi (saniye)
+        
+        Returns:
+            Tahmini istek süresi (saniye)
+        """
+        base, per_second = self.coefficients
+        return base + per_second * audio_seconds
+    
+    def save(self):
+        """
+        Bu çalıştırmadaki yeni ölçümleri dosyadaki güncel ölçümlere ekleyip yazar
+        (aynı anda çalışan işlerin ölçümleri kaybolmasın diye dosya yeniden okunur).
+        Dosya benzersiz adlı geçici dosyaya yazılıp os.replace ile yerine taşınır;
+        okuyanlar hiçbir zaman yarım yazılmış dosya görmez. Aynı süreçteki işler
+        (toplu/daemon modu) okuma-birleştirme-yazma adımını sırayla yapar.
+        """
+        with self.lock:
+            if not self.new_samples:
+                return
+            new_samples, self.new_samples = self.new_samples, []
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with _LATENCY_MODEL_SAVE_LOCK:
+            data = self._read()
+            data[self.profile] = (data.get(self.profile, []) + new_samples)[-LATENCY_MODEL_MAX_SAMPLES:]
+            with self.lock:
+                self.samples = data[self.profile]
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"UYARI: Gecikme ölçümleri kaydedilemedi: {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+
+def parse_duration_seconds(value: str) -> float:
+    """
+    OpenAI hız sınırı başlıklarındaki süreleri ("20ms", "1s", "6m0s", "1h2m3.5s") saniyeye çevirir.
+    
+    Args:
+        value: Süre metni
+    
+    Returns:
+        Saniye, çözülemezse None
+    """
+    parts = re.findall(r'(\d+(?:\.\d+)?)(ms|s|m|h)', value or '')
+    if not parts:
+        return None
+    scale = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+    return sum(float(amount) * scale[unit] for amount, unit in parts)
+
+
+def get_retry_after(headers) -> float:
+    """
+    Yanıt başlıklarından ne kadar beklenmesi gerektiğini okur
+    (retry-after-ms, retry-after saniye veya HTTP tarihi, x-ratelimit-reset-requests).
+    
+    Args:
+        headers: HTTP yanıt başlıkları
+    
+    Returns:
+        Bekleme süresi (saniye), başlık yoksa None
+    """
+    if headers is None:
+        return None
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+    except ValueError:
+        pass
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return parse_duration_seconds(headers.get('x-ratelimit-reset-requests'))
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Hatanın tekrar denemeyle düzelebilecek türde olup olmadığını döndürür.
+    Bağlantı/zaman aşımı hataları, 408, 409, 429 ve 5xx tekrar denenir;
+    diğer 4xx hataları (ör. 400, 401, 413) ve API dışı hatalar (eksik dosya,
+    ffmpeg hatası, programlama hataları) denenmez.
+    
+    Args:
+        error: Yakalanan hata
+    
+    Returns:
+        Tekrar denenebilirse True
+    """
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """API'nin yük/kota nedeniyle isteği geri çevirdiği (429 veya 503) hatalar için True döndürür."""
+    return isinstance(error, openai.APIStatusError) and error.status_code in (429, 503)
+
+
+def get_retry_delay(attempt: int, retry_after: float = None) -> float:
+    """
+    Bir sonraki deneme için bekleme süresini hesaplar. Sunucu retry-after
+    bildirdiyse ona küçük bir jitter eklenir; yoksa jitter'lı üstel bekleme
+    kullanılır (aynı anda reddedilen parçalar aynı anda tekrar denenmesin diye).
+    
+    Args:
+        attempt: Başarısız olan denemenin numarası (0-based)
+        retry_after: Sunucunun bildirdiği bekleme süresi (saniye, opsiyonel)
+    
+    Returns:
+        Bekleme süresi (saniye)
+    """
+    if retry_after is not None:
+        return min(retry_after, RETRY_MAX_DELAY) + random.uniform(0, 1)
+    ceiling = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class AdaptiveRateLimiter:
+    """
+    Tüm parçalar (toplu modda tüm dosyalar) arasında paylaşılan, API
+    yanıtlarıyla ayarlanan eşzamanlılık sınırlayıcısı (AIMD).
+    
+    Her başarılı istek sınırı yaklaşık bir "pencere" sonunda 1 artırır
+    (toplamalı artış); 429/503 yanıtı sınırı yarıya indirir (çarpımsal azalış)
+    ve retry-after süresi boyunca yeni istek başlatılmaz. Böylece eşzamanlılık
+    sabit bir tahmin yerine gerçek kotayı izler. İş parçacıkları acquire(),
+    asyncio görevleri acquire_async() ile slot alır; ikisi de release() ile bırakır.
+    Slot bekleyen asyncio görevleri yoklama yapmaz: slot açıldığında kendi olay
+    döngülerindeki bir asyncio.Event ile uyandırılır.
+    """
+    
+    def __init__(self, max_concurrency: int, initial_concurrency: int = ADAPTIVE_INITIAL_CONCURRENCY):
+        """
+        Args:
+            max_concurrency: Eşzamanlı istek sayısının üst sınırı
+            initial_concurrency: Başlangıç eşzamanlılığı
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(max(1, min(initial_concurrency, self.max_concurrency)))
+        self.peak_limit = self.limit
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.throttled = 0
+        self.condition = threading.Condition()
+        # Slot bekleyen asyncio görevleri: (olay döngüsü, asyncio.Event)
+        self.async_waiters = set()
+    
+    def _wait_time(self) -> float:
+        """Slot alınabiliyorsa 0, duraklama varsa kalan süre, slot bekleniyorsa None (lock altında çağrılır)."""
+        remaining = self.paused_until - time.monotonic()
+        if remaining > 0:
+            return remaining
+        if self.in_flight < int(self.limit):
+            return 0
+        return None
+    
+    def acquire(self):
+        """Bir istek slotu alınana kadar bekler (iş parçacıkları için)."""
+        with self.condition:
+            while True:
+                wait_time = self._wait_time()
+                if wait_time == 0:
+                    self.in_flight += 1
+                    return
+                self.condition.wait(wait_time)
+    
+    def try_acquire(self) -> bool:
+        """
+        Boş slot varsa beklemeden alır (yedek istekler için).
+        
+        Returns:
+            Slot alındıysa True
+        """
+        with self.condition:
+            if self._wait_time() == 0:
+                self.in_flight += 1
+                return True
+            return False
+    
+    async def acquire_async(self):
+        """
+        Bir istek slotu alınana kadar olay döngüsünü bloklamadan bekler (asyncio görevleri için).
+        Slot beklenirken release()/on_success() görevi uyandırır; duraklama varsa
+        en fazla duraklamanın kalan süresi kadar beklenir.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.condition:
+                wait_time = self._wait_time()
+                if wait_time == 0:
+                    self.in_flight += 1
+                    return
+                waiter = (loop, asyncio.Event())
+                self.async_waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter[1].wait(), wait_time)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self.condition:
+                    self.async_waiters.discard(waiter)
+    
+    def _notify_all(self):
+        """Slot bekleyen iş parçacıklarını ve asyncio görevlerini uyandırır (lock altında çağrılır)."""
+        self.condition.notify_all()
+        for loop, event in self.async_waiters:
+            loop.call_soon_threadsafe(event.set)
+    
+    def release(self):
+        """İstek slotunu bırakır."""
+        with self.condition:
+            self.in_flight -= 1
+            self._notify_all()
+    
+    def on_success(self, headers=None):
+        """
+        Başarılı yanıtı kaydeder: sınırı artırır, kota tükendiyse sıfırlanana kadar duraklar.
+        
+        Args:
+            headers: Yanıt başlıkları (x-ratelimit-remaining-requests okunur)
+        """
+        with self.condition:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self.peak_limit = max(self.peak_limit, self.limit)
+            if headers is not None and headers.get('x-ratelimit-remaining-requests') == '0':
+                reset = parse_duration_seconds(headers.get('x-ratelimit-reset-requests'))
+                if reset:
+                    self.paused_until = max(self.paused_until, time.monotonic() + reset)
+            self._notify_all()
+    
+    def on_throttle(self, retry_after: float = None):
+        """
+        429/503 yanıtını kaydeder: sınırı yarıya indirir ve gerekirse tüm istekleri duraklatır.
+        Aynı yük dalgasından gelen ardışık retler sınırı bir kez düşürür.
+        
+        Args:
+            retry_after: Sunucunun bildirdiği bekleme süresi (saniye, opsiyonel)
+        """
+        with self.condition:
+            now = time.monotonic()
+            self.throttled += 1
+            if now - self.last_decrease >= max(retry_after or 0, 1.0):
+                self.limit = max(1.0, self.limit / 2)
+                self.last_decrease = now
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + min(retry_after, RETRY_MAX_DELAY))
+    
+    def warm_up(self, concurrency: int):
+        """
+        Henüz hiç yavaşlatılmadıysa sınırı doğrudan verilen eşzamanlılığa yükseltir
+        (gecikme planı parçaları bu genişlikte dalgalar halinde planlar). 429/503
+        alınmışsa öğrenilen sınır korunur.
+        
+        Args:
+            concurrency: Hedef eşzamanlılık (üst sınırla kırpılır)
+        """
+        with self.condition:
+            if self.throttled == 0 and concurrency > self.limit:
+                self.limit = float(min(concurrency, self.max_concurrency))
+                self.peak_limit = max(self.peak_limit, self.limit)
+                self._notify_all()
+    
+    def report(self):
+        """Hız sınırı istatistiklerini yazdırır."""
+        if self.throttled == 0 and self.peak_limit <= ADAPTIVE_INITIAL_CONCURRENCY:
+            return
+        print(f"Hız sınırlayıcı: {self.throttled} kez yavaşlatıldı (429/503), eşzamanlılık "
+              f"son {int(self.limit)}, en yüksek {int(self.peak_limit)} (üst sınır {self.max_concurrency})")
+
+
+class RequestHedger:
+    """
+    Geride kalan (straggler) parça istekleri için yedek istek (hedge) gönderir.
+    
+    Aynı işteki tamamlanan isteklerin süreleri, gecikme modelinin tahminine
+    oranlanarak toplanır. Bir istek, parçanın tahmini süresinin bu oranların
+    HEDGE_PERCENTILE yüzdeliği katını aştığında aynı parça için ikinci bir istek
+    gönderilir ve önce biten yanıt kullanılır. Yedek istekler boş bir hız
+    sınırlayıcı slotu varsa gönderilir (asıl işleri bekletmez) ve toplam ek
+    yükleme, bekleyen sesin budget oranıyla sınırlıdır.
+    """
+    
+    def __init__(self, latency_model: LatencyModel, limiter: AdaptiveRateLimiter, total_audio_seconds: float,
+                 budget: float = HEDGE_DEFAULT_BUDGET):
+        """
+        Args:
+            latency_model: İstek süresi tahminleri için gecikme modeli
+            limiter: Yedek isteklerin slot alacağı hız sınırlayıcı
+            total_audio_seconds: İşte yüklenecek toplam ses süresi (saniye)
+            budget: Yedek isteklerle en fazla yüklenebilecek ses oranı (ör. 0.1 = %10)
+        """
+        self.latency_model = latency_model
+        self.limiter = limiter
+        self.budget_seconds = total_audio_seconds * budget
+        self.spent_seconds = 0.0
+        self.ratios = []
+        self.issued = 0
+        self.won = 0
+        self.lock = threading.Lock()
+    
+    def observe(self, audio_seconds: float, seconds: float):
+        """
+        Tamamlanan bir isteğin süresini kaydeder.
+        
+        Args:
+            audio_seconds: Parça süresi (saniye)
+            seconds: İsteğin sürdüğü süre (saniye)
+        """
+        ratio = seconds / max(self.latency_model.predict(audio_seconds), 1e-3)
+        with self.lock:
+            bisect.insort(self.ratios, ratio)
+    
+    def deadline(self, audio_seconds: float) -> float:
+        """
+        Parça için yedek isteğin gönderileceği süreyi hesaplar.
+        
+        Args:
+            audio_seconds: Parça süresi (saniye)
+        
+        Returns:
+            İstek başlangıcından itibaren saniye (yeterli ölçüm yoksa None)
+        """
+        with self.lock:
+            if len(self.ratios) < HEDGE_MIN_SAMPLES:
+                return None
+            ratio = self.ratios[min(len(self.ratios) - 1, int(len(self.ratios) * HEDGE_PERCENTILE))]
+        return max(HEDGE_MIN_DELAY_SEC, ratio * self.latency_model.predict(audio_seconds))
+    
+    @property
+    def exhausted(self) -> bool:
+        """Ek yükleme bütçesi tükendiyse True."""
+        with self.lock:
+            return self.spent_seconds >= self.budget_seconds
+    
+    def _try_start(self, audio_seconds: float) -> bool:
+        """Bütçe ve boş slot varsa yedek isteği kaydedip slot alır."""
+        with self.lock:
+            if self.spent_seconds + audio_seconds > self.budget_seconds:
+                return False
+            if not self.limiter.try_acquire():
+                return False
+            self.spent_seconds += audio_seconds
+            self.issued += 1
+            return True
+    
+    def _next_wait(self, started: float, audio_seconds: float) -> tuple:
+        """
+        Bekleme süresini ve yedek isteğin şimdi gönderilmesi gerekip gerekmediğini döndürür.
+        
+        Returns:
+            (beklenecek_sn veya None, yedek_gönderilsin_mi) tuple
+        """
+        if self.exhausted:
+            return None, False
+        deadline = self.deadline(audio_seconds)
+        if deadline is None:
+            return HEDGE_POLL_INTERVAL_SEC, False
+        remaining = started + deadline - time.perf_counter()
+        if remaining > 0:
+            return remaining, False
+        return HEDGE_POLL_INTERVAL_SEC, True
+    
+    def call(self, send, audio_seconds: float, hold=None):
+        """
+        send() çağrısını çalıştırır; süre aşılırsa yedek bir send() başlatır ve önce
+        başarıyla biteni döndürür. Geç kalan istek arka planda biter, sonucu atılır.
+        
+        Çağıranın bu istek için aldığı hız sınırlayıcı slotunun sahipliği call()'a
+        geçer: her deneme kendi slotunu yalnızca gerçekten bittiğinde bırakır,
+        böylece geç kalan istek sürdükçe eşzamanlı istek sınırına sayılır. Çağıran
+        slotu ayrıca bırakmamalıdır.
+        
+        Args:
+            send: İsteği gönderip sonucunu döndüren fonksiyon
+            audio_seconds: Parça süresi (saniye)
+            hold: Sonuç döndüğünde hâlâ süren bir deneme varsa çağrılan fonksiyon
+                (opsiyonel). Döndürdüğü fonksiyon son deneme bitince çağrılır; parça
+                dosyası o zamana kadar silinmez.
+        
+        Returns:
+            İlk başarılı send() sonucu
+        
+        Raises:
+            Exception: Tüm istekler başarısız olursa sonuncusunun hatası
+        """
+        outcomes = queue.Queue()
+        state = {'running': 1, 'release': None}
+        state_lock = threading.Lock()
+        
+        def attempt(hedge: bool):
+            try:
+                outcomes.put((hedge, send(), None))
+            except Exception as e:
+                outcomes.put((hedge, None, e))
+            finally:
+                self.limiter.release()
+                with state_lock:
+                    state['running'] -= 1
+                    release = state['release'] if state['running'] == 0 else None
+                if release is not None:
+                    release()
+        
+        started = time.perf_counter()
+        threading.Thread(target=attempt, args=(False,), daemon=True).start()
+        waiting = 1
+        hedged = False
+        error = None
+        while waiting:
+            wait, start_hedge = (None, False) if hedged else self._next_wait(started, audio_seconds)
+            if start_hedge and self._try_start(audio_seconds):
+                hedged = True
+                waiting += 1
+                with state_lock:
+                    state['running'] += 1
+                threading.Thread(target=attempt, args=(True,), daemon=True).start()
+                continue
+            try:
+                hedge, result, error = outcomes.get(timeout=wait)
+            except queue.Empty:
+                continue
+            waiting -= 1
+            if error is None:
+                if hedge:
+                    with self.lock:
+                        self.won += 1
+                # Geç kalan deneme sürüyorsa parça dosyası o bitene kadar tutulur
+                with state_lock:
+                    if state['running'] and hold is not None:
+                        state['release'] = hold()
+                return result
+        raise error
+    
+    async def call_async(self, send, audio_seconds: float):
+        """
+        call() ile aynıdır, asyncio motoru için. Geç kalan istek iptal edilir.
+        
+        Args:
+            send: İsteği gönderip sonucunu döndüren coroutine fonksiyonu
+            audio_seconds: Parça süresi (saniye)
+        
+        Returns:
+            İlk başarılı send() sonucu
+        """
+        async def hedge_attempt():
+            try:
+                return await send()
+            finally:
+                self.limiter.release()
+        
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(send())
+        tasks = {primary}
+        hedged = False
+        error = None
+        try:
+            while tasks:
+                wait, start_hedge = (None, False) if hedged else self._next_wait(started, audio_seconds)
+                if start_hedge and self._try_start(audio_seconds):
+                    hedged = True
+                    tasks.add(asyncio.ensure_future(hedge_attempt()))
+                    continue
+                done, tasks = await asyncio.wait(tasks, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            with self.lock:
+                                self.won += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # İptal edilen istek gerçekten bitene kadar beklenir: slotu ve parça dosyası
+            # ancak ondan sonra bırakılır
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def report(self):
+        """Yedek istek sayaçlarını yazdırır."""
+        if self.issued:
+            print(f"Yedek istekler (hedge): {self.issued} gönderildi, {self.won} önce bitti, "
+                  f"{self.spent_seconds / 60:.1f}/{self.budget_seconds / 60:.1f} dakika ek yükleme")
+
+
+def get_chunk_failure_text(error: Exception, chunk_index: int, attempt: int, max_retries: int) -> str:
+    """
+    Başarısız bir transkript denemesinden sonra tekrar denenip denenmeyeceğine karar verir.
+    
+    Args:
+        error: Yakalanan hata
+        chunk_index: Parça indeksi (0-based)
+        attempt: Deneme numarası (0-based)
+        max_retries: Maksimum deneme sayısı
+    
+    Returns:
+        Parça için yer tutucu metin (vazgeçilecekse), tekrar denenecekse None
+    """
+    error_str = str(error)
+    # 413 hatası (dosya çok büyük) için retry yapma
+    if "413" in error_str or "Maximum content size" in error_str:
+        print(f"HATA: Parça {chunk_index+1} çok büyük (25MB limiti aşıldı). Bu parça atlanıyor.")
+        return f"[Parça {chunk_index+1} çok büyük, işlenemedi]"
+    
+    # Tekrar denemeyle düzelmeyecek hatalar (ör. 400, 401)
+    if not is_retryable_error(error):
+        print(f"HATA: Parça {chunk_index+1} işlenemedi: {error}")
+        return f"[Parça {chunk_index+1} işlenemedi: {error_str}]"
+    
+    # Son denemede hata döndür
+    if attempt == max_retries - 1:
+        print(f"HATA: Parça {chunk_index+1} {max_retries} denemeden sonra işlenemedi: {error}")
+        return f"[Parça {chunk_index+1} işlenemedi: {error_str}]"
+    return None
+
+
+def normalize_word(word: str) -> str:
+    """Kelimeyi karşılaştırma için küçük harfe çevirir, noktalama işaretlerini atar."""
+    return ''.join(ch for ch in word.casefold() if ch.isalnum())
+
+
+def get_cache_params(keep_range: tuple = None) -> dict:
+    """
+    Parça transkriptinin önbellek anahtarına giren parametreleri döndürür.
+    
+    Args:
+        keep_range: ChunkSpec.keep_range (örtüşmeli parçada tutulan aralık metni değiştirir)
+    
+    Returns:
+        TranscriptCache.make_key() parametreleri
+    """
+    if keep_range is None:
+        return {'model': WHISPER_MODEL}
+    return {'model': WHISPER_MODEL, 'keep_range': list(keep_range)}
+
+
+def get_transcription_request_options(keep_range: tuple = None) -> dict:
+    """
+    API isteğine eklenecek yanıt biçimi parametrelerini döndürür.
+    
+    Args:
+        keep_range: ChunkSpec.keep_range (örtüşmeli parçada kelime zamanları istenir)
+    
+    Returns:
+        create() için ek parametreler
+    """
+    if keep_range is None:
+        return {}
+    return {'response_format': 'verbose_json', 'timestamp_granularities': ['word', 'segment']}
+
+
+def timed_transcript_tokens(transcript) -> list:
+    """
+    verbose_json transkriptindeki metni kelimelere ayırıp her kelimeye zaman atar.
+    Kelime zamanlarında noktalama bulunmadığından metindeki kelimeler (noktalama
+    dahil) kelime zamanlarıyla hizalanır; eşleşmeyen kelimeler öncekinin zamanını
+    alır. Kelime zamanı yoksa segment zamanları segment içinde eşit dağıtılır.
+    
+    Args:
+        transcript: API'nin verbose_json yanıtı (text, words, segments)
+    
+    Returns:
+        (kelime, başlangıç_sn, bitiş_sn) listesi (zaman bulunamazsa boş liste)
+    """
+    words = getattr(transcript, 'words', None) or []
+    segments = getattr(transcript, 'segments', None) or []
+    tokens = []
+    times = []
+    
+    if words:
+        tokens = (transcript.text or "").split()
+        times = [None] * len(tokens)
+        matcher = difflib.SequenceMatcher(None, [normalize_word(t) for t in tokens],
+                                          [normalize_word(w.word) for w in words], autojunk=False)
+        for block in matcher.get_matching_blocks():
+            for offset in range(block.size):
+                word = words[block.b + offset]
+                times[block.a + offset] = (word.start, word.end)
+    else:
+        for segment in segments:
+            segment_tokens = segment.text.split()
+            step = (segment.end - segment.start) / max(1, len(segment_tokens))
+            for i, token in enumerate(segment_tokens):
+                tokens.append(token)
+                times.append((segment.start + i * step, segment.start + (i + 1) * step))
+    
+    known = [t for t in times if t is not None]
+    if not known:
+        return []
+    previous = (known[0][0], known[0][0])
+    timed = []
+    for token, token_time in zip(tokens, times):
+        if token_time is None:
+            token_time = (previous[1], previous[1])
+        timed.append((token, token_time[0], token_time[1]))
+        previous = token_time
+    return timed
+
+
+def get_chunk_transcript_text(transcript, keep_range: tuple = None) -> str:
+    """
+    Parçanın transkript metnini döndürür. Örtüşmeli parçada yalnızca orta noktası
+    keep_range içinde kalan kelimeler tutulur.
+    
+    Args:
+        transcript: API yanıtı
+        keep_range: ChunkSpec.keep_range (None ise metin olduğu gibi döner)
+    
+    Returns:
+        Transkript metni
+    """
+    if keep_range is None:
+        return transcript.text
+    timed = timed_transcript_tokens(transcript)
+    if not timed:
+        return (transcript.text or "").strip()
+    keep_start, keep_end = keep_range
+    low = -math.inf if keep_start is None else keep_start / 1000
+    high = math.inf if keep_end is None else keep_end / 1000
+    return " ".join(token for token, start, end in timed if low <= (start + end) / 2 < high)
+
+
+def strip_overlap_prefix(previous_text: str, text: str) -> str:
+    """
+    Örtüşen bölgede iki parçanın da yazdığı kelimeleri sonraki parçanın başından
+    çıkarır. Önceki parçanın son kelimeleri ile sonraki parçanın ilk kelimeleri
+    arasındaki ortak kelime dizileri aranır; birleşme noktasına en yakın ve en
+    uzun eşleşme seçilir. Eşleşme birleşme noktasına yakın değilse metne
+    dokunulmaz. Yalnızca eşleşen kelimeler (ve sonraki parçada onlardan önce
+    gelenler) çıkarılır; önceki parçanın eşleşmeden sonra kalan kelimeleri o
+    parçanın kuyruğudur, sonraki parçadan silinmez.
+    
+    Args:
+        previous_text: Önceki parçanın (sıradaki) metni
+        text: Sonraki parçanın metni
+    
+    Returns:
+        Tekrarlanan kelimeleri çıkarılmış metin
+    """
+    tokens = text.split()
+    previous_tail = [normalize_word(t) for t in previous_text.split()[-OVERLAP_STITCH_MAX_WORDS:]]
+    head = [normalize_word(t) for t in tokens[:OVERLAP_STITCH_MAX_WORDS]]
+    
+    best = None
+    for b in range(min(len(head), OVERLAP_STITCH_MAX_GAP_WORDS + 1)):
+        for a in range(len(previous_tail)):
+            size = 0
+            while a + size < len(previous_tail) and b + size < len(head) and previous_tail[a + size] == head[b + size]:
+                size += 1
+            if size == 0 or not any(head[b:b + size]):
+                continue
+            trailing = len(previous_tail) - (a + size)
+            if trailing > OVERLAP_STITCH_MAX_GAP_WORDS:
+                continue
+            # Tek ortak kelime (ör. "ve") tesadüf olabilir; yalnızca tam birleşme noktasındaysa kabul edilir
+            if size == 1 and (trailing or b):
+                continue
+            # Birleşme noktasından uzaklık eşleşme uzunluğundan düşülür
+            score = (size - trailing - b, size)
+            if best is None or score > best[0]:
+                best = (score, b + size)
+    if best is None:
+        return text
+    return " ".join(tokens[best[1]:])
+
+
+def transcribe_chunk(chunk_path: str, chunk_index: int, total_chunks: int, api_key: str, max_retries: int = RETRY_MAX_ATTEMPTS, cache: TranscriptCache = None, content_key: str = None,
+                     manifest: JobManifest = None, client: "openai.OpenAI" = None, limiter: AdaptiveRateLimiter = None, chunk_data: bytes = None,
+                     keep_range: tuple = None, on_request_done=None, hedger: RequestHedger = None,
+                     audio_seconds: float = 0, hold_chunk=None) -> tuple:
+    """
+    Tek bir parçayı transkript eder (paralel işleme için).
+    Bağlantı hataları, 429 ve 5xx yanıtları jitter'lı beklemeyle tekrar denenir;
+    retry-after başlığına uyulur ve sonuç paylaşılan hız sınırlayıcıya bildirilir.
+    Önbellek verilmişse API çağrısından önce önbelleğe bakılır.
+    
+    Args:
+        chunk_path: Parça dosyası yolu
+        chunk_index: Parça indeksi (0-based)
+        total_chunks: Toplam parça sayısı
+        api_key: OpenAI API anahtarı
+        max_retries: Maksimum deneme sayısı (varsayılan: RETRY_MAX_ATTEMPTS)
+        cache: Transkript önbelleği (opsiyonel)
+        content_key: Parçanın ses içeriği özeti (opsiyonel, verilmezse dosya özetlenir)
+        manifest: Başarılı transkriptin kaydedileceği iş manifest'i (opsiyonel)
+        client: Parçalar arasında paylaşılan OpenAI istemcisi (opsiyonel, verilmezse oluşturulur)
+        limiter: Parçalar arasında paylaşılan hız sınırlayıcı (opsiyonel)
+        chunk_data: Bellekte kodlanmış parça verisi (opsiyonel). Verilirse dosya
+            okunmaz; chunk_path yalnızca yüklemede dosya adı olarak kullanılır.
+        keep_range: Örtüşmeli parçada tutulacak zaman aralığı (ChunkSpec.keep_range).
+            Verilirse kelime zamanları istenir ve aralık dışındaki kelimeler atılır.
+        on_request_done: Başarılı API isteğinin süresiyle (saniye) çağrılacak fonksiyon (opsiyonel, LatencyModel)
+        hedger: Verilirse geride kalan istek için yedek istek gönderilir (opsiyonel)
+        audio_seconds: Parça süresi (saniye, yedek isteğin zamanlaması için)
+        hold_chunk: Yanıt döndüğünde geç kalan istek hâlâ parça dosyasını yüklüyorsa
+            çağrılır (opsiyonel, RequestHedger.call); döndürdüğü fonksiyon o istek bitince çağrılır
+    
+    Returns:
+        (chunk_index, transcript_text) tuple
+    """
+    cache_key = None
+    if cache is not None:
+        cache_key = TranscriptCache.make_key(content_key or hash_file(chunk_path), get_cache_params(keep_range))
+        cached_text = cache.get(cache_key)
+        if cached_text is not None:
+            print(f"Parça {chunk_index+1}/{total_chunks} önbellekten alındı.")
+            if manifest is not None:
+                manifest.mark_done(chunk_index, cached_text)
+            return (chunk_index, cached_text)
+    
+    if client is None:
+        # Tekrar denemeleri SDK değil hız sınırlayıcı yönetir
+        client = openai.OpenAI(api_key=api_key, max_retries=0)
+    if limiter is None:
+        limiter = AdaptiveRateLimiter(1)
+    
+    def send() -> tuple:
+        upload = open(chunk_path, "rb") if chunk_data is None else nullcontext((os.path.basename(chunk_path), chunk_data))
+        with upload as audio_file:
+            response = client.audio.transcriptions.with_raw_response.create(
+                model=WHISPER_MODEL,
+                file=audio_file,
+                **get_transcription_request_options(keep_range)
+            )
+        return response, response.parse()
+    
+    retry_delay = 0
+    for attempt in range(max_retries):
+        if attempt > 0:
+            print(f"Parça {chunk_index+1}/{total_chunks} tekrar deneniyor (deneme {attempt+1}/{max_retries}, {retry_delay:.1f} saniye sonra)...")
+            time.sleep(retry_delay)
+        else:
+            print(f"Parça {chunk_index+1}/{total_chunks} işleniyor...")
+        
+        limiter.acquire()
+        request_start = time.perf_counter()
+        try:
+            if hedger is None:
+                response, transcript = send()
+            else:
+                # Slotun sahipliği hedger'a geçer; geç kalan istek bitince bırakılır
+                response, transcript = hedger.call(send, audio_seconds, hold=hold_chunk)
+            limiter.on_success(response.headers)
+        except Exception as e:
+            retry_after = get_retry_after(e.response.headers) if isinstance(e, openai.APIStatusError) else None
+            if is_throttle_error(e):
+                limiter.on_throttle(retry_after)
+            failure_text = get_chunk_failure_text(e, chunk_index, attempt, max_retries)
+            if failure_text is not None:
+                return (chunk_index, failure_text)
+            retry_delay = get_retry_delay(attempt, retry_after)
+            continue
+        finally:
+            if hedger is None:
+                limiter.release()
+        
+        if on_request_done is not None:
+            on_request_done(time.perf_counter() - request_start)
+        text = get_chunk_transcript_text(transcript, keep_range)
+        print(f"Parça {chunk_index+1}/{total_chunks} tamamlandı.")
+        if cache is not None:
+            cache.put(cache_key, text)
+        if manifest is not None:
+            manifest.mark_done(chunk_index, text)
+        return (chunk_index, text)
+    
+    # Buraya gelmemeli ama yine de güvenlik için
+    return (chunk_index, f"[Parça {chunk_index+1} işlenemedi]")
+
+
+async def transcribe_chunk_async(client: "openai.AsyncOpenAI", limiter: AdaptiveRateLimiter, spec: ChunkSpec, total_chunks: int,
+                                 max_retries: int = RETRY_MAX_ATTEMPTS, cache: TranscriptCache = None, manifest: JobManifest = None,
+                                 on_request_done=None, hedger: RequestHedger = None) -> tuple:
+    """
+    Tek bir parçayı paylaşılan asenkron istemciyle transkript eder (asyncio motoru).
+    Önbellek, manifest ve tekrar deneme davranışı transcribe_chunk() ile aynıdır.
+    
+    Args:
+        client: Tüm parçaların paylaştığı AsyncOpenAI istemcisi (bağlantı havuzu)
+        limiter: Eşzamanlı istek sayısını ayarlayan paylaşılan hız sınırlayıcı
+        spec: Dosya yolu (veya bellek içi verisi) doldurulmuş ChunkSpec
+        total_chunks: Toplam parça sayısı
+        max_retries: Maksimum deneme sayısı (varsayılan: RETRY_MAX_ATTEMPTS)
+        cache: Transkript önbelleği (opsiyonel)
+        manifest: Başarılı transkriptin kaydedileceği iş manifest'i (opsiyonel)
+        on_request_done: Başarılı API isteğinin süresiyle (saniye) çağrılacak fonksiyon (opsiyonel)
+        hedger: Verilirse geride kalan istek için yedek istek gönderilir, geç kalan iptal edilir (opsiyonel)
+    
+    Returns:
+        (chunk_index, transcript_text) tuple
+    """
+    chunk_index = spec.index
+    cache_key = None
+    if cache is not None:
+        cache_key = TranscriptCache.make_key(spec.content_key or hash_file(spec.path), get_cache_params(spec.keep_range))
+        cached_text = cache.get(cache_key)
+        if cached_text is not None:
+            print(f"Parça {chunk_index+1}/{total_chunks} önbellekten alındı.")
+            if manifest is not None:
+                manifest.mark_done(chunk_index, cached_text)
+            return (chunk_index, cached_text)
+    
+    async def send() -> tuple:
+        response = await client.audio.transcriptions.with_raw_response.create(
+            model=WHISPER_MODEL,
+            file=Path(spec.path) if spec.data is None else (os.path.basename(spec.path), spec.data),
+            **get_transcription_request_options(spec.keep_range)
+        )
+        return response, response.parse()
+    
+    retry_delay = 0
+    for attempt in range(max_retries):
+        if attempt > 0:
+            print(f"Parça {chunk_index+1}/{total_chunks} tekrar deneniyor (deneme {attempt+1}/{max_retries}, {retry_delay:.1f} saniye sonra)...")
+            await asyncio.sleep(retry_delay)
+        
+        await limiter.acquire_async()
+        request_start = time.perf_counter()
+        try:
+            if attempt == 0:
+                print(f"Parça {chunk_index+1}/{total_chunks} işleniyor...")
+            if hedger is None:
+                response, transcript = await send()
+            else:
+                response, transcript = await hedger.call_async(send, spec.audio_duration_ms / 1000)
+            limiter.on_success(response.headers)
+        except Exception as e:
+            retry_after = get_retry_after(e.response.headers) if isinstance(e, openai.APIStatusError) else None
+            if is_throttle_error(e):
+                limiter.on_throttle(retry_after)
+            failure_text = get_chunk_failure_text(e, chunk_index, attempt, max_retries)
+            if failure_text is not None:
+                return (chunk_index, failure_text)
+            retry_delay = get_retry_delay(attempt, retry_after)
+            continue
+        finally:
+            limiter.release()
+        
+        if on_request_done is not None:
+            on_request_done(time.perf_counter() - request_start)
+        text = get_chunk_transcript_text(transcript, spec.keep_range)
+        print(f"Parça {chunk_index+1}/{total_chunks} tamamlandı.")
+        if cache is not None:
+            cache.put(cache_key, text)
+        if manifest is not None:
+            manifest.mark_done(chunk_index, text)
+        return (chunk_index, text)
+    
+    return (chunk_index, f"[Parça {chunk_index+1} işlenemedi]")
+
+
+async def transcribe_chunks_async(chunks, total_chunks: int, client: "openai.AsyncOpenAI", limiter: AdaptiveRateLimiter,
+                                  cache: TranscriptCache = None, manifest: JobManifest = None,
+                                  upload_stage: StageStats = None, on_chunk_done=None, on_chunk_text=None,
+                                  on_request_done=None, hedger: RequestHedger = None) -> dict:
+    """
+    Parçaları tek bir bağlantı havuzlu AsyncOpenAI istemcisiyle eşzamanlı transkript eder.
+    Eşzamanlı istek sayısı hız sınırlayıcıyla ayarlanır; iş parçacığı başına istemci
+    ve TLS kurulumu olmadığından tek süreçten onlarca yükleme yapılabilir. İstemci
+    çağıranındır (OpenAIBackend.run_async); bağlantıları işler arasında yeniden kullanılır.
+    
+    Args:
+        chunks: ChunkSpec listesi veya üreteci (akış modunda parçalar kesildikçe gelir)
+        total_chunks: Toplam parça sayısı
+        client: Çalışan olay döngüsüne bağlı AsyncOpenAI istemcisi
+        limiter: Eşzamanlı istek sayısını ayarlayan hız sınırlayıcı
+        cache: Transkript önbelleği (opsiyonel)
+        manifest: İş manifest'i (opsiyonel)
+        upload_stage: Yükleme sürelerinin kaydedileceği aşama (opsiyonel)
+        on_chunk_done: Her parçanın yüklemesi bitince parçayla çağrılacak fonksiyon (opsiyonel, ChunkQueue.done)
+        on_chunk_text: Her parçanın transkripti gelince (chunk_index, text) ile çağrılacak fonksiyon (opsiyonel)
+        on_request_done: Her başarılı API isteğinden sonra (spec, süre_sn) ile çağrılacak fonksiyon (opsiyonel)
+        hedger: Geride kalan istekler için yedek istek gönderen RequestHedger (opsiyonel)
+    
+    Returns:
+        Parça indeksi -> transkript metni sözlüğü
+    """
+    loop = asyncio.get_running_loop()
+    iterator = iter(chunks)
+    tasks = []
+    if upload_stage is None:
+        upload_stage = StageStats("yükleme")
+    
+    async def upload(spec):
+        with upload_stage.measure():
+            result = await transcribe_chunk_async(
+                client, limiter, spec, total_chunks, cache=cache, manifest=manifest,
+                on_request_done=None if on_request_done is None else lambda seconds: on_request_done(spec, seconds),
+                hedger=hedger)
+        if on_chunk_text is not None:
+            on_chunk_text(*result)
+        return result
+    
+    try:
+        while True:
+            # Parça üretimi (ffmpeg kesimi/kodlama) olay döngüsünü bloklamasın
+            spec = await loop.run_in_executor(None, next, iterator, None)
+            if spec is None:
+                break
+            task = asyncio.create_task(upload(spec))
+            if on_chunk_done is not None:
+                task.add_done_callback(lambda _, spec=spec: on_chunk_done(spec))
+            tasks.append(task)
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Olay döngüsü işler arasında yaşadığından iptal edilen görevlerin bitmesi beklenir
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    
+    return dict(results)
+
+
+def get_cpu_count() -> int:
+    """Sürecin kullanabileceği CPU çekirdeği sayısı (CPU kısıtlamaları dahil)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+class TranscriptionBackend(ABC):
+    """
+    Parça transkript motoru arayüzü. transcribe_audio() her parçayı motorun
+    transcribe_chunk() yöntemine gönderir; önbellek, manifest, sıralama ve
+    birleştirme motordan bağımsızdır. Alt sınıflar transcribe_chunk()'ı
+    tanımlamalıdır; tanımlamayan motor oluşturulurken TypeError verir.
+    Motor bir bağlam yöneticisidir: with bloğundan çıkınca close() çağrılır.
+    """
+    
+    # Motor adı (gecikme modeli ve önbellek anahtarları için)
+    name = None
+    # API anahtarı (yalnızca API motorlarında)
+    api_key = None
+    # Manifest ve önbellek anahtarına giren model kimliği
+    model_name = None
+    # asyncio motoru, yedek istekler ve uyarlanabilir hız sınırı yalnızca API motorunda anlamlıdır
+    supports_async = False
+    supports_hedging = False
+    rate_limited = False
+    
+    def max_concurrency(self, requested: int = None) -> int:
+        """
+        Motorun eşzamanlı işleyebileceği parça sayısı.
+        
+        Args:
+            requested: Kullanıcının istediği üst sınır (opsiyonel)
+        
+        Returns:
+            Eşzamanlı parça sayısı
+        """
+        return requested or DEFAULT_MAX_CONCURRENCY
+    
+    def latency_key(self, profile: str) -> str:
+        """Gecikme modelinin ölçümleri sakladığı anahtar (motor ve yükleme profili başına)."""
+        return f"{self.name}:{profile}"
+    
+    def cache_params(self, spec: ChunkSpec) -> dict:
+        """Parça transkriptinin önbellek anahtarına giren parametreler (model kimliği dahil)."""
+        return dict(get_cache_params(spec.keep_range), model=self.model_name)
+    
+    @abstractmethod
+    def transcribe_chunk(self, spec: ChunkSpec, total_chunks: int, cache: TranscriptCache = None,
+                         manifest: JobManifest = None, limiter: AdaptiveRateLimiter = None,
+                         hedger: RequestHedger = None, on_request_done=None, hold_chunk=None) -> tuple:
+        """
+        Tek bir parçayı transkript eder (iş parçacığı havuzundan çağrılır).
+        
+        Args:
+            spec: Dosya yolu (veya bellek içi verisi) doldurulmuş ChunkSpec
+            total_chunks: Toplam parça sayısı
+            cache: Transkript önbelleği (opsiyonel)
+            manifest: Başarılı transkriptin kaydedileceği iş manifest'i (opsiyonel)
+            limiter: Paylaşılan hız sınırlayıcı (opsiyonel)
+            hedger: Yedek istek gönderen RequestHedger (opsiyonel)
+            on_request_done: Başarılı isteğin süresiyle (saniye) çağrılacak fonksiyon (opsiyonel)
+            hold_chunk: Parça dosyası yöntem döndükten sonra da kullanılacaksa (ör. geç
+                kalan yedek istek) çağrılır; döndürdüğü fonksiyon kullanım bitince
+                çağrılmalıdır (opsiyonel, arka planda iş bırakmayan motorlar yok sayar)
+        
+        Returns:
+            (chunk_index, transcript_text) tuple
+        """
+    
+    def run_async(self, make_coroutine):
+        """
+        asyncio motorunda bir işin coroutine'ini motorun olay döngüsünde çalıştırır
+        (yalnızca supports_async motorlarında).
+        
+        Args:
+            make_coroutine: Motorun asenkron istemcisiyle çağrılıp coroutine döndüren fonksiyon
+        
+        Returns:
+            Coroutine'in sonucu
+        """
+        raise NotImplementedError(f"'{self.name}' motoru asyncio desteklemiyor")
+    
+    def close(self):
+        """Motorun kaynaklarını (istemci, işlem havuzu) kapatır; birden fazla çağrılabilir."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class OpenAIBackend(TranscriptionBackend):
+    """
+    OpenAI Whisper API motoru (tekrar deneme, hız sınırlama, yedek istek ve asyncio desteğiyle).
+    
+    asyncio motoru için ilk kullanımda arka plan iş parçacığında bir olay döngüsü
+    ve ona bağlı tek bir AsyncOpenAI istemcisi oluşturulur; motor kapatılana kadar
+    tüm işler (toplu modda eşzamanlı işler dahil) bu istemcinin bağlantı havuzunu paylaşır.
+    """
+    
+    name = 'openai'
+    model_name = WHISPER_MODEL
+    supports_async = True
+    supports_hedging = True
+    rate_limited = True
+    
+    def __init__(self, api_key: str = None, client: "openai.OpenAI" = None):
+        """
+        Args:
+            api_key: OpenAI API anahtarı (opsiyonel, ortam değişkeninden alınabilir)
+            client: Paylaşılan OpenAI istemcisi (opsiyonel, verilmezse oluşturulur ve close() ile kapatılır)
+        
+        Raises:
+            ConfigurationError: API anahtarı bulunamazsa
+        """
+        self.api_key = resolve_api_key(api_key)
+        self.owns_client = client is None
+        # Tekrar denemeleri SDK değil hız sınırlayıcı yönetir
+        self.client = client or openai.OpenAI(api_key=self.api_key, max_retries=0)
+        self.async_loop = None
+        self.async_thread = None
+        self.async_client = None
+        self.async_lock = threading.Lock()
+    
+    def latency_key(self, profile: str) -> str:
+        # Önceki sürümlerin ölçümleri profil adıyla saklanır
+        return profile
+    
+    def transcribe_chunk(self, spec: ChunkSpec, total_chunks: int, cache: TranscriptCache = None,
+                         manifest: JobManifest = None, limiter: AdaptiveRateLimiter = None,
+                         hedger: RequestHedger = None, on_request_done=None, hold_chunk=None) -> tuple:
+        return transcribe_chunk(spec.path, spec.index, total_chunks, self.api_key, cache=cache,
+                                content_key=spec.content_key, manifest=manifest, client=self.client, limiter=limiter,
+                                chunk_data=spec.data, keep_range=spec.keep_range, on_request_done=on_request_done,
+                                hedger=hedger, audio_seconds=spec.audio_duration_ms / 1000, hold_chunk=hold_chunk)
+    
+    def _get_async_loop(self):
+        """Arka plan olay döngüsünü (ilk çağrıda başlatarak) döndürür."""
+        with self.async_lock:
+            if self.async_loop is None:
+                self.async_loop = asyncio.new_event_loop()
+                self.async_thread = threading.Thread(target=self.async_loop.run_forever,
+                                                     name="openai-async", daemon=True)
+                self.async_thread.start()
+            return self.async_loop
+    
+    def run_async(self, make_coroutine):
+        loop = self._get_async_loop()
+        finished = threading.Event()
+        running = {}
+        
+        async def run():
+            running['task'] = asyncio.current_task()
+            try:
+                if self.async_client is None:
+                    # İstemci döngünün içinde oluşturulur; bağlantıları bu döngüye bağlıdır
+                    self.async_client = openai.AsyncOpenAI(api_key=self.api_key, max_retries=0)
+                return await make_coroutine(self.async_client)
+            finally:
+                finished.set()
+        
+        future = asyncio.run_coroutine_threadsafe(run(), loop)
+        try:
+            return future.result()
+        except BaseException:
+            # Ctrl-C veya hata: iş döngüde iptal edilir ve bitmesi beklenir
+            if not future.cancel():
+                while not finished.wait(0.1):
+                    if 'task' in running:
+                        loop.call_soon_threadsafe(running.pop('task').cancel)
+            raise
+    
+    async def _close_async(self):
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+        await asyncio.get_running_loop().shutdown_default_executor()
+    
+    def close(self):
+        if self.owns_client:
+            self.owns_client = False
+            self.client.close()
+        with self.async_lock:
+            loop, self.async_loop = self.async_loop, None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._close_async(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            self.async_thread.join()
+            loop.close()
+
+
+# Yerel motor işlemlerinde yüklenen model (her işlemde bir kez, _init_local_worker)
+_LOCAL_MODEL = None
+
+
+def _init_local_worker(model_path: str, compute_type: str, cpu_threads: int):
+    """Yerel motor işlemini başlatır: modeli bir kez belleğe yükler (ProcessPoolExecutor initializer)."""
+    global _LOCAL_MODEL
+    _LOCAL_MODEL = faster_whisper.WhisperModel(model_path, device='cpu', compute_type=compute_type,
+                                               cpu_threads=cpu_threads)
+
+
+def _transcribe_local(chunk_path: str, chunk_data: bytes, word_timestamps: bool) -> dict:
+    """
+    Parçayı yerel modelle transkript eder (yerel motor işleminde çalışır).
+    
+    Returns:
+        API'nin verbose_json yanıtıyla aynı alanları taşıyan sözlük (text, segments, words)
+    """
+    audio = chunk_path if chunk_data is None else io.BytesIO(chunk_data)
+    segments, _ = _LOCAL_MODEL.transcribe(audio, word_timestamps=word_timestamps)
+    result = {'text': "", 'segments': [], 'words': []}
+    texts = []
+    for segment in segments:
+        texts.append(segment.text.strip())
+        result['segments'].append({'start': segment.start, 'end': segment.end, 'text': segment.text.strip()})
+        for word in segment.words or []:
+            result['words'].append({'word': word.word.strip(), 'start': word.start, 'end': word.end})
+    result['text'] = " ".join(text for text in texts if text)
+    return result
+
+
+class LocalWhisperBackend(TranscriptionBackend):
+    """
+    API'ye bağlanmadan CPU üzerinde çalışan yerel Whisper motoru (faster-whisper /
+    CTranslate2). Yerel olarak sağlanan model dosyaları (CTranslate2 biçiminde
+    dönüştürülmüş model dizini) her işlemde bir kez yüklenir; parçalar makinenin
+    çekirdek sayısına göre boyutlanan bir işlem havuzunda işlenir. İşlem havuzu
+    motor kapatılana kadar açık kalır, böylece toplu işlerde model yeniden yüklenmez.
+    """
+    
+    name = 'local'
+    
+    def __init__(self, model_path: str, workers: int = None, threads_per_worker: int = LOCAL_THREADS_PER_WORKER,
+                 compute_type: str = LOCAL_DEFAULT_COMPUTE_TYPE):
+        """
+        Args:
+            model_path: CTranslate2 biçimindeki Whisper model dizini
+            workers: İşlem sayısı (varsayılan: çekirdek sayısı / threads_per_worker)
+            threads_per_worker: Her işlemin kullanacağı CPU iş parçacığı sayısı
+            compute_type: CTranslate2 hesaplama türü (ör. int8, int8_float32, float32)
+        
+        Raises:
+            ConfigurationError: faster-whisper yüklü değilse veya model dizini bulunamazsa
+        """
+        if not os.path.isdir(model_path):
+            raise ConfigurationError(f"Yerel model dizini bulunamadı: {model_path}")
+        # Eksik bağımlılık işlem havuzu başlamadan bildirilsin
+        faster_whisper.load()
+        self.model_path = os.path.abspath(model_path)
+        self.workers = workers or max(1, get_cpu_count() // threads_per_worker)
+        self.model_name = f"faster-whisper:{os.path.basename(os.path.normpath(model_path))}:{compute_type}"
+        self.pool = futures_process.ProcessPoolExecutor(max_workers=self.workers, initializer=_init_local_worker,
+                                        initargs=(self.model_path, compute_type, threads_per_worker))
+        print(f"Yerel motor: {self.workers} işlem × {threads_per_worker} iş parçacığı ({self.model_name})")
+    
+    def max_concurrency(self, requested: int = None) -> int:
+        # İşlem sayısından fazla parça aynı anda işlenemez
+        return self.workers
+    
+    def transcribe_chunk(self, spec: ChunkSpec, total_chunks: int, cache: TranscriptCache = None,
+                         manifest: JobManifest = None, limiter: AdaptiveRateLimiter = None,
+                         hedger: RequestHedger = None, on_request_done=None, hold_chunk=None) -> tuple:
+        chunk_index = spec.index
+        cache_key = None
+        if cache is not None:
+            cache_key = TranscriptCache.make_key(spec.content_key or hash_file(spec.path), self.cache_params(spec))
+            cached_text = cache.get(cache_key)
+            if cached_text is not None:
+                print(f"Parça {chunk_index+1}/{total_chunks} önbellekten alındı.")
+                if manifest is not None:
+                    manifest.mark_done(chunk_index, cached_text)
+                return (chunk_index, cached_text)
+        
+        print(f"Parça {chunk_index+1}/{total_chunks} işleniyor (yerel)...")
+        request_start = time.perf_counter()
+        try:
+            result = self.pool.submit(_transcribe_local, spec.path, spec.data, spec.keep_range is not None).result()
+        except BrokenExecutor as e:
+            raise TranscriptionError(f"Yerel motor işlemi beklenmedik şekilde sonlandı: {e}") from e
+        except Exception as e:
+            print(f"HATA: Parça {chunk_index+1} işlenemedi: {e}")
+            return (chunk_index, f"[Parça {chunk_index+1} işlenemedi: {e}]")
+        if on_request_done is not None:
+            on_request_done(time.perf_counter() - request_start)
+        
+        transcript = types.SimpleNamespace(
+            text=result['text'],
+            words=[types.SimpleNamespace(**word) for word in result['words']],
+            segments=[types.SimpleNamespace(**segment) for segment in result['segments']],
+        )
+        text = get_chunk_transcript_text(transcript, spec.keep_range)
+        print(f"Parça {chunk_index+1}/{total_chunks} tamamlandı.")
+        if cache is not None:
+            cache.put(cache_key, text)
+        if manifest is not None:
+            manifest.mark_done(chunk_index, text)
+        return (chunk_index, text)
+    
+    def close(self):
+        self.pool.shutdown(wait=True)
+
+
+def finish_transcript(manifest: JobManifest, all_transcripts: dict, total_chunks: int, duration_ms: int,
+                      timings: PipelineTimings = None) -> TranscriptResult:
+    """
+    Parça transkriptlerini sırayla birleştirir; tüm parçalar tamamlandıysa iş dizinini siler.
+    
+    Args:
+        manifest: İş manifest'i
+        all_transcripts: Parça indeksi -> transkript metni
+        total_chunks: Toplam parça sayısı
+        duration_ms: Ses süresi (milisaniye)
+        timings: İşin aşama süreleri (opsiyonel)
+    
+    Returns:
+        Birleştirilmiş transkripti ve başarısız parçaları içeren TranscriptResult
+    """
+    # Başarısız parça kaldıysa iş dizini --resume için saklanır
+    failed_chunks = [spec.index for spec in manifest.plan if spec.index not in manifest.transcripts]
+    if manifest.is_complete:
+        manifest.discard()
+    else:
+        print(f"UYARI: {len(failed_chunks)} parça işlenemedi. Yalnızca bu parçaları yeniden denemek için --resume kullanın.")
+    
+    # Parçaları birleştir
+    text = " ".join(all_transcripts[i] for i in sorted(all_transcripts) if all_transcripts[i])
+    return TranscriptResult(text, total_chunks, duration_ms, failed_chunks, timings=timings)
+
+
+def resolve_api_key(api_key: str = None) -> str:
+    """
+    API anahtarını parametreden veya OPENAI_API_KEY ortam değişkeninden alır.
+    
+    Args:
+        api_key: OpenAI API anahtarı (opsiyonel)
+    
+    Returns:
+        API anahtarı
+    
+    Raises:
+        ConfigurationError: Anahtar bulunamazsa
+    """
+    load_environment()
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ConfigurationError("OpenAI API anahtarı bulunamadı. Lütfen OPENAI_API_KEY ortam değişkenini "
+                                 "ayarlayın veya --api-key parametresini kullanın.")
+    return api_key
+
+
+def print_resume_hint(manifest: JobManifest):
+    """Yarıda kalan işte kaydedilen parça sayısını ve --resume ipucunu yazdırır."""
+    if manifest is not None and manifest.plan:
+        print(f"Tamamlanan parçalar kaydedildi ({len(manifest.transcripts)}/{len(manifest.plan)}). "
+              f"Kaldığı yerden devam etmek için aynı komutu --resume ile çalıştırın.")
+
+
+def transcribe_audio(audio_path: str, api_key: str = None, chunk_length_minutes: float = 5, max_workers: int = None, max_chunk_size_mb: float = 20.0, pipeline: AudioPipeline = None, streaming: bool = False, upload_profile: str = 'wav', silence_tolerance_sec: float = 0, vad_min_silence_sec: float = 0, cache: TranscriptCache = None, resume: bool = False,
+                     executor: ThreadPoolExecutor = None, engine: str = 'thread', limiter: AdaptiveRateLimiter = None,
+                     timings: PipelineTimings = None, workspace: Workspace = None, in_memory: bool = False,
+                     client: "openai.OpenAI" = None, on_chunk_text=None, overlap_sec: float = 0,
+                     chunk_plan: str = 'fixed', hedge: bool = False,
+                     hedge_budget: float = HEDGE_DEFAULT_BUDGET,
+                     backend: TranscriptionBackend = None, source_id: str = None) -> TranscriptResult:
+    """
+    Ses dosyasını bir transkript motoruyla (varsayılan: OpenAI Whisper API) metne çevirir.
+    Büyük dosyalar otomatik olarak parçalara bölünür ve birleştirilir.
+    Dil otomatik olarak algılanır ve ses dosyasındaki dilde transkript edilir.
+    Parçalar paralel olarak işlenir, bu da işlem süresini önemli ölçüde kısaltır.
+    Parçalama ile yükleme bir boru hattı olarak örtüşür: ilk parça kodlanır
+    kodlanmaz yüklenir, parçalama yüklemenin en fazla PIPELINE_PREFETCH_CHUNKS
+    parça (eşzamanlı istek sınırına ek olarak) önüne geçebilir.
+    
+    Args:
+        audio_path: Ses dosyası yolu
+        api_key: OpenAI API anahtarı (opsiyonel, ortam değişkeninden alınabilir)
+        chunk_length_minutes: Parça uzunluğu (dakika cinsinden, kesirli olabilir, varsayılan: 5)
+        max_workers: Eşzamanlı istek sayısının üst sınırı (varsayılan: DEFAULT_MAX_CONCURRENCY).
+            Gerçek eşzamanlılık 3'ten başlar ve API yanıtlarına göre ayarlanır.
+        max_chunk_size_mb: Maksimum parça boyutu (MB, varsayılan: 20MB)
+        pipeline: Aynı ses tamponunu paylaşan AudioPipeline (opsiyonel)
+        streaming: True ise dosya belleğe yüklenmez, ffmpeg ile parça parça kesilir
+        upload_profile: Parçaların yükleme profili (UPLOAD_PROFILES, varsayılan: 'wav')
+        silence_tolerance_sec: Kesim noktalarının en yakın duraklamaya kaydırılabileceği
+            süre (saniye, 0 ise kapalı, NumPy gerektirir)
+        vad_min_silence_sec: Bu süreden uzun konuşma dışı bölümler yüklemeden önce
+            kısaltılır (saniye, 0 ise kapalı, NumPy gerektirir). Orijinal zamanlar
+            pipeline.offset_map ile bulunabilir.
+        cache: Parça transkriptleri için kalıcı önbellek (opsiyonel)
+        resume: True ise aynı dosya ve ayarlarla yarım kalmış işin manifest'i
+            okunur; tamamlanan parçalar yeniden gönderilmez
+        executor: Parçaların gönderileceği paylaşılan havuz (opsiyonel). Verilirse
+            max_workers yok sayılır; eşzamanlılık sınırı havuzun kendisidir (toplu mod).
+        engine: 'thread' (ThreadPoolExecutor) veya 'async' (tek AsyncOpenAI istemcisi,
+            max_workers eşzamanlı istek üst sınırıdır). executor verilirse her zaman 'thread'.
+        limiter: Paylaşılan hız sınırlayıcı (opsiyonel, toplu mod). Verilmezse
+            max_workers üst sınırıyla yeni bir tane oluşturulur.
+        timings: Aşama sürelerinin kaydedileceği PipelineTimings (opsiyonel).
+            İndirme gibi önceki aşamaları da görmek için çağıran tarafından verilir.
+        workspace: Parçaların yazılacağı çalışma alanı (opsiyonel). Verilmezse bu
+            çağrı için bir tane oluşturulur ve çıkışta (hata dahil) silinir.
+        in_memory: True ise kodlanan parçalar diske yazılmaz, bellekte tutulup
+            doğrudan yüklenir. Bellekteki toplam parça boyutu çalışma alanının
+            bütçesiyle (kendi oluşturduğu çalışma alanında IN_MEMORY_DEFAULT_MAX_MB) sınırlanır.
+        client: İşler arasında paylaşılan OpenAI istemcisi (opsiyonel, 'thread' motoru).
+            Verilmezse bu çağrı için bir tane oluşturulur.
+        on_chunk_text: Her parçanın metni, önceki tüm parçalar tamamlandığı anda
+            (chunk_index, text) ile sırayla bu fonksiyona iletilir (opsiyonel, akış çıktısı).
+            --resume ile önceden tamamlanan parçalar da sırayla iletilir.
+        overlap_sec: Komşu parçaların paylaşacağı ses süresi (saniye, 0 ise kapalı).
+            Örtüşmeli parçalar için kelime zamanları istenir; her kelime kesim
+            noktasına göre tek parçada tutulur ve birleşme noktasında iki kez
+            yazılan kelimeler ayıklanır. Kısa parçalarla yüksek eşzamanlılık için.
+        chunk_plan: 'fixed' (chunk_length_minutes uzunluğunda parçalar) veya 'latency'
+            (parça sayısı eşzamanlılık ve ölçülen istek süresi modeline göre beklenen
+            toplam süreyi en aza indirecek şekilde seçilir, parçalar en uzundan
+            başlayarak gönderilir; tahmini ve gerçek süre yazdırılır)
+        hedge: True ise süresi kardeş parçaların süre dağılımına göre belirlenen sınırı
+            aşan istek için yedek istek gönderilir ve önce biten yanıt kullanılır (RequestHedger)
+        hedge_budget: Yedek isteklerle en fazla yüklenebilecek ses oranı (varsayılan: %10)
+        backend: Parçaları transkript edecek TranscriptionBackend (opsiyonel). Verilmezse
+            api_key ve client ile bu çağrı için bir OpenAIBackend oluşturulur. asyncio motoru
+            ve yedek istekler yalnızca bunları destekleyen motorlarda kullanılır; yerel
+            motorda eşzamanlılık işlem sayısıyla sınırlıdır.
+        source_id: İş manifest'inde kaynağı tanımlayan kimlik (opsiyonel, varsayılan:
+            audio_path'in gerçek yolu). İndirilen sesler her seferinde farklı geçici
+            dizine yazıldığından --resume için URL verilir.
+    
+    Returns:
+        Transkript metnini (ses dosyasındaki dilde) ve parça bilgilerini içeren TranscriptResult
+    
+    Raises:
+        ConfigurationError: API anahtarı bulunamazsa (OpenAI motoru)
+        TranscriptionError: Ses işlenemezse. Tamamlanan parçalar manifest'te kalır (--resume).
+        KeyboardInterrupt: Kullanıcı işlemi durdurursa (tamamlanan parçalar yine kaydedilir)
+    """
+    owns_backend = backend is None
+    if owns_backend:
+        backend = OpenAIBackend(api_key, client)
+    
+    manifest = None
+    latency_model = None
+    if timings is None:
+        timings = PipelineTimings()
+    owns_workspace = workspace is None
+    if owns_workspace:
+        workspace = Workspace(max_bytes=IN_MEMORY_DEFAULT_MAX_MB * 1024 * 1024 if in_memory else 0)
+    
+    try:
+        if pipeline is None:
+            pipeline = AudioPipeline(audio_path, upload_profile)
+        
+        if streaming:
+            # Akış modu: dosya çözülmez, süre ffprobe ile okunur
+            duration_ms = pipeline.probe_duration_ms()
+        else:
+            # Ses dosyasını tek seferde çöz ve süresini kontrol et
+            with timings.stage("çözme").measure():
+                duration_ms = pipeline.duration_ms
+        
+        print(f"Ses dosyası süresi: {duration_ms / (60 * 1000):.2f} dakika")
+        
+        # Yüklemeden önce uzun konuşma dışı bölümleri kısalt (VAD)
+        source_path = audio_path
+        if vad_min_silence_sec > 0:
+            if streaming:
+                print("UYARI: VAD akış modunda desteklenmiyor, atlanıyor.")
+            elif not np.is_available():
+                print("UYARI: VAD için NumPy gerekli (pip install numpy), atlanıyor.")
+            else:
+                with timings.stage("vad").measure():
+                    pipeline.apply_vad(int(vad_min_silence_sec * 1000))
+                duration_ms = pipeline.duration_ms
+                # Kırpılmış ses kaynak dosyadan farklıdır, doğrudan yüklenemez
+                source_path = None
+        
+        # Parça düzenini kodlamadan önce planla
+        if streaming:
+            audio_info = pipeline.probe()
+            sample_width = 2  # ffmpeg WAV çıkışı 16-bit PCM
+        else:
+            audio = pipeline.load()
+            audio_info = {'channels': audio.channels, 'sample_rate': audio.frame_rate}
+            sample_width = audio.sample_width
+        if silence_tolerance_sec > 0 and not np.is_available():
+            print("UYARI: Sessizliğe göre kesim için NumPy gerekli (pip install numpy). Sabit kesim kullanılacak.")
+            silence_tolerance_sec = 0
+        tolerance_ms = int(silence_tolerance_sec * 1000)
+        
+        # İş manifest'i: kaynak ve parça düzenini etkileyen ayarlar aynıysa aynı iş dizini kullanılır
+        source_digest = hash_source_file(audio_path)
+        manifest = JobManifest(source_digest, {
+            'model': backend.model_name,
+            'profile': pipeline.profile,
+            'chunk_length_minutes': chunk_length_minutes,
+            'max_chunk_size_mb': max_chunk_size_mb,
+            'silence_tolerance_sec': silence_tolerance_sec,
+            'vad_min_silence_sec': vad_min_silence_sec if source_path is None else 0,
+            'streaming': streaming,
+            'overlap_sec': overlap_sec,
+            'chunk_plan': chunk_plan,
+        }, source_key=source_id or os.path.realpath(audio_path))
+        
+        # İstek süresi modeli yalnızca gecikme planı ve yedek istekler için okunup güncellenir
+        if chunk_plan == 'latency' or (hedge and backend.supports_hedging):
+            latency_model = LatencyModel(backend.latency_key(pipeline.profile))
+        planned_concurrency = limiter.max_concurrency if limiter is not None else backend.max_concurrency(max_workers)
+        
+        if resume and manifest.load():
+            plan = manifest.restore_plan(audio_path)
+            total_chunks = len(plan)
+            print(f"Yarım kalan iş bulundu: {len(manifest.transcripts)}/{total_chunks} parça zaten tamamlanmış.")
+        else:
+            if resume:
+                print("Bilgi: Bu dosya ve ayarlar için yarım kalan iş bulunamadı, baştan başlanıyor.")
+            plan = plan_audio_chunks(duration_ms, chunk_length_minutes, max_chunk_size_mb, pipeline.profile,
+                                     audio_info['channels'], audio_info['sample_rate'], sample_width, source_path=source_path,
+                                     boundary_tolerance_ms=tolerance_ms, overlap_ms=int(overlap_sec * 1000),
+                                     concurrency=planned_concurrency,
+                                     latency_model=latency_model if chunk_plan == 'latency' else None)
+            total_chunks = len(plan)
+            
+            # Kesim noktalarını kelimeleri bölmemek için duraklamalara hizala
+            if tolerance_ms and total_chunks > 1:
+                snap_start = time.perf_counter()
+                read_window = make_ffmpeg_window_reader(audio_path) if streaming else make_segment_window_reader(audio)
+                moved = snap_chunk_boundaries(plan, read_window, tolerance_ms)
+                print(f"Sessizlik hizalama: {moved}/{total_chunks - 1} kesim noktası kaydırıldı ({time.perf_counter() - snap_start:.2f} saniye)")
+            
+            manifest.start(plan, audio_path)
+        
+        # Önbellekte metni olan parçalar kodlanmadan tamamlanır; kodlama maliyeti de atlanır
+        if cache is not None:
+            cached_texts = {}
+            for spec in plan:
+                if spec.index in manifest.transcripts or spec.path is not None:
+                    continue
+                if spec.content_key is None:
+                    spec.content_key = get_chunk_content_key(spec, pipeline.profile, audio=None if streaming else audio,
+                                                             source_digest=source_digest)
+                cached_text = cache.get(TranscriptCache.make_key(spec.content_key, backend.cache_params(spec)))
+                if cached_text is not None:
+                    cached_texts[spec.index] = cached_text
+            if cached_texts:
+                manifest.mark_all_done(cached_texts)
+                print(f"{len(cached_texts)}/{total_chunks} parça önbellekten alındı, bu parçalar kodlanmayacak.")
+        
+        # Yalnızca transkripti olmayan parçalar kodlanır ve gönderilir
+        pending = [spec for spec in plan if spec.index not in manifest.transcripts]
+        if chunk_plan == 'latency':
+            # En uzun parçalar önce: son dalgada yalnızca kısa parçalar kalır
+            pending.sort(key=lambda spec: spec.audio_duration_ms, reverse=True)
+        
+        if streaming:
+            # Parçalar kesildikçe işleme gönderilir
+            chunks = iter_audio_chunks(audio_path, max_size_mb=max_chunk_size_mb, audio_info=audio_info, profile=pipeline.profile,
+                                       plan=pending, source_digest=source_digest, workspace=workspace, in_memory=in_memory)
+            if total_chunks > 1:
+                print(f"Akış modu: dosya {total_chunks} parça halinde kesilirken işlenecek (her parça ~{plan[0].duration_ms/60000:.1f} dakika)")
+        else:
+            # Parçalar aynı çözülmüş tampondan kodlandıkça işleme gönderilir
+            chunks = iter_split_chunks(audio_path, audio, pipeline.profile, pending, max_chunk_size_mb, workspace=workspace,
+                                       in_memory=in_memory)
+            if total_chunks > 1:
+                print(f"Dosya {total_chunks} parçaya bölünüyor, parçalar kodlandıkça işlenecek (her parça ~{plan[0].duration_ms/60000:.1f} dakika, max {max_chunk_size_mb}MB, '{pipeline.profile}' profili)")
+        
+        # Eşzamanlılık API yanıtlarına göre ayarlanır; max_workers yalnızca üst sınırdır
+        concurrency = max(1, min(backend.max_concurrency(max_workers), len(pending)))
+        if engine == 'async' and not backend.supports_async:
+            print(f"Bilgi: '{backend.name}' motoru asyncio desteklemiyor, iş parçacığı motoru kullanılacak.")
+            engine = 'thread'
+        owns_limiter = limiter is None
+        if owns_limiter:
+            if backend.rate_limited:
+                limiter = AdaptiveRateLimiter(concurrency)
+                if total_chunks > 1:
+                    print(f"Parçalar paralel olarak işlenecek ({'asyncio' if engine == 'async' else 'iş parçacığı'} motoru, "
+                          f"{int(limiter.limit)} eşzamanlı istekten başlayarak en fazla {concurrency})...")
+            else:
+                # Hız sınırı olmayan motorda tüm çalışanlar baştan kullanılır
+                limiter = AdaptiveRateLimiter(concurrency, initial_concurrency=concurrency)
+                if total_chunks > 1:
+                    print(f"Parçalar paralel olarak işlenecek ('{backend.name}' motoru, {concurrency} eşzamanlı parça)...")
+        
+        predicted_seconds = None
+        if chunk_plan == 'latency' and pending:
+            limiter.warm_up(min(len(pending), planned_concurrency))
+            predicted_seconds = predict_makespan([spec.audio_duration_ms for spec in pending],
+                                                 min(len(pending), planned_concurrency), latency_model)
+        
+        # Geride kalan istekler için yedek istek; ek yükleme bekleyen sesin hedge_budget oranıyla sınırlı
+        hedger = None
+        if hedge and not backend.supports_hedging:
+            print(f"Bilgi: '{backend.name}' motoru yedek istek desteklemiyor, --hedge yok sayılıyor.")
+        elif hedge and len(pending) > 1:
+            hedger = RequestHedger(latency_model, limiter, sum(spec.audio_duration_ms for spec in pending) / 1000, hedge_budget)
+        
+        def observe_request(spec: ChunkSpec, seconds: float):
+            if latency_model is not None:
+                latency_model.observe(spec.audio_duration_ms / 1000, seconds)
+            if hedger is not None:
+                hedger.observe(spec.audio_duration_ms / 1000, seconds)
+        
+        def finish() -> TranscriptResult:
+            if predicted_seconds is not None and upload_stage.first_start is not None:
+                print(f"Gecikme planı: tahmini {predicted_seconds:.1f} sn, gerçek {upload_stage.last_end - upload_stage.first_start:.1f} sn (yükleme aşaması)")
+            if hedger is not None:
+                hedger.report()
+            return finish_transcript(manifest, all_transcripts, total_chunks, duration_ms, timings)
+        
+        # Parçalama ayrı bir iş parçacığında yüklemeyle örtüşür; yüklemenin önüne geçebileceği parça sayısı sınırlıdır
+        chunk_queue = ChunkQueue(chunks, limiter.max_concurrency + PIPELINE_PREFETCH_CHUNKS,
+                                 timings.stage("parçalama", "yükleme kuyruğu dolu (geri basınç)"), workspace)
+        upload_stage = timings.stage("yükleme")
+        
+        # Parça metinleri tamamlandıkça sıraya konur; önceki parçalar bitince hemen iletilir.
+        # Örtüşmeli parçalarda önceki parçanın da yazdığı kelimeler bu sırada ayıklanır.
+        text_stage = timings.stage("metin")
+        all_transcripts = {}
+        previous_text = None
+        
+        def emit_text(chunk_index: int, text: str):
+            nonlocal previous_text
+            now = time.perf_counter()
+            text_stage.record(now, now)
+            raw_text = text
+            if previous_text is not None and plan[chunk_index].lead_ms:
+                text = strip_overlap_prefix(previous_text, text)
+            previous_text = raw_text
+            all_transcripts[chunk_index] = text
+            if on_chunk_text is not None:
+                on_chunk_text(chunk_index, text)
+        
+        reorder_buffer = ChunkReorderBuffer(emit_text)
+        for chunk_index, text in manifest.transcripts.items():
+            reorder_buffer.put(chunk_index, text)
+        
+        if engine == 'async' and executor is None:
+            try:
+                backend.run_async(
+                    lambda client: transcribe_chunks_async(chunk_queue, total_chunks, client, limiter, cache=cache,
+                                                           manifest=manifest, upload_stage=upload_stage,
+                                                           on_chunk_done=chunk_queue.done, on_chunk_text=reorder_buffer.put,
+                                                           on_request_done=observe_request, hedger=hedger)
+                )
+            finally:
+                chunk_queue.close()
+                if owns_limiter:
+                    limiter.report()
+            return finish()
+        
+        owns_executor = executor is None
+        if owns_executor:
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+        
+        # Tüm parçalar motorun tek istemcisini (veya işlem havuzunu) paylaşır
+        def upload(spec: ChunkSpec, lease: ChunkLease) -> tuple:
+            try:
+                with upload_stage.measure():
+                    result = backend.transcribe_chunk(spec, total_chunks, cache=cache, manifest=manifest, limiter=limiter,
+                                                      hedger=hedger, hold_chunk=lease.hold,
+                                                      on_request_done=lambda seconds: observe_request(spec, seconds))
+            finally:
+                # Geç kalan yedek istek sürüyorsa parça dosyası o bitince silinir
+                lease.release()
+            # Metin, tüm parçalar gönderilmeyi beklemeden çalışan iş parçacığından iletilir
+            reorder_buffer.put(*result)
+            return result
+        
+        def release_if_cancelled(future, lease: ChunkLease):
+            # Hiç çalışmadan iptal edilen parçanın kullanımı hemen biter
+            if future.cancelled():
+                lease.release()
+        
+        # Parçalar üretildikçe havuza gönderilir
+        futures = []
+        try:
+            for spec in chunk_queue:
+                lease = ChunkLease(lambda spec=spec: chunk_queue.done(spec))
+                try:
+                    future = executor.submit(upload, spec, lease)
+                except BaseException:
+                    lease.release()
+                    raise
+                future.add_done_callback(lambda future, lease=lease: release_if_cancelled(future, lease))
+                futures.append(future)
+            
+            # Tüm parçaların bitmesini bekle; metinler reorder_buffer üzerinden toplanır
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Kuyruktaki parçaları iptal et (Ctrl-C veya hata), çalışanların bitmesini bekle
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            chunk_queue.close()
+            if owns_executor:
+                executor.shutdown(wait=True)
+                limiter.report()
+        
+        return finish()
+    
+    except KeyboardInterrupt:
+        print("\nİşlem kullanıcı tarafından durduruldu.")
+        print_resume_hint(manifest)
+        raise
+    
+    except TranscriptionError:
+        print_resume_hint(manifest)
+        raise
+    
+    except Exception as e:
+        print_resume_hint(manifest)
+        raise TranscriptionError(f"Transkript işlemi sırasında hata oluştu: {e}") from e
+    
+    finally:
+        if latency_model is not None:
+            latency_model.save()
+        if owns_workspace:
+            workspace.cleanup()
+        if owns_backend:
+            backend.close()
+
+
+def save_transcript(text: str, output_path: str):
+    """
+    Transkripti dosyaya kaydeder.
+    
+    Args:
+        text: Kaydedilecek metin
+        output_path: Çıkış dosyası yolu
+    
+    Raises:
+        OutputError: Dosya yazılamazsa
+    """
+    try:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    except OSError as e:
+        raise OutputError(f"Dosya kaydedilirken hata oluştu: {e}") from e
+    print(f"Transkript kaydedildi: {output_path}")
+
+
+def get_default_output_name(input_path: Path, video_title: str = None) -> str:
+    """
+    Transkript dosyası için varsayılan adı üretir.
+    
+    Args:
+        input_path: Ses dosyası yolu
+        video_title: URL'den indirildiyse video başlığı (opsiyonel)
+    
+    Returns:
+        Dosya adı ([başlık veya dosya adı]_transkript.txt)
+    """
+    if video_title:
+        # Video başlığından güvenli dosya adı oluştur
+        safe_title = re.sub(r'[<>:"/\\|?*]', '_', video_title)
+        return safe_title + "_transkript.txt"
+    return input_path.stem + "_transkript.txt"
+
+
+def resolve_output_path(output: str, input_file: str, video_title: str = None) -> str:
+    """
+    Komut satırındaki --output değerine göre transkript dosyasının yolunu belirler.
+    
+    Args:
+        output: --output değeri (None ise varsayılan ad kullanılır; bir klasör veya
+            uzantısız yol ise varsayılan ad bu klasörün içinde oluşturulur)
+        input_file: Ses dosyası yolu veya URL
+        video_title: URL'den indirildiyse video başlığı (opsiyonel)
+    
+    Returns:
+        Çıkış dosyası yolu
+    """
+    default_name = get_default_output_name(Path(input_file), video_title)
+    if output is None:
+        return default_name
+    if Path(output).is_dir() or not Path(output).suffix:
+        os.makedirs(output, exist_ok=True)
+        return str(Path(output) / default_name)
+    return output
+
+
+class Transcriber:
+    """
+    Uzun ömürlü bir süreçte (ör. iş kuyruğu çalışanı) çok sayıda işi sırayla veya
+    aynı anda transkript etmek için tekrar kullanılabilen servis.
+    
+    Transkript motoru (OpenAI istemcisi ve bağlantı havuzu ya da yerel motorun
+    işlem havuzu), parça istek havuzu, hız sınırlayıcı ve transkript önbelleği
+    bir kez oluşturulur ve tüm işler arasında paylaşılır; her
+    dosya için yeni süreç, içe aktarma ve TLS bağlantısı maliyeti ödenmez.
+    transcribe() birden fazla iş parçacığından aynı anda çağrılabilir; eşzamanlı
+    istek sayısı tüm işler için toplamda max_workers ile sınırlıdır. Hatalar
+    sys.exit ile değil TranscriptionError alt sınıflarıyla bildirilir, soru sorulmaz.
+    
+    Örnek:
+        with Transcriber(max_workers=16, upload_profile='opus') as transcriber:
+            result = transcriber.transcribe("kayit.mp3")
+            print(result.text)
+    """
+    
+    def __init__(self, api_key: str = None, max_workers: int = DEFAULT_MAX_CONCURRENCY, use_cache: bool = True,
+                 cache_max_size_mb: float = DEFAULT_CACHE_MAX_MB, download_format: str = 'native',
+                 workspace_dir: str = None, workspace_max_bytes: int = 0, backend: TranscriptionBackend = None,
+                 **transcribe_options):
+        """
+        Args:
+            api_key: OpenAI API anahtarı (opsiyonel, ortam değişkeninden alınabilir)
+            max_workers: Tüm işler için toplam eşzamanlı istek sayısının üst sınırı
+                (yerel motorda motorun işlem sayısı kullanılır)
+            use_cache: Parça transkriptleri için kalıcı önbellek kullanılsın mı
+            cache_max_size_mb: Önbelleğin en büyük boyutu (MB)
+            download_format: URL'ler için indirme biçimi (DOWNLOAD_FORMATS)
+            workspace_dir: İş başına çalışma alanlarının oluşturulacağı dizin (opsiyonel, ör. /dev/shm)
+            workspace_max_bytes: İş başına parça bütçesi (0 ise sınırsız; in_memory
+                seçeneğinde IN_MEMORY_DEFAULT_MAX_MB)
+            backend: Paylaşılan TranscriptionBackend (opsiyonel, verilmezse OpenAIBackend).
+                Transcriber kapatılınca motor da kapatılır.
+            **transcribe_options: Her iş için transcribe_audio() varsayılanları
+                (chunk_length_minutes, upload_profile, streaming, resume, engine, ...)
+        
+        Raises:
+            ConfigurationError: API anahtarı bulunamazsa (OpenAI motoru)
+        """
+        self.backend = backend or OpenAIBackend(api_key)
+        self.download_format = download_format
+        self.workspace_dir = workspace_dir
+        if transcribe_options.get('in_memory') and not workspace_max_bytes:
+            workspace_max_bytes = IN_MEMORY_DEFAULT_MAX_MB * 1024 * 1024
+        self.workspace_max_bytes = workspace_max_bytes
+        self.transcribe_options = transcribe_options
+        max_workers = self.backend.max_concurrency(max_workers)
+        if self.backend.rate_limited:
+            self.limiter = AdaptiveRateLimiter(max_workers)
+        else:
+            self.limiter = AdaptiveRateLimiter(max_workers, initial_concurrency=max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.cache = TranscriptCache(max_size_mb=cache_max_size_mb) if use_cache else None
+    
+    def transcribe(self, source: str, **options) -> TranscriptResult:
+        """
+        Bir ses dosyasını veya video URL'sini transkript eder. İndirilen ses ve
+        parçalar işe özel bir çalışma alanında tutulur ve iş bitince silinir.
+        
+        Args:
+            source: Ses dosyası yolu veya video URL'si
+            **options: Bu iş için transcribe_audio() parametrelerini geçersiz kılar
+                (timings verilirse aşama süreleri ona yazılır)
+        
+        Returns:
+            TranscriptResult (source ve URL'ler için video başlığı doldurulmuş)
+        
+        Raises:
+            InputError: Dosya bulunamazsa
+            DownloadError: URL'den ses indirilemezse
+            TranscriptionError: Ses işlenemezse
+        """
+        options = dict(self.transcribe_options, **options)
+        timings = options.pop('timings', None) or PipelineTimings()
+        if options.get('engine') == 'async':
+            # asyncio motoru motorun olay döngüsünü ve istemcisini kullanır; iş parçacığı havuzu gerekmez
+            shared = {'backend': self.backend}
+        else:
+            shared = {'executor': self.executor, 'backend': self.backend}
+        video_title = None
+        
+        if not is_url(source) and not os.path.exists(source):
+            raise InputError(f"Dosya bulunamadı: {source}")
+        
+        with Workspace(self.workspace_dir, self.workspace_max_bytes) as workspace:
+            audio_path = source
+            if is_url(source):
+                with timings.stage("indirme").measure():
+                    audio_path, video_title = download_audio_from_url(source, workspace.subdir("download"),
+                                                                      self.download_format)
+            
+            # Kaynak dosya bir kez çözülür; ara WAV dosyası oluşturulmaz
+            pipeline = AudioPipeline(audio_path, options.get('upload_profile', 'wav'))
+            try:
+                result = transcribe_audio(audio_path, pipeline=pipeline, cache=self.cache,
+                                          limiter=self.limiter, timings=timings, workspace=workspace,
+                                          source_id=source if is_url(source) else None, **shared, **options)
+                pipeline.report()
+                workspace.report()
+            finally:
+                pipeline.release()
+        
+        result.source = source
+        result.title = video_title
+        return result
+    
+    def iter_chunks(self, source: str, **options):
+        """
+        transcribe() ile aynı işi yapar, ancak her parçanın metnini önceki tüm
+        parçalar tamamlandığı anda sırayla üretir. İş arka planda bir iş
+        parçacığında çalışır; üreteç bitince dönüş değeri (StopIteration.value)
+        TranscriptResult'tır.
+        
+        Örnek:
+            for chunk_index, text in transcriber.iter_chunks("kayit.mp3"):
+                print(text, flush=True)
+        
+        Args:
+            source: Ses dosyası yolu veya video URL'si
+            **options: Bu iş için transcribe_audio() parametrelerini geçersiz kılar
+        
+        Yields:
+            (chunk_index, text) çiftleri, parça sırasıyla
+        
+        Raises:
+            TranscriptionError: transcribe() ile aynı hatalar, iş bitince yeniden yükseltilir
+        """
+        texts = queue.Queue()
+        outcome = {}
+        finished = object()
+        
+        def run():
+            try:
+                outcome['result'] = self.transcribe(source, on_chunk_text=lambda *item: texts.put(item), **options)
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                texts.put(finished)
+        
+        worker = threading.Thread(target=run, name="transcriber-stream", daemon=True)
+        worker.start()
+        while True:
+            item = texts.get()
+            if item is finished:
+                break
+            yield item
+        worker.join()
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome['result']
+    
+    def report(self):
+        """Paylaşılan hız sınırlayıcı ve önbellek istatistiklerini yazdırır."""
+        self.limiter.report()
+        if self.cache is not None:
+            self.cache.report()
+    
+    def close(self):
+        """İstek havuzunun bitmesini bekler; motoru ve önbelleği kapatır."""
+        self.executor.shutdown(wait=True)
+        self.backend.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def collect_batch_inputs(source: str) -> list:
+    """
+    Toplu mod için giriş listesini oluşturur.
+    
+    Args:
+        source: Dizin (içindeki desteklenen ses/video dosyaları), glob deseni
+            (ör. "kayitlar/*.mp3") veya her satırında bir dosya yolu ya da URL
+            bulunan liste dosyası (boş satırlar ve # ile başlayanlar yok sayılır)
+    
+    Returns:
+        Dosya yolları ve URL'lerin listesi
+    
+    Raises:
+        InputError: Kaynak bulunamazsa
+    """
+    if os.path.isdir(source):
+        return sorted(
+            str(path) for path in Path(source).iterdir()
+            if path.is_file() and path.suffix.lower() in SUPPORTED_INPUT_EXTENSIONS
+        )
+    
+    if glob.has_magic(source):
+        return sorted(path for path in glob.glob(source) if os.path.isfile(path))
+    
+    if os.path.isfile(source):
+        items = []
+        with open(source, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    items.append(line)
+        return items
+    
+    raise InputError(f"Toplu giriş bulunamadı: {source}")
+
+
+def transcribe_batch_item(item: str, output_dir: str, transcriber: Transcriber) -> str:
+    """
+    Toplu moddaki tek bir dosyayı/URL'yi transkript edip çıkış dizinine kaydeder.
+    Parçalar transcriber'ın paylaşılan havuzuna gönderilir.
+    
+    Args:
+        item: Dosya yolu veya URL
+        output_dir: Transkriptlerin yazılacağı dizin
+        transcriber: Tüm dosyaların paylaştığı Transcriber (istek havuzu, hız sınırlayıcı, önbellek)
+    
+    Returns:
+        Kaydedilen transkript dosyasının yolu, dosya zaten varsa None
+    """
+    # Çıkışı zaten olan yerel dosyalar çözülmeden atlanır
+    if not is_url(item):
+        output_path = os.path.join(output_dir, get_default_output_name(Path(item)))
+        if os.path.exists(output_path):
+            print(f"Bilgi: {output_path} zaten var, {item} atlanıyor.")
+            return None
+    
+    result = transcriber.transcribe(item)
+    output_path = os.path.join(output_dir, get_default_output_name(Path(item), result.title))
+    save_transcript(result.text, output_path)
+    result.timings.report(item)
+    return output_path
+
+
+def transcribe_batch(items: list, output_dir: str, transcriber: Transcriber, max_files: int = None) -> tuple:
+    """
+    Birden fazla dosyayı/URL'yi etkileşimsiz olarak transkript eder.
+    
+    Tüm dosyaların parçaları transcriber'ın paylaşılan havuzuna gönderilir; böylece
+    eşzamanlı API isteği sayısı dosya başına değil, toplamda sınırlanır ve tek bir
+    hız sınırlayıcı tüm dosyalar için API yanıtlarına göre ayarlanır. Dosyalar (indirme, çözme, parçalama) ayrı bir havuzda aynı anda
+    hazırlanır; kısa dosyalardan oluşan uzun kuyruklarda istek havuzu boş kalmaz.
+    Bir dosyadaki hata diğerlerini durdurmaz.
+    
+    Args:
+        items: Dosya yolları ve URL'ler
+        output_dir: Transkriptlerin yazılacağı dizin
+        transcriber: Tüm dosyaların paylaştığı Transcriber
+        max_files: Aynı anda hazırlanan dosya sayısı (varsayılan: eşzamanlı istek üst sınırı)
+    
+    Returns:
+        (başarılı, atlanan, başarısız) dosya sayıları
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if max_files is None:
+        max_files = transcriber.limiter.max_concurrency
+    succeeded = skipped = failed = 0
+    
+    print(f"Toplu mod: {len(items)} giriş, en fazla {transcriber.limiter.max_concurrency} eşzamanlı istek, "
+          f"çıkış dizini: {output_dir}")
+    start_time = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_files, len(items)))) as file_executor:
+        futures = {
+            file_executor.submit(transcribe_batch_item, item, output_dir, transcriber): item
+            for item in items
+        }
+        try:
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    if future.result() is None:
+                        skipped += 1
+                    else:
+                        succeeded += 1
+                except Exception as e:
+                    # Toplu modda yalnızca bu dosya başarısız sayılır
+                    failed += 1
+                    print(f"HATA: {item} işlenemedi: {e}")
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            raise
+    
+    print(f"Toplu mod tamamlandı: {succeeded} başarılı, {skipped} atlandı, {failed} başarısız "
+          f"({time.perf_counter() - start_time:.1f} saniye)")
+    return succeeded, skipped, failed
+
+
+def is_process_alive(pid: int) -> bool:
+    """
+    Aynı makinede verilen pid ile çalışan bir süreç olup olmadığını döndürür.
+    
+    Args:
+        pid: Süreç kimliği
+    
+    Returns:
+        Süreç çalışıyorsa (veya durumu belirlenemiyorsa) True
+    """
+    if sys.platform == 'win32':
+        # Windows'ta os.kill(pid, 0) süreci sonlandırır; durum OpenProcess ile sorgulanır
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Başka kullanıcının süreci
+    return True
+
+
+class SpoolDaemon:
+    """
+    Bir kuyruk (spool) dizinini izleyip bırakılan işleri sürekli çalışan tek
+    süreçte transkript eden daemon.
+    
+    İşler incoming/ altına bırakılır: desteklenen bir ses dosyası veya ilk dolu
+    satırında dosya yolu ya da URL bulunan bir .job dosyası. Dosyayı önce başka
+    bir adla (ör. .part uzantısı veya nokta ile başlayan ad) yazıp sonra
+    incoming/ içine taşıyın; yarım dosyalar alınmaz. .job dosyasındaki göreli
+    yollar kuyruk dizinine göre çözülür. Alınan iş atomik olarak daemon'un
+    processing/<makine>.<pid>/ dizinine taşınır; böylece aynı kuyruğu izleyen
+    birden fazla daemon birbirinin işini almaz. Bitince iş done/ veya (hata
+    mesajıyla birlikte) failed/ dizinine geçer; aynı adlı bir kayıt varsa
+    üzerine yazılmaz, ada sıra numarası eklenir. Daemon başladığında yalnızca
+    sahibi artık çalışmayan (aynı makinede) işler kuyruğa geri alınır ve
+    tamamlanan parçaları atlanarak sürdürülür.
+    
+    Tüm işler aynı Transcriber'ı (istemci, istek havuzu, hız sınırlayıcı, önbellek)
+    paylaşır. Kuyruk derinliği ve verim sayaçları her turda status.json dosyasına yazılır.
+    """
+    
+    JOB_EXTENSION = '.job'
+    
+    def __init__(self, spool_dir: str, transcriber: Transcriber, output_dir: str = None, max_files: int = None,
+                 poll_interval: float = DAEMON_POLL_INTERVAL_SEC, report_interval: float = DAEMON_REPORT_INTERVAL_SEC):
+        """
+        Args:
+            spool_dir: Kuyruk dizini (incoming/, processing/, done/, failed/ alt dizinleri oluşturulur)
+            transcriber: Tüm işlerin paylaştığı Transcriber
+            output_dir: Transkriptlerin yazılacağı dizin (varsayılan: spool_dir/done)
+            max_files: Aynı anda işlenen iş sayısı (varsayılan: eşzamanlı istek üst sınırı)
+            poll_interval: Kuyruğun taranma aralığı (saniye)
+            report_interval: Sayaçların konsola yazdırılma aralığı (saniye)
+        """
+        self.transcriber = transcriber
+        self.spool_dir = os.path.abspath(spool_dir)
+        self.dirs = {name: os.path.join(self.spool_dir, name) for name in ('incoming', 'processing', 'done', 'failed')}
+        for path in self.dirs.values():
+            os.makedirs(path, exist_ok=True)
+        # Alınan işler bu daemon'a ait alt dizinde tutulur; sahiplik dizin adından okunur
+        self.host = socket.gethostname()
+        self.owner_dir = os.path.join(self.dirs['processing'], f"{self.host}.{os.getpid()}")
+        self.status_path = os.path.join(spool_dir, "status.json")
+        self.output_dir = output_dir or self.dirs['done']
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.max_files = max_files or transcriber.limiter.max_concurrency
+        self.poll_interval = poll_interval
+        self.report_interval = report_interval
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.audio_ms = 0
+        self.started = time.monotonic()
+    
+    def recover(self) -> int:
+        """
+        Sahibi artık çalışmayan daemon'ların processing/ içinde bıraktığı işleri
+        kuyruğa geri alır. Çalışan bir daemon'un (veya sahipliği doğrulanamayan,
+        başka makinedeki bir daemon'un) işlerine dokunulmaz. Eski sürümlerin
+        doğrudan processing/ içine bıraktığı sahipsiz işler de geri alınır.
+        
+        Returns:
+            Geri alınan iş sayısı
+        """
+        recovered = 0
+        with os.scandir(self.dirs['processing']) as entries:
+            owner_entries = list(entries)
+        for entry in owner_entries:
+            if not entry.is_dir():
+                os.replace(entry.path, self.unique_path(self.dirs['incoming'], entry.name))
+                recovered += 1
+                continue
+            host, _, pid = entry.name.rpartition('.')
+            if host != self.host or not pid.isdigit():
+                continue
+            # Bu sürecin pid'i önceki (ölmüş) bir sürece aitse dizin yine sahipsizdir
+            if int(pid) != os.getpid() and is_process_alive(int(pid)):
+                continue
+            for name in os.listdir(entry.path):
+                os.replace(os.path.join(entry.path, name), self.unique_path(self.dirs['incoming'], name))
+                recovered += 1
+            shutil.rmtree(entry.path, ignore_errors=True)
+        return recovered
+    
+    @staticmethod
+    def unique_path(directory: str, name: str) -> str:
+        """
+        directory içinde henüz kullanılmayan bir yol döndürür; ad alınmışsa
+        uzantıdan önce sıra numarası eklenir (kayit.mp3 -> kayit_1.mp3).
+        
+        Args:
+            directory: Hedef dizin
+            name: İstenen dosya adı
+        
+        Returns:
+            Var olmayan dosya yolu
+        """
+        path = os.path.join(directory, name)
+        stem, suffix = os.path.splitext(name)
+        counter = 0
+        while os.path.lexists(path) or os.path.lexists(path + ".error"):
+            counter += 1
+            path = os.path.join(directory, f"{stem}_{counter}{suffix}")
+        return path
+    
+    def finish_job(self, job_path: str, state: str) -> str:
+        """
+        İşi done/ veya failed/ dizinine taşır; aynı adlı kayıt varsa üzerine yazmaz.
+        
+        Args:
+            job_path: İşin processing/ içindeki yolu
+            state: 'done' veya 'failed'
+        
+        Returns:
+            İşin yeni yolu
+        """
+        while True:
+            target_path = self.unique_path(self.dirs[state], os.path.basename(job_path))
+            try:
+                # Bağlantı hedef varsa başarısız olur: başka bir daemon aynı adı aynı anda alamaz
+                os.link(job_path, target_path)
+            except FileExistsError:
+                continue
+            except OSError:
+                # Sabit bağlantı desteklenmiyorsa (ör. bazı ağ dosya sistemleri)
+                os.replace(job_path, target_path)
+                return target_path
+            os.unlink(job_path)
+            return target_path
+    
+    def pending_jobs(self) -> list:
+        """
+        Kuyruktaki işleri bırakılma sırasına göre döndürür.
+        
+        Returns:
+            incoming/ içindeki iş dosyası adları (en eski önce)
+        """
+        jobs = []
+        with os.scandir(self.dirs['incoming']) as entries:
+            for entry in entries:
+                suffix = Path(entry.name).suffix.lower()
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                if suffix == self.JOB_EXTENSION or suffix in SUPPORTED_INPUT_EXTENSIONS:
+                    jobs.append((entry.stat().st_mtime, entry.name))
+        return [name for _, name in sorted(jobs)]
+    
+    def claim(self, name: str) -> str:
+        """
+        İşi incoming/ dizininden bu daemon'un processing/ alt dizinine atomik olarak taşır.
+        
+        Args:
+            name: İş dosyasının adı
+        
+        Returns:
+            İşin processing/ içindeki yolu, iş başka bir süreç tarafından alındıysa None
+        """
+        os.makedirs(self.owner_dir, exist_ok=True)
+        job_path = os.path.join(self.owner_dir, name)
+        try:
+            os.rename(os.path.join(self.dirs['incoming'], name), job_path)
+        except FileNotFoundError:
+            return None
+        return job_path
+    
+    def run_job(self, job_path: str):
+        """
+        Tek bir işi transkript eder ve sonucuna göre done/ veya failed/ dizinine taşır.
+        Hatalar daemon'u durdurmaz; mesajı failed/<iş>.error dosyasına yazılır.
+        
+        Args:
+            job_path: İşin processing/ içindeki yolu
+        """
+        name = os.path.basename(job_path)
+        try:
+            source = job_path
+            if Path(name).suffix.lower() == self.JOB_EXTENSION:
+                with open(job_path, "r", encoding="utf-8") as f:
+                    source = next((line.strip() for line in f if line.strip()), None)
+                if not source:
+                    raise InputError(f"İş dosyası boş: {name}")
+                # Göreli yollar daemon'un çalışma dizinine değil kuyruk dizinine göredir
+                if not is_url(source):
+                    source = os.path.join(self.spool_dir, os.path.expanduser(source))
+            
+            # Daemon yeniden başlatılırsa yarım kalan iş tamamlanan parçalardan sürdürülür
+            result = self.transcriber.transcribe(source, resume=True)
+            output_name = get_default_output_name(Path(name if source == job_path else source), result.title)
+            save_transcript(result.text, self.unique_path(self.output_dir, output_name))
+            result.timings.report(name)
+            self.finish_job(job_path, 'done')
+            with self.lock:
+                self.completed += 1
+                self.audio_ms += result.duration_ms
+        except Exception as e:
+            print(f"HATA: {name} işlenemedi: {e}")
+            failed_path = self.finish_job(job_path, 'failed')
+            with open(failed_path + ".error", "w", encoding="utf-8") as f:
+                f.write(f"{type(e).__name__}: {e}\n")
+            with self.lock:
+                self.failed += 1
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+    
+    def status(self) -> dict:
+        """
+        Kuyruk ve verim sayaçlarını döndürür.
+        
+        Returns:
+            Kuyruk derinliği, işlenen/başarılı/başarısız iş sayıları ve dakika başına verim
+        """
+        uptime_sec = time.monotonic() - self.started
+        minutes = max(uptime_sec / 60, 1e-9)
+        queue_depth = len(self.pending_jobs())
+        with self.lock:
+            return {
+                'queue_depth': queue_depth,
+                'in_flight': self.in_flight,
+                'completed': self.completed,
+                'failed': self.failed,
+                'uptime_sec': round(uptime_sec, 1),
+                'jobs_per_minute': round(self.completed / minutes, 3),
+                'audio_minutes_per_minute': round(self.audio_ms / 60000 / minutes, 3),
+                'updated_at': time.time(),
+            }
+    
+    def write_status(self) -> dict:
+        """Sayaçları status.json dosyasına atomik olarak yazar ve döndürür."""
+        status = self.status()
+        temp_path = self.status_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(status, f)
+        os.replace(temp_path, self.status_path)
+        return status
+    
+    def report(self, status: dict = None):
+        """Kuyruk ve verim sayaçlarını yazdırır."""
+        status = status or self.status()
+        print(f"Daemon: kuyrukta {status['queue_depth']}, işleniyor {status['in_flight']}, "
+              f"{status['completed']} tamamlandı, {status['failed']} başarısız "
+              f"({status['jobs_per_minute']:.2f} iş/dakika, {status['audio_minutes_per_minute']:.1f} dakika ses/dakika)")
+    
+    def run(self):
+        """
+        Kuyruğu durdurulana kadar (Ctrl-C veya SIGTERM) işler. Durdurulunca yeni iş
+        alınmaz, süren işlerin bitmesi beklenir; ikinci kesmede kalan işler
+        processing/ dizininde kalır ve bir sonraki başlatmada sürdürülür.
+        """
+        recovered = self.recover()
+        if recovered:
+            print(f"Bilgi: Yarım kalan {recovered} iş kuyruğa geri alındı.")
+        print(f"Daemon modu: {self.dirs['incoming']} izleniyor (aynı anda en fazla {self.max_files} iş, "
+              f"{self.transcriber.limiter.max_concurrency} eşzamanlı istek), çıkış dizini: {self.output_dir}")
+        
+        last_report = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_files) as file_executor:
+            try:
+                while True:
+                    # Kuyruktan yalnızca boş yer kadar iş alınır; geri kalanı kuyruk derinliğinde görünür
+                    with self.lock:
+                        free_slots = self.max_files - self.in_flight
+                    for name in self.pending_jobs()[:max(0, free_slots)]:
+                        job_path = self.claim(name)
+                        if job_path is None:
+                            continue
+                        with self.lock:
+                            self.in_flight += 1
+                        file_executor.submit(self.run_job, job_path)
+                    
+                    status = self.write_status()
+                    if time.monotonic() - last_report >= self.report_interval:
+                        self.report(status)
+                        last_report = time.monotonic()
+                    time.sleep(self.poll_interval)
+            except (KeyboardInterrupt, SystemExit):
+                print(f"\nDaemon durduruluyor: yeni iş alınmıyor, süren {self.in_flight} işin bitmesi bekleniyor...")
+                raise
+            finally:
+                file_executor.shutdown(wait=True)
+                self.report(self.write_status())
+                # Yarım iş kalmadıysa sahiplik dizini kaldırılır (boş değilse rmdir başarısız olur)
+                try:
+                    os.rmdir(self.owner_dir)
+                except OSError:
+                    pass
+
+
+def run_startup_benchmark(repeats: int = STARTUP_BENCHMARK_REPEATS) -> dict:
+    """
+    Başlangıç süresini her ölçüm için yeni bir süreç başlatarak ölçer: boş
+    yorumlayıcı, main.py'nin içe aktarılması, --help ve her tembel bağımlılığın
+    (audioop workaround'u dahil) yüklenmesi. Gerilemeleri izlemek için sonuçlar
+    karşılaştırılabilir (medyan, saniye).
+    
+    Args:
+        repeats: Her ölçümün tekrar sayısı
+    
+    Returns:
+        Ölçüm adı -> medyan süre (saniye; kütüphane yüklü değilse None)
+    """
+    script_path = os.path.abspath(__file__)
+    script_dir = os.path.dirname(script_path)
+    cases = {
+        'python -c pass': [sys.executable, '-c', 'pass'],
+        'import main': [sys.executable, '-c', 'import main'],
+        'main.py --help': [sys.executable, script_path, '--help'],
+    }
+    for name in ('openai', 'pydub', 'yt_dlp', 'np', 'faster_whisper'):
+        cases[f'import main + {name}'] = [sys.executable, '-c', f'import main; main.{name}.load()']
+    
+    results = {}
+    print(f"Başlangıç süresi ölçülüyor ({repeats} tekrar, medyan):")
+    for label, command in cases.items():
+        samples = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            completed = subprocess.run(command, cwd=script_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            samples.append(time.perf_counter() - start_time)
+            if completed.returncode != 0:
+                break
+        if completed.returncode != 0:
+            results[label] = None
+            print(f"  {label:<24} yüklü değil")
+            continue
+        results[label] = sorted(samples)[len(samples) // 2]
+        print(f"  {label:<24} {results[label] * 1000:7.1f} ms")
+    return results
+
+
+# ============================================
+# DOSYA YOLU AYARLARI
+# ============================================
+# Dosya yolu veya URL komut satırından alınır; uygulama soru sormaz.
+# ============================================
 
 
 def main():
@@ -641,9 +5092,15 @@ def main():
 Örnekler:
   python main.py dosya.mp3
   python main.py dosya.opus --output transkript.txt
+  python main.py uzun_kayit.mp3 --live | tee canli.txt
   python main.py https://youtu.be/VIDEO_ID
   python main.py https://www.tiktok.com/@user/video/123456
   python main.py dosya.mp3 --api-key YOUR_API_KEY
+  python main.py --batch kayitlar/ --output-dir transkriptler/
+  python main.py --batch "kayitlar/*.mp3" --max-workers 16
+  python main.py --batch liste.txt
+  python main.py --batch kayitlar/ --backend local --local-model modeller/faster-whisper-small
+  python main.py --daemon /var/spool/botyum
         """
     )
     
@@ -675,18 +5132,95 @@ def main():
         help="Sadece konsola yazdır, dosyaya kaydetme"
     )
     
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Her parçanın metnini, önceki parçalar tamamlanır tamamlanmaz sırayla standart çıktıya (ve "
+             "kaydediliyorsa çıkış dosyasına) yaz; ilerleme mesajları standart hataya gider "
+             "(dosyayı diskten kesen --streaming'den farklıdır)"
+    )
+    
     parser.add_argument(
         "--chunk-length",
-        type=int,
+        type=float,
         default=5,
-        help="Büyük dosyalar için parça uzunluğu (dakika cinsinden, varsayılan: 5)"
+        help="Büyük dosyalar için parça uzunluğu (dakika cinsinden, kesirli olabilir, varsayılan: 5)"
+    )
+    
+    parser.add_argument(
+        "--chunk-plan",
+        type=str,
+        choices=['fixed', 'latency'],
+        default='fixed',
+        help="Parça planı: fixed (--chunk-length uzunluğunda parçalar) veya latency (parça sayısı eşzamanlı istek "
+             "sayısına ve ölçülen istek süresine göre toplam süreyi en aza indirecek şekilde seçilir; "
+             "--chunk-length yok sayılır)"
+    )
+    
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Diğer parçaların süre dağılımına göre geride kalan istek için aynı parçayı ikinci kez gönder ve "
+             f"önce biten yanıtı kullan (%%{int(HEDGE_PERCENTILE * 100)} yüzdelik sınırı)"
+    )
+    
+    parser.add_argument(
+        "--hedge-budget",
+        type=float,
+        default=HEDGE_DEFAULT_BUDGET,
+        metavar="ORAN",
+        help=f"--hedge ile yedek isteklerle en fazla yüklenebilecek ses oranı (varsayılan: {HEDGE_DEFAULT_BUDGET})"
+    )
+    
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=['openai', 'local'],
+        default='openai',
+        help="Transkript motoru: openai (Whisper API) veya local (faster-whisper ile CPU üzerinde, çevrimdışı; "
+             "--local-model gerekir). Varsayılan: openai"
+    )
+    
+    parser.add_argument(
+        "--local-model",
+        type=str,
+        default=None,
+        metavar="DIZIN",
+        help="Yerel motorun kullanacağı CTranslate2 biçimindeki Whisper model dizini (ör. faster-whisper-small)"
+    )
+    
+    parser.add_argument(
+        "--local-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help=f"Yerel motorun işlem sayısı (varsayılan: çekirdek sayısı / {LOCAL_THREADS_PER_WORKER})"
+    )
+    
+    parser.add_argument(
+        "--local-compute-type",
+        type=str,
+        default=LOCAL_DEFAULT_COMPUTE_TYPE,
+        metavar="TUR",
+        help=f"Yerel motorun CTranslate2 hesaplama türü: int8, int8_float32, float32 ... (varsayılan: {LOCAL_DEFAULT_COMPUTE_TYPE})"
+    )
+    
+    parser.add_argument(
+        "--overlap",
+        type=float,
+        default=0,
+        metavar="SANIYE",
+        help="Komşu parçaları bu kadar örtüşecek şekilde kes ve birleştirirken tekrar eden kelimeleri kelime "
+             "zamanlarına göre ayıkla (saniye, varsayılan: 0 = kapalı). Kısa parçalarla yüksek eşzamanlılık için"
     )
     
     parser.add_argument(
         "--max-workers",
         type=int,
         default=None,
-        help="Paralel işlem sayısı (varsayılan: 3, connection error'ları önlemek için)"
+        help=f"Eşzamanlı istek sayısının üst sınırı (varsayılan: {DEFAULT_MAX_CONCURRENCY}, toplu modda "
+             f"{DEFAULT_BATCH_MAX_WORKERS}). Eşzamanlılık {ADAPTIVE_INITIAL_CONCURRENCY}'ten başlar, "
+             "429 yanıtlarında yarıya iner ve başarılı yanıtlarla bu sınıra kadar artar"
     )
     
     parser.add_argument(
@@ -696,131 +5230,302 @@ def main():
         help="Maksimum parça boyutu (MB, varsayılan: 20MB, limit: 25MB)"
     )
     
+    parser.add_argument(
+        "--upload-profile",
+        type=str,
+        choices=sorted(UPLOAD_PROFILES),
+        default='wav',
+        help="Parçaların yükleme kodlaması: " + "; ".join(
+            f"{name}: {settings['description']}" for name, settings in UPLOAD_PROFILES.items()
+        ) + " (varsayılan: wav)"
+    )
+    
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Dosyayı belleğe yüklemeden ffmpeg ile parça parça kes (uzun kayıtlar için)"
+    )
+    
+    parser.add_argument(
+        "--snap-to-silence",
+        type=float,
+        default=0,
+        metavar="SANIYE",
+        help="Kesim noktalarını bu süre içindeki en yakın duraklamaya kaydır (saniye, varsayılan: 0 = kapalı)"
+    )
+    
+    parser.add_argument(
+        "--vad",
+        type=float,
+        default=0,
+        metavar="SANIYE",
+        help="Bu süreden uzun sessizlik/konuşma dışı bölümleri yüklemeden önce kısalt (saniye, varsayılan: 0 = kapalı)"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Transkript önbelleğini kullanma (her parça API'ye gönderilir)"
+    )
+    
+    parser.add_argument(
+        "--cache-max-size",
+        type=float,
+        default=DEFAULT_CACHE_MAX_MB,
+        help=f"Transkript önbelleğinin en büyük boyutu (MB, varsayılan: {DEFAULT_CACHE_MAX_MB})"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Aynı dosya ve ayarlarla yarıda kalmış işi kaldığı yerden sürdür (yalnızca eksik parçalar işlenir)"
+    )
+    
+    parser.add_argument(
+        "--batch",
+        type=str,
+        default=None,
+        metavar="KAYNAK",
+        help="Toplu mod: dizin, glob deseni veya her satırında bir dosya/URL olan liste dosyası. "
+             "Tüm dosyaların parçaları tek havuzda işlenir ve sonuçlar sorulmadan kaydedilir"
+    )
+    
+    parser.add_argument(
+        "--daemon",
+        type=str,
+        default=None,
+        metavar="KUYRUK_DIZINI",
+        help="Daemon modu: KUYRUK_DIZINI/incoming içine bırakılan ses dosyalarını ve .job dosyalarını (dosya yolu "
+             "veya URL) durdurulana kadar tek süreçte işle. Sayaçlar KUYRUK_DIZINI/status.json dosyasına yazılır"
+    )
+    
+    parser.add_argument(
+        "--benchmark-startup",
+        action="store_true",
+        help="Başlangıç süresini (içe aktarma, --help, bağımlılık yükleme) ayrı süreçlerde ölçüp yazdır; "
+             "--output verilirse sonuçlar JSON olarak kaydedilir"
+    )
+    
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default=None,
+        help="Toplu modda transkriptlerin yazılacağı dizin (varsayılan: mevcut dizin; daemon modunda KUYRUK_DIZINI/done)"
+    )
+    
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=['thread', 'async'],
+        default='thread',
+        help="İstek motoru: thread (iş parçacığı havuzu) veya async (tek bağlantı havuzlu asyncio istemcisi). "
+             "Toplu modda paylaşılan havuz kullanıldığından yok sayılır"
+    )
+    
+    parser.add_argument(
+        "--download-format",
+        type=str,
+        choices=sorted(DOWNLOAD_FORMATS),
+        default='native',
+        help="URL'lerden indirilen ses biçimi: native (platformun ses akışı, yeniden kodlanmaz) "
+             "veya mp3 (192 kbps MP3'e dönüştürülür, eski davranış). Varsayılan: native"
+    )
+    
+    parser.add_argument(
+        "--workspace-dir",
+        type=str,
+        default=None,
+        help="İşin geçici çalışma alanının (indirilen ses, parçalar) oluşturulacağı dizin; RAM diski için ör. /dev/shm "
+             "(varsayılan: BOTYUM_WORKSPACE_DIR veya sistem geçici dizini)"
+    )
+    
+    parser.add_argument(
+        "--workspace-max-size",
+        type=float,
+        default=0,
+        metavar="MB",
+        help="Diskte bekleyen kodlanmış parçaların toplam boyut sınırı (MB, toplu modda dosya başına). "
+             "Sınıra ulaşılınca parçalama, yüklenen parçalar silinene kadar bekler (varsayılan: 0 = sınırsız)"
+    )
+    
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Kodlanan parçaları diske yazmadan bellekte tutup yükle. Bellekteki toplam parça boyutu "
+             f"--workspace-max-size ile sınırlanır (verilmezse {IN_MEMORY_DEFAULT_MAX_MB} MB)"
+    )
+    
     args = parser.parse_args()
+    if args.benchmark_startup:
+        results = run_startup_benchmark()
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+        return
     
-    # Giriş dosyasını belirle: önce komut satırı, yoksa kullanıcıdan sor
-    input_file = args.input_file
-    if input_file is None:
-        print("Ses dosyasının yolunu veya video URL'sini girin:")
-        print("(Örnek: C:\\Videos\\dosya.mp3 veya https://youtu.be/VIDEO_ID)")
-        input_file = input().strip()
-        
-        # Kullanıcı boş girdi verirse hata ver
-        if not input_file:
-            print("HATA: Ses dosyası yolu veya URL boş olamaz.")
-            print("Kullanım: python main.py dosya.mp3")
-            print("          python main.py https://youtu.be/VIDEO_ID")
-            print("Veya komut çalıştırıldığında dosya yolunu/URL'yi girin.")
-            sys.exit(1)
-    
-    # URL mi yoksa dosya yolu mu kontrol et
-    is_url_input = is_url(input_file)
-    
-    # URL'den indirilen dosyayı takip etmek için
-    downloaded_audio_path = None
-    video_title = None
-    
-    if is_url_input:
-        # URL'den ses indir
-        platform = get_platform_name(input_file)
-        print(f"\n{platform} URL'si algılandı!")
-        downloaded_audio_path, video_title = download_audio_from_url(input_file)
-        input_path = Path(downloaded_audio_path)
+    if args.input_file is None and not args.batch and not args.daemon:
+        parser.error("Ses dosyası yolu veya video URL'si gerekli "
+                     "(ör. python main.py dosya.mp3 veya python main.py https://youtu.be/VIDEO_ID)")
+    if args.backend == 'local' and not args.local_model:
+        parser.error("--backend local için --local-model DIZIN gerekli")
+    # Sıfır veya negatif boyutlar sessizce düzeltilmez (ör. 0 dakikalık parça binlerce istek demektir)
+    for option, value in (("--chunk-length", args.chunk_length), ("--max-chunk-size", args.max_chunk_size),
+                          ("--max-workers", args.max_workers), ("--local-workers", args.local_workers)):
+        if value is not None and value <= 0:
+            parser.error(f"{option} sıfırdan büyük olmalı (verilen: {value})")
+    
+    # .env yalnızca gerçek bir iş çalıştırılacaksa okunur (--help ve ölçüm için değil)
+    load_environment()
+    
+    # SIGTERM (ör. servis durdurulurken) de finally bloklarından geçsin; çalışma alanları silinir
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    
+    if args.batch or args.daemon:
+        max_workers = args.max_workers or DEFAULT_BATCH_MAX_WORKERS
     else:
-        # Giriş dosyasını kontrol et
-        input_path = Path(input_file)
-        if not input_path.exists():
-            print(f"HATA: Dosya bulunamadı: {input_file}")
-            print(f"Lütfen dosya yolunun doğru olduğundan emin olun.")
-            sys.exit(1)
-        
-        # Dosya uzantısını kontrol et
-        if input_path.suffix.lower() not in ['.opus', '.mp3', '.wav', '.m4a', '.flac', '.ogg', '.mp4']:
-            print(f"UYARI: Desteklenen formatlar: .opus, .mp3, .wav, .m4a, .flac, .ogg, .mp4")
-            print(f"Yüklenen dosya: {input_path.suffix}")
-    
-    # Geçici WAV dosyası oluştur (gerekirse)
-    audio_path = str(input_path)
-    temp_wav = None
-    
-    if input_path.suffix.lower() in ['.opus', '.mp3', '.m4a', '.flac', '.ogg', '.mp4']:
-        print("Ses dosyası WAV formatına dönüştürülüyor...")
-        temp_wav = convert_audio_to_wav(audio_path)
-        audio_path = temp_wav
+        max_workers = args.max_workers or DEFAULT_MAX_CONCURRENCY
     
+    failed = 0
     try:
-        # Transkript işlemi
-        transcript = transcribe_audio(audio_path, args.api_key, args.chunk_length, args.max_workers, args.max_chunk_size)
-        
-        # Sonuçları göster
-        print("\n" + "="*50)
-        if video_title:
-            print(f"TRANSKRİPT: {video_title}")
-        else:
-            print("TRANSKRİPT:")
-        print("="*50)
-        print(transcript)
-        print("="*50 + "\n")
-        
-        # Dosyaya kaydetme işlemi
-        # Eğer --no-save parametresi kullanıldıysa kaydetme
-        if args.no_save:
-            print("Transkript kaydedilmedi (--no-save parametresi kullanıldı).")
+        # Motor Transcriber'dan önce oluşturulur; Transcriber kurulamazsa da işlem havuzu kapatılır
+        if args.backend == 'local':
+            # Eşzamanlılık çekirdek sayısına göre boyutlanan işlem havuzuyla sınırlıdır
+            backend_context = LocalWhisperBackend(args.local_model, workers=args.local_workers,
+                                                  compute_type=args.local_compute_type)
         else:
-            # Kullanıcıya kaydetmek isteyip istemediğini sor
-            print("Transkripti dosyaya kaydetmek istiyor musunuz? (E/H): ", end="")
-            kaydet_cevap = input().strip().upper()
-            
-            if kaydet_cevap in ['E', 'EVET', 'Y', 'YES']:
-                # Eğer --output parametresi verildiyse onu kullan
-                if args.output:
-                    output_path = args.output
+            backend_context = nullcontext()
+        with backend_context as backend:
+            with Transcriber(args.api_key, max_workers=max_workers, backend=backend, use_cache=not args.no_cache,
+                             cache_max_size_mb=args.cache_max_size, download_format=args.download_format,
+                             workspace_dir=args.workspace_dir, workspace_max_bytes=int(args.workspace_max_size * 1024 * 1024),
+                             chunk_length_minutes=args.chunk_length, max_chunk_size_mb=args.max_chunk_size,
+                             streaming=args.streaming, upload_profile=args.upload_profile,
+                             silence_tolerance_sec=args.snap_to_silence, vad_min_silence_sec=args.vad,
+                             resume=args.resume, in_memory=args.in_memory, overlap_sec=args.overlap,
+                             chunk_plan=args.chunk_plan, hedge=args.hedge, hedge_budget=args.hedge_budget) as transcriber:
+                # Toplu mod: tüm dosyalar için tek istek havuzu
+                if args.batch:
+                    items = collect_batch_inputs(args.batch)
+                    if not items:
+                        raise InputError(f"{args.batch} içinde işlenecek dosya bulunamadı.")
+                    _, _, failed = transcribe_batch(items, args.output_dir or str(Path.cwd()), transcriber)
+                    transcriber.report()
+                elif args.daemon:
+                    # İstemci, havuzlar ve önbellek tüm işler boyunca sıcak kalır
+                    SpoolDaemon(args.daemon, transcriber, args.output_dir).run()
+                elif args.live:
+                    stream_cli_input(args, transcriber)
                 else:
-                    # Kullanıcıdan dosya yolunu sor
-                    print("Dosya yolunu girin (örnek: C:\\Users\\botyum\\Desktop): ", end="")
-                    dosya_yolu = input().strip()
-                    
-                    # Boş girilirse varsayılan olarak mevcut dizine kaydet
-                    if not dosya_yolu:
-                        dosya_yolu = str(Path.cwd())
-                    
-                    # Dosya yolunu Path objesine çevir
-                    yol_path = Path(dosya_yolu)
-                    
-                    # Eğer yol bir klasör ise, dosya adını otomatik oluştur
-                    if yol_path.is_dir() or not yol_path.suffix:
-                        # Klasör yoluna dosya adını ekle
-                        if video_title:
-                            # Video başlığından güvenli dosya adı oluştur
-                            safe_title = re.sub(r'[<>:"/\\|?*]', '_', video_title)
-                            dosya_adi = safe_title + "_transkript.txt"
-                        else:
-                            dosya_adi = input_path.stem + "_transkript.txt"
-                        output_path = str(yol_path / dosya_adi)
-                    else:
-                        # Tam dosya yolu verilmiş
-                        output_path = dosya_yolu
-                
-                save_transcript(transcript, output_path)
-            else:
-                print("Transkript kaydedilmedi.")
+                    transcribe_cli_input(args, transcriber)
+    except TranscriptionError as e:
+        print(f"HATA: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(1)
     
-    finally:
-        # Geçici WAV dosyasını temizle
-        if temp_wav and os.path.exists(temp_wav):
-            try:
-                os.remove(temp_wav)
-                print(f"Geçici dosya temizlendi: {temp_wav}")
-            except:
-                pass
+    if failed:
+        sys.exit(1)
+
+
+def transcribe_cli_input(args: argparse.Namespace, transcriber: Transcriber):
+    """
+    Komut satırında verilen tek dosyayı/URL'yi transkript eder, konsola yazdırır
+    ve (--no-save verilmediyse) soru sormadan kaydeder.
+    
+    Args:
+        args: main() içinde ayrıştırılan komut satırı parametreleri
+        transcriber: İşi çalıştıracak Transcriber
+    """
+    input_file = args.input_file
+    if is_url(input_file):
+        print(f"\n{get_platform_name(input_file)} URL'si algılandı!")
+    elif Path(input_file).suffix.lower() not in SUPPORTED_INPUT_EXTENSIONS:
+        print("UYARI: Desteklenen formatlar: .opus, .mp3, .wav, .m4a, .flac, .ogg, .mp4")
+        print(f"Yüklenen dosya: {Path(input_file).suffix}")
+    
+    if not args.streaming:
+        print("Ses dosyası çözülüyor...")
+    result = transcriber.transcribe(input_file, engine=args.engine, timings=PipelineTimings(STARTUP_TIME))
+    result.timings.report()
+    transcriber.report()
+    
+    # Sonuçları göster
+    print("\n" + "="*50)
+    if result.title:
+        print(f"TRANSKRİPT: {result.title}")
+    else:
+        print("TRANSKRİPT:")
+    print("="*50)
+    print(result.text)
+    print("="*50 + "\n")
+    
+    if args.no_save:
+        print("Transkript kaydedilmedi (--no-save parametresi kullanıldı).")
+        return
+    
+    save_transcript(result.text, resolve_output_path(args.output, input_file, result.title))
+
+
+def stream_cli_input(args: argparse.Namespace, transcriber: Transcriber):
+    """
+    --live modu: her parçanın metnini, önceki parçalar tamamlandığı anda
+    standart çıktıya yazar. İlerleme ve özet mesajları standart hataya gider,
+    böylece çıktı doğrudan başka bir programa aktarılabilir.
+    
+    Yerel dosyalarda veya --output verildiğinde metin dosyaya da parça parça
+    eklenir; URL'lerde varsayılan ad video başlığına bağlı olduğundan dosya
+    iş bitince yazılır.
+    
+    Args:
+        args: main() içinde ayrıştırılan komut satırı parametreleri
+        transcriber: İşi çalıştıracak Transcriber
+    
+    Raises:
+        OutputError: Çıkış dosyası yazılamazsa
+    """
+    input_file = args.input_file
+    stdout = sys.stdout
+    output_path = None
+    if not args.no_save and (args.output is not None or not is_url(input_file)):
+        output_path = resolve_output_path(args.output, input_file)
+    
+    with redirect_stdout(sys.stderr):
+        try:
+            output_file = open(output_path, "w", encoding="utf-8") if output_path else nullcontext()
+        except OSError as e:
+            raise OutputError(f"Dosya açılırken hata oluştu: {e}") from e
         
-        # İndirilen ses dosyasını temizle
-        if downloaded_audio_path and os.path.exists(downloaded_audio_path):
-            try:
-                os.remove(downloaded_audio_path)
-                print(f"İndirilen ses dosyası temizlendi.")
-            except:
-                pass
+        with output_file:
+            chunks = transcriber.iter_chunks(input_file, engine=args.engine, timings=PipelineTimings(STARTUP_TIME))
+            written = False
+            while True:
+                try:
+                    _, text = next(chunks)
+                except StopIteration as stop:
+                    result = stop.value
+                    break
+                if not text:
+                    continue
+                # Parçalar finish_transcript() ile aynı ayraçla birleştirilir
+                piece = " " + text if written else text
+                written = True
+                stdout.write(piece)
+                stdout.flush()
+                if output_path:
+                    try:
+                        output_file.write(piece)
+                        output_file.flush()
+                    except OSError as e:
+                        raise OutputError(f"Dosya yazılırken hata oluştu: {e}") from e
+        stdout.write("\n")
+        stdout.flush()
+        
+        result.timings.report()
+        transcriber.report()
+        if output_path:
+            print(f"Transkript kaydedildi: {output_path}")
+        elif not args.no_save:
+            save_transcript(result.text, resolve_output_path(args.output, input_file, result.title))
 
 
 if __name__ == "__main__":
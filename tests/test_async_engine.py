@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import types
+
+import main
+
+
+def test_acquire_async_waits_without_polling_and_wakes_on_release():
+    limiter = main.AdaptiveRateLimiter(1, 1)
+    limiter.acquire()
+    checks = []
+    wait_time = limiter._wait_time
+    
+    def counting_wait_time():
+        checks.append(True)
+        return wait_time()
+    
+    limiter._wait_time = counting_wait_time
+    
+    async def scenario():
+        task = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0.3)
+        assert not task.done()
+        # Bekleyen görev yoklama yapmaz: slot yalnızca bir kez denendi
+        assert len(checks) == 1
+        threading.Thread(target=limiter.release).start()
+        await asyncio.wait_for(task, 5)
+    
+    asyncio.run(scenario())
+    assert limiter.in_flight == 1
+    assert limiter.async_waiters == set()
+
+
+class FakeAsyncClient:
+    instances = []
+    
+    def __init__(self, api_key, max_retries):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        FakeAsyncClient.instances.append(self)
+    
+    async def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    def __init__(self, api_key, max_retries):
+        pass
+    
+    def close(self):
+        pass
+
+
+def test_openai_backend_reuses_async_client_across_jobs(monkeypatch):
+    FakeAsyncClient.instances = []
+    monkeypatch.setattr(main, "openai", types.SimpleNamespace(OpenAI=FakeClient, AsyncOpenAI=FakeAsyncClient))
+    backend = main.OpenAIBackend(api_key="anahtar")
+    
+    async def job(client):
+        assert asyncio.get_running_loop() is client.loop
+        return client
+    
+    first = backend.run_async(job)
+    second = backend.run_async(job)
+    assert first is second
+    assert len(FakeAsyncClient.instances) == 1
+    
+    backend.close()
+    assert first.closed
+    assert not backend.async_thread.is_alive()
+    backend.close()
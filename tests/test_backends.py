@@ -0,0 +1,31 @@
+import pytest
+
+import main
+
+
+def test_backend_without_transcribe_chunk_fails_on_construction():
+    class Incomplete(main.TranscriptionBackend):
+        name = 'eksik'
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_minimal_backend_defaults():
+    class Echo(main.TranscriptionBackend):
+        name = 'echo'
+        
+        def transcribe_chunk(self, spec, total_chunks, cache=None, manifest=None, limiter=None,
+                             hedger=None, on_request_done=None, hold_chunk=None):
+            return (spec.index, "metin")
+    
+    with Echo() as backend:
+        assert backend.max_concurrency(7) == 7
+        assert backend.latency_key('wav') == "echo:wav"
+        assert not backend.supports_hedging and not backend.rate_limited
+        assert backend.transcribe_chunk(main.ChunkSpec(index=3, start_ms=0, end_ms=1000), 4) == (3, "metin")
+
+
+def test_local_backend_requires_model_dir(tmp_path):
+    with pytest.raises(main.ConfigurationError):
+        main.LocalWhisperBackend(str(tmp_path / "yok"))
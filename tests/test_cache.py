@@ -0,0 +1,85 @@
+import pytest
+
+import main
+
+
+class FakeAudio:
+    """Milisaniye başına bir byte PCM tutan, dilimlenebilen ses."""
+    
+    channels = 1
+    frame_rate = 16000
+    sample_width = 2
+    
+    def __init__(self, raw_data):
+        self.raw_data = raw_data
+    
+    def __getitem__(self, key):
+        return FakeAudio(self.raw_data[key])
+    
+    def __len__(self):
+        return len(self.raw_data)
+
+
+class FakePipeline:
+    profile = 'wav'
+    
+    def __init__(self, audio):
+        self.audio = audio
+        self.duration_ms = len(audio)
+    
+    def load(self):
+        return self.audio
+
+
+class EchoBackend(main.TranscriptionBackend):
+    name = 'echo'
+    model_name = 'echo'
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def transcribe_chunk(self, spec, total_chunks, cache=None, manifest=None, limiter=None,
+                         hedger=None, on_request_done=None, hold_chunk=None):
+        self.calls += 1
+        text = f"metin{spec.index}"
+        cache.put(main.TranscriptCache.make_key(spec.content_key, self.cache_params(spec)), text)
+        manifest.mark_done(spec.index, text)
+        return (spec.index, text)
+
+
+@pytest.fixture
+def exports(tmp_path, monkeypatch):
+    monkeypatch.setenv("BOTYUM_CACHE_DIR", str(tmp_path / "cache"))
+    exported = []
+    
+    def export_chunk(chunk, path, profile):
+        exported.append(path)
+        with open(path, "wb") as f:
+            f.write(chunk.raw_data)
+    
+    monkeypatch.setattr(main, "export_chunk", export_chunk)
+    return exported
+
+
+def test_cache_hit_skips_encoding(tmp_path, exports):
+    audio_path = tmp_path / "kayit.raw"
+    audio_path.write_bytes(b"kaynak")
+    audio = FakeAudio(bytes(i * 7 % 251 for i in range(9000)))
+    cache = main.TranscriptCache(path=str(tmp_path / "transkript.db"))
+    
+    def run():
+        backend = EchoBackend()
+        result = main.transcribe_audio(str(audio_path), pipeline=FakePipeline(audio), chunk_length_minutes=0.05,
+                                       cache=cache, backend=backend)
+        return result, backend
+    
+    first, backend = run()
+    assert len(exports) == 3
+    assert backend.calls == 3
+    
+    exports.clear()
+    second, backend = run()
+    assert exports == []
+    assert backend.calls == 0
+    assert second.text == first.text
+    cache.close()
@@ -0,0 +1,79 @@
+import os
+import socket
+import subprocess
+import sys
+import types
+
+import main
+
+
+class FakeTranscriber:
+    def __init__(self):
+        self.limiter = types.SimpleNamespace(max_concurrency=2)
+        self.sources = []
+    
+    def transcribe(self, source, **options):
+        self.sources.append(source)
+        return main.TranscriptResult(f"metin: {os.path.basename(source)}", 1, 1000, [],
+                                     timings=main.PipelineTimings())
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def make_daemon(tmp_path):
+    return main.SpoolDaemon(str(tmp_path / "spool"), FakeTranscriber())
+
+
+def add_owned_job(daemon, pid, name):
+    owner_dir = os.path.join(daemon.dirs['processing'], f"{socket.gethostname()}.{pid}")
+    os.makedirs(owner_dir, exist_ok=True)
+    with open(os.path.join(owner_dir, name), "w") as f:
+        f.write("x")
+    return owner_dir
+
+
+def test_recover_skips_jobs_of_live_daemons(tmp_path):
+    daemon = make_daemon(tmp_path)
+    live_dir = add_owned_job(daemon, os.getppid(), "canli.mp3")
+    dead_dir = add_owned_job(daemon, dead_pid(), "yarim.mp3")
+    
+    assert daemon.recover() == 1
+    assert os.listdir(daemon.dirs['incoming']) == ["yarim.mp3"]
+    assert os.listdir(live_dir) == ["canli.mp3"]
+    assert not os.path.exists(dead_dir)
+
+
+def test_claim_moves_job_into_owner_dir(tmp_path):
+    daemon = make_daemon(tmp_path)
+    open(os.path.join(daemon.dirs['incoming'], "kayit.mp3"), "w").close()
+    job_path = daemon.claim("kayit.mp3")
+    assert os.path.dirname(job_path) == daemon.owner_dir
+    assert daemon.claim("kayit.mp3") is None
+
+
+def test_job_file_relative_path_uses_spool_dir(tmp_path, monkeypatch):
+    daemon = make_daemon(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    with open(os.path.join(daemon.dirs['incoming'], "is.job"), "w") as f:
+        f.write("kayitlar/kayit.mp3\n")
+    daemon.in_flight = 1
+    daemon.run_job(daemon.claim("is.job"))
+    assert daemon.transcriber.sources == [os.path.join(daemon.spool_dir, "kayitlar", "kayit.mp3")]
+
+
+def test_finished_jobs_do_not_overwrite_same_name(tmp_path):
+    daemon = make_daemon(tmp_path)
+    for text in ("bir", "iki"):
+        with open(os.path.join(daemon.dirs['incoming'], "kayit.mp3"), "w") as f:
+            f.write(text)
+        daemon.in_flight = 1
+        daemon.run_job(daemon.claim("kayit.mp3"))
+    
+    done = sorted(os.listdir(daemon.dirs['done']))
+    assert done == ["kayit.mp3", "kayit_1.mp3", "kayit_transkript.txt", "kayit_transkript_1.txt"]
+    with open(os.path.join(daemon.dirs['done'], "kayit.mp3")) as f:
+        assert f.read() == "bir"
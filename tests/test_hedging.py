@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+import types
+
+import pytest
+
+import main
+
+
+class FakeClient:
+    """İlk isteği serbest bırakılana kadar bekleten, sonrakileri hemen yanıtlayan istemci."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.primary_release = threading.Event()
+        self.primary_done = threading.Event()
+        self.audio = types.SimpleNamespace(transcriptions=types.SimpleNamespace(
+            with_raw_response=types.SimpleNamespace(create=self.create)))
+    
+    def create(self, model, file, **options):
+        self.calls += 1
+        if self.calls == 1:
+            self.primary_release.wait(5)
+            self.primary_done.set()
+        return types.SimpleNamespace(headers={}, parse=lambda: types.SimpleNamespace(text="metin"))
+
+
+@pytest.fixture
+def hedger(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "HEDGE_MIN_DELAY_SEC", 0.05)
+    monkeypatch.setattr(main, "HEDGE_POLL_INTERVAL_SEC", 0.01)
+    limiter = main.AdaptiveRateLimiter(4, 4)
+    model = main.LatencyModel('wav', path=str(tmp_path / "latency_model.json"))
+    hedger = main.RequestHedger(model, limiter, 600, 1.0)
+    hedger.ratios = [0.001] * main.HEDGE_MIN_SAMPLES
+    return hedger
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_hedge_win_keeps_primary_slot_and_chunk_until_primary_finishes(tmp_path, hedger):
+    chunk_path = tmp_path / "chunk.wav"
+    chunk_path.write_bytes(b"ses")
+    released = []
+    
+    def done():
+        released.append(True)
+        os.remove(chunk_path)
+    
+    lease = main.ChunkLease(done)
+    client = FakeClient()
+    limiter = hedger.limiter
+    result = main.transcribe_chunk(str(chunk_path), 0, 1, "anahtar", client=client, limiter=limiter,
+                                   hedger=hedger, audio_seconds=60, hold_chunk=lease.hold)
+    lease.release()
+    
+    assert result == (0, "metin")
+    assert hedger.won == 1
+    # Geç kalan asıl istek sürüyor: slotu ve parça dosyası hâlâ onun
+    assert not client.primary_done.is_set()
+    assert limiter.in_flight == 1
+    assert chunk_path.exists()
+    assert released == []
+    
+    client.primary_release.set()
+    assert wait_for(lambda: released)
+    assert limiter.in_flight == 0
+    assert not chunk_path.exists()
+
+
+def test_no_hold_when_primary_wins(tmp_path, hedger):
+    client = FakeClient()
+    client.primary_release.set()
+    holds = []
+    result = main.transcribe_chunk(str(tmp_path / "yok.wav"), 0, 1, "anahtar", client=client,
+                                   limiter=hedger.limiter, hedger=hedger, audio_seconds=60, chunk_data=b"ses",
+                                   hold_chunk=lambda: holds.append(True) or (lambda: None))
+    assert result == (0, "metin")
+    assert holds == []
+    assert hedger.limiter.in_flight == 0
+
+
+def test_workspace_cleanup_waits_for_pinned_chunks():
+    workspace = main.Workspace()
+    workspace.pin()
+    workspace.cleanup()
+    assert os.path.isdir(workspace.path)
+    workspace.unpin()
+    assert not os.path.exists(workspace.path)
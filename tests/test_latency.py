@@ -0,0 +1,39 @@
+import json
+import os
+import threading
+
+import main
+
+
+def test_save_merges_and_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / "latency_model.json")
+    first = main.LatencyModel('wav', path=path)
+    second = main.LatencyModel('wav', path=path)
+    first.observe(60, 5.0)
+    second.observe(30, 3.0)
+    first.save()
+    second.save()
+    
+    with open(path) as f:
+        assert json.load(f)['wav'] == [[60, 5.0], [30, 3.0]]
+    assert os.listdir(tmp_path) == ["latency_model.json"]
+
+
+def test_concurrent_saves_keep_all_samples(tmp_path):
+    path = str(tmp_path / "latency_model.json")
+    models = [main.LatencyModel('wav', path=path) for _ in range(8)]
+    for i, model in enumerate(models):
+        model.observe(i, 1.0)
+    threads = [threading.Thread(target=model.save) for model in models]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(main.LatencyModel('wav', path=path).samples) == 8
+
+
+def test_save_without_samples_does_not_write(tmp_path):
+    path = str(tmp_path / "latency_model.json")
+    main.LatencyModel('wav', path=path).save()
+    assert not os.path.exists(path)
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("BOTYUM_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(main, "_SOURCE_DIGESTS", {})
+    return tmp_path / "cache"
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_identical_files_get_separate_job_dirs(tmp_path):
+    first = write(tmp_path / "a.mp3", b"same audio")
+    second = write(tmp_path / "b.mp3", b"same audio")
+    digest = main.hash_source_file(first)
+    assert digest == main.hash_source_file(second)
+    
+    settings = {'profile': 'wav'}
+    manifest_a = main.JobManifest(digest, settings, source_key=os.path.realpath(first))
+    manifest_b = main.JobManifest(digest, settings, source_key=os.path.realpath(second))
+    assert manifest_a.job_dir != manifest_b.job_dir
+    
+    manifest_a.start([main.ChunkSpec(index=0, start_ms=0, end_ms=1000)], first)
+    manifest_b.start([main.ChunkSpec(index=0, start_ms=0, end_ms=1000)], second)
+    manifest_a.mark_done(0, "metin")
+    assert os.path.exists(manifest_a.path)
+    assert main.JobManifest(digest, settings, source_key=os.path.realpath(first)).load()
+
+
+def test_source_digest_is_not_recomputed_for_unchanged_file(tmp_path, monkeypatch):
+    path = write(tmp_path / "a.mp3", b"audio")
+    expected = main.hash_file(path)
+    calls = []
+    real_hash_file = main.hash_file
+    monkeypatch.setattr(main, "hash_file", lambda p: calls.append(p) or real_hash_file(p))
+    
+    assert main.hash_source_file(path) == expected
+    assert main.hash_source_file(path) == expected
+    # Yeni süreç: yalnızca diskteki kayıt kalır
+    monkeypatch.setattr(main, "_SOURCE_DIGESTS", {})
+    assert main.hash_source_file(path) == expected
+    assert len(calls) == 1
+
+
+def test_source_digest_follows_file_changes(tmp_path):
+    path = write(tmp_path / "a.mp3", b"audio")
+    before = main.hash_source_file(path)
+    write(tmp_path / "a.mp3", b"other audio")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert main.hash_source_file(path) != before
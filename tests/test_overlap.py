@@ -0,0 +1,30 @@
+import main
+
+
+def test_match_exactly_at_join_is_removed():
+    assert main.strip_overlap_prefix("bir iki üç dört", "üç dört beş altı") == "beş altı"
+
+
+def test_previous_tail_words_are_not_dropped_from_next_chunk():
+    # "went home" önceki parçanın kuyruğudur; sonraki parçanın başı yalnızca "home"u tekrarlar
+    assert main.strip_overlap_prefix("and then we went home", "home and then") == "and then"
+
+
+def test_garbled_last_word_of_previous_chunk():
+    assert main.strip_overlap_prefix("we went to the stor", "to the store and more") == "store and more"
+
+
+def test_leading_extra_words_in_next_chunk():
+    assert main.strip_overlap_prefix("a b c d e", "uh d e f g") == "f g"
+
+
+def test_single_word_away_from_join_is_kept():
+    assert main.strip_overlap_prefix("bir iki ve üç dört", "beş ve altı") == "beş ve altı"
+
+
+def test_no_common_words():
+    assert main.strip_overlap_prefix("bir iki üç", "dört beş") == "dört beş"
+
+
+def test_punctuation_and_case_are_ignored():
+    assert main.strip_overlap_prefix("Sonra eve gittik.", "eve gittik, ve uyuduk") == "ve uyuduk"
@@ -0,0 +1,47 @@
+import pytest
+
+import main
+
+
+def plan(total_length_ms, max_size_mb, **kwargs):
+    return main.plan_audio_chunks(total_length_ms, 5, max_size_mb, 'wav', 1, 16000, **kwargs)
+
+
+def test_plan_covers_audio_without_gaps():
+    specs = plan(25 * 60 * 1000, 20.0)
+    assert specs[0].start_ms == 0
+    assert specs[-1].end_ms == 25 * 60 * 1000
+    assert all(a.end_ms == b.start_ms for a, b in zip(specs, specs[1:]))
+
+
+def test_tiny_max_size_below_tolerance_raises_instead_of_looping():
+    # 0.01 MB 16 kHz mono WAV'da ~300 ms sığar; 2 sn kaydırma payından küçük
+    with pytest.raises(main.ConfigurationError):
+        plan(60 * 1000, 0.01, boundary_tolerance_ms=2000)
+
+
+def test_zero_max_size_raises():
+    with pytest.raises(main.ConfigurationError):
+        plan(60 * 1000, 0)
+
+
+def test_small_max_size_respects_limit():
+    max_length_ms = main.get_max_chunk_length_ms('wav', 0.5, 1, 16000)
+    specs = plan(60 * 1000, 0.5, boundary_tolerance_ms=1000)
+    assert all(spec.duration_ms <= max_length_ms - 1000 for spec in specs)
+    assert specs[-1].end_ms == 60 * 1000
+
+
+@pytest.mark.parametrize("chunk_length_minutes", [0, -1])
+def test_non_positive_chunk_length_raises(chunk_length_minutes):
+    with pytest.raises(main.ConfigurationError):
+        main.plan_audio_chunks(10 * 1000, chunk_length_minutes, 20.0, 'wav', 1, 16000)
+
+
+@pytest.mark.parametrize("option", ["--chunk-length", "--max-chunk-size", "--max-workers"])
+def test_cli_rejects_non_positive_sizes(monkeypatch, capsys, option):
+    monkeypatch.setattr(main.sys, "argv", ["main.py", "dosya.mp3", option, "0"])
+    with pytest.raises(SystemExit) as exc_info:
+        main.main()
+    assert exc_info.value.code == 2
+    assert option in capsys.readouterr().err
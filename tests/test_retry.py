@@ -0,0 +1,74 @@
+import types
+
+import pytest
+
+import main
+
+
+class FakeAPIConnectionError(Exception):
+    pass
+
+
+class FakeAPITimeoutError(FakeAPIConnectionError):
+    pass
+
+
+class FakeAPIStatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = types.SimpleNamespace(headers={})
+
+
+@pytest.fixture(autouse=True)
+def fake_openai(monkeypatch):
+    monkeypatch.setattr(main, "openai", types.SimpleNamespace(
+        APIConnectionError=FakeAPIConnectionError,
+        APITimeoutError=FakeAPITimeoutError,
+        APIStatusError=FakeAPIStatusError))
+
+
+class RaisingClient:
+    """Her istekte verilen hatayı fırlatan istemci."""
+    
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+        self.audio = types.SimpleNamespace(transcriptions=types.SimpleNamespace(
+            with_raw_response=types.SimpleNamespace(create=self.create)))
+    
+    def create(self, model, file, **options):
+        self.calls += 1
+        raise self.error
+
+
+@pytest.mark.parametrize("error", [ValueError("hatalı değer"), OSError("ffmpeg bulunamadı")])
+def test_local_errors_fail_without_retry(tmp_path, monkeypatch, error):
+    sleeps = []
+    monkeypatch.setattr(main.time, "sleep", sleeps.append)
+    chunk_path = tmp_path / "chunk.wav"
+    chunk_path.write_bytes(b"ses")
+    client = RaisingClient(error)
+    
+    index, text = main.transcribe_chunk(str(chunk_path), 0, 1, "anahtar", client=client)
+    
+    assert index == 0
+    assert text.startswith("[Parça 1 işlenemedi")
+    assert client.calls == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize("error, expected", [
+    (FakeAPIConnectionError(), True),
+    (FakeAPITimeoutError(), True),
+    (FakeAPIStatusError(408), True),
+    (FakeAPIStatusError(409), True),
+    (FakeAPIStatusError(429), True),
+    (FakeAPIStatusError(503), True),
+    (FakeAPIStatusError(400), False),
+    (FakeAPIStatusError(401), False),
+    (FileNotFoundError(), False),
+    (TypeError(), False),
+])
+def test_is_retryable_error(error, expected):
+    assert main.is_retryable_error(error) is expected
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+import main
+
+
+def make_specs(count):
+    return [main.ChunkSpec(index=i, start_ms=i * 1000, end_ms=(i + 1) * 1000) for i in range(count)]
+
+
+def test_close_wakes_reserve_blocked_on_budget(tmp_path):
+    workspace = main.Workspace(str(tmp_path), max_bytes=100)
+    first, second = make_specs(2)
+    workspace.reserve_chunk(first, 80)
+    errors = []
+    
+    def reserve():
+        try:
+            workspace.reserve_chunk(second, 80)
+        except main.TranscriptionError as e:
+            errors.append(e)
+    
+    thread = threading.Thread(target=reserve)
+    thread.start()
+    thread.join(0.2)
+    assert thread.is_alive()
+    
+    workspace.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    workspace.cleanup()
+
+
+def test_consumer_error_stops_producer_blocked_on_budget(tmp_path):
+    workspace = main.Workspace(str(tmp_path), max_bytes=100)
+    blocked = threading.Event()
+    
+    def produce():
+        for spec in make_specs(5):
+            if workspace.used_bytes:
+                blocked.set()
+            workspace.reserve_chunk(spec, 80)
+            yield spec
+    
+    chunk_queue = main.ChunkQueue(produce(), 10, main.StageStats("parçalama"), workspace)
+    with pytest.raises(RuntimeError):
+        try:
+            for spec in chunk_queue:
+                # İlk parçanın yüklemesi bitmeden tüketici hata verir; bütçe dolu kalır
+                assert blocked.wait(5)
+                raise RuntimeError("yükleme hatası")
+        finally:
+            chunk_queue.close()
+    
+    assert not chunk_queue.thread.is_alive()
+    assert isinstance(chunk_queue.error, main.TranscriptionError)
+    workspace.cleanup(force=True)